@@ -0,0 +1,179 @@
+import math
+from array import array
+from collections import namedtuple
+
+from movie import Movie
+
+NAN = float("nan")
+
+GroupStats = namedtuple("GroupStats", "label count mean min max")
+
+
+# Column name -> Movie attribute (None becomes NaN)
+NUMERIC_COLUMNS = {
+    "rating": "rating",
+    "votes": "votes",
+    "runtime": "runtime",
+    "year": "year_start",
+    "metascore": "metascore",
+    "box_office": "box_office",
+}
+
+CATEGORY_COLUMNS = ("genre", "country", "director", "type")
+
+
+class Categories:
+    """Vícehodnotový kategoriální sloupec - slovník hodnot a kódy v plochých polích"""
+
+    def __init__(self):
+        self.labels = []
+        self._codes = {}
+        self.values = array("I")
+        self.offsets = array("I", [0])
+
+    def append(self, text):
+        for part in (text or "").split(","):
+            label = part.strip()
+            if not label:
+                continue
+            code = self._codes.get(label)
+            if code is None:
+                code = self._codes[label] = len(self.labels)
+                self.labels.append(label)
+            self.values.append(code)
+        self.offsets.append(len(self.values))
+
+    def code(self, label):
+        return self._codes.get(label)
+
+    def codes(self, row):
+        return self.values[self.offsets[row]:self.offsets[row + 1]]
+
+
+class MovieTable:
+    """Sloupcová tabulka filmů - čísla v array('d') (NaN = chybí), kategorie jako kódy"""
+
+    def __init__(self, records=()):
+        self.records = []
+        self._ids = {}
+        self.numeric = {name: array("d") for name in NUMERIC_COLUMNS}
+        self.categories = {name: Categories() for name in CATEGORY_COLUMNS}
+        self.extend(records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, movie):
+        return self._record_id(movie) in self._ids
+
+    @staticmethod
+    def _record_id(movie):
+        return movie.imdb_id or f"title:{movie.title}"
+
+    def append(self, movie):
+        """Přidá Movie (nebo odpověď OMDb); vrací False, pokud už v tabulce je (podle imdbID)"""
+        if not isinstance(movie, Movie):
+            movie = Movie.from_omdb(movie)
+        key = self._record_id(movie)
+        if key in self._ids:
+            return False
+        self._ids[key] = len(self.records)
+        self.records.append(movie)
+        for name, attribute in NUMERIC_COLUMNS.items():
+            value = getattr(movie, attribute)
+            self.numeric[name].append(NAN if value is None else value)
+        for name in CATEGORY_COLUMNS:
+            self.categories[name].append(getattr(movie, name))
+        return True
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def column(self, name):
+        return self.numeric[name]
+
+    def filter(self, rows=None, **conditions):
+        """Řádky splňující podmínky: číselný sloupec=(min, max), kategorie="hodnota"
+
+        Např. table.filter(rating=(7, None), genre="Drama"); NaN žádnou mez nesplní.
+        """
+        rows = range(len(self.records)) if rows is None else rows
+        for name, condition in conditions.items():
+            if name in self.numeric:
+                col = self.numeric[name]
+                low, high = condition
+                low = -math.inf if low is None else low
+                high = math.inf if high is None else high
+                rows = [r for r in rows if low <= col[r] <= high]
+            else:
+                categories = self.categories[name]
+                code = categories.code(condition)
+                if code is None:
+                    return []
+                values, offsets = categories.values, categories.offsets
+                rows = [r for r in rows if code in values[offsets[r]:offsets[r + 1]]]
+        return list(rows)
+
+    def sort(self, column, rows=None, descending=True):
+        """Indexy řádků seřazené podle sloupce; chybějící hodnoty vždy na konci"""
+        col = self.numeric[column]
+        rows = range(len(self.records)) if rows is None else rows
+        present = [r for r in rows if col[r] == col[r]]
+        missing = [r for r in rows if col[r] != col[r]]
+        present.sort(key=col.__getitem__, reverse=descending)
+        return present + missing
+
+    def rank(self, column, descending=True):
+        """Pořadí každého řádku (1 = nejlepší, shodné hodnoty sdílí pořadí, 0 = chybí)"""
+        col = self.numeric[column]
+        ranks = array("I", bytes(4 * len(col)))
+        previous = None
+        for position, row in enumerate(self.sort(column, descending=descending)):
+            value = col[row]
+            if value != value:
+                break
+            if value != previous:
+                rank = position + 1
+                previous = value
+            ranks[row] = rank
+        return ranks
+
+    def summary(self, column, rows=None):
+        col = self.numeric[column]
+        rows = range(len(self.records)) if rows is None else rows
+        values = [col[r] for r in rows if col[r] == col[r]]
+        if not values:
+            return GroupStats(column, 0, NAN, NAN, NAN)
+        return GroupStats(column, len(values), math.fsum(values) / len(values), min(values), max(values))
+
+    def group_stats(self, category, column="rating", rows=None, min_count=1):
+        """Statistiky sloupce po skupinách (žánr, režisér, ...) seřazené podle průměru"""
+        categories = self.categories[category]
+        col = self.numeric[column]
+        values, offsets = categories.values, categories.offsets
+        size = len(categories.labels)
+        counts = array("I", bytes(4 * size))
+        sums = array("d", bytes(8 * size))
+        lows = array("d", [math.inf]) * size
+        highs = array("d", [-math.inf]) * size
+        rows = range(len(self.records)) if rows is None else rows
+        for r in rows:
+            value = col[r]
+            if value != value:
+                continue
+            for i in range(offsets[r], offsets[r + 1]):
+                code = values[i]
+                counts[code] += 1
+                sums[code] += value
+                if value < lows[code]:
+                    lows[code] = value
+                if value > highs[code]:
+                    highs[code] = value
+        groups = [
+            GroupStats(label, counts[code], sums[code] / counts[code], lows[code], highs[code])
+            for code, label in enumerate(categories.labels)
+            if counts[code] >= min_count
+        ]
+        groups.sort(key=lambda g: (g.mean, g.count), reverse=True)
+        return groups
@@ -0,0 +1,216 @@
+"""Hromadné vyhledání titulů bez GUI.
+
+    python batch.py titles.txt -o out.jsonl --workers 8 --rate 5
+    cat catalog.csv | python batch.py - --column title -o out.csv --format csv
+
+Přerušený běh pokračuje od posledního checkpointu (<output>.checkpoint).
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core import (FIELDS, TITLE_INDEX_FILE, OMDB_URL, OMDB_QUOTA_FILE, OMDB_DAILY_QUOTA, normalize_text,
+                  fetch_movie, extract_fields, open_response_cache)
+from http_client import HttpClient
+from scheduler import BATCH, OmdbScheduler, QuotaExceeded
+from title_index import TitleIndex
+
+CHECKPOINT_EVERY = 100
+EXIT_QUOTA = 75  # EX_TEMPFAIL - zkusit znovu, až se kvóta obnoví
+EXIT_NO_INPUT = 66  # EX_NOINPUT
+
+
+class EmptyInput(Exception):
+    """Vstupní CSV je prázdné - nemá ani hlavičku"""
+
+
+def read_titles(source, column=None):
+    """Postupně čte názvy ze souboru nebo stdin (prostý text nebo CSV)
+
+    Hlavičku CSV čte hned, aby prázdný vstup skončil dřív, než se otevře výstup.
+    """
+    if column is not None or source.name.endswith(".csv"):
+        reader = csv.DictReader(source)
+        # No header row at all - fieldnames is None
+        if not reader.fieldnames:
+            raise EmptyInput("Žádný vstup - soubor je prázdný")
+        column = column or reader.fieldnames[0]
+        return ((row.get(column) or "").strip() for row in reader)
+    return (line.strip() for line in source)
+
+
+def lookup(title, http, cache, limiter, title_index=None):
+    row = {"query": title}
+    if not title:
+        row["error"] = "empty"
+        return row
+    try:
+        data = fetch_movie(normalize_text(title), http, cache, limiter)
+    except QuotaExceeded:
+        # Not a per-title failure - the run has to stop here
+        raise
+    except Exception as e:
+        row["error"] = str(e)
+        return row
+    if data.get("Response") == "False":
+        row["error"] = data.get("Error", "not found")
+        return row
+    row.update(extract_fields(data))
+    if title_index is not None:
+        title_index.add(data.get('imdbID'), data.get('Title'))
+    return row
+
+
+class Checkpoint:
+    """Počet hotových vstupních řádků a délka výstupu v tu chvíli; výstup je ve vstupním pořadí"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """(done, offset) - offset je None u starého checkpointu bez délky výstupu"""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return int(data["done"]), data.get("offset")
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return 0, None
+
+    def save(self, done, out):
+        """Výstup se nejdřív dostane na disk, pak se zapíše, kolik ho je"""
+        out.flush()
+        os.fsync(out.fileno())
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"done": done, "offset": out.tell()}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def rewind(output, offset):
+        """Zahodí řádky zapsané po checkpointu (tvrdé ukončení), aby se po navázání neopakovaly"""
+        if offset is None:
+            return
+        with open(output, "r+b") as f:
+            f.truncate(offset)
+
+    def clear(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class Writer:
+    def __init__(self, out, fmt, header):
+        self.out = out
+        self.fmt = fmt
+        if fmt == "csv":
+            self.csv = csv.DictWriter(out, fieldnames=("query", *FIELDS, "error"), extrasaction="ignore")
+            if header:
+                self.csv.writeheader()
+
+    def write(self, row):
+        if self.fmt == "csv":
+            self.csv.writerow(row)
+        else:
+            self.out.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def run(titles, writer, out, checkpoint, skip, workers, limiter, http, cache, title_index=None):
+    done = skip
+    started = time.monotonic()
+    window = deque()
+    last_checkpoint = done
+
+    def flush_head():
+        nonlocal done, last_checkpoint
+        writer.write(window.popleft().result())
+        done += 1
+        if done - last_checkpoint >= CHECKPOINT_EVERY:
+            checkpoint.save(done, out)
+            last_checkpoint = done
+            rate = (done - skip) / max(time.monotonic() - started, 1e-9)
+            print(f"{done} hotovo ({rate:.1f}/s)", file=sys.stderr)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for index, title in enumerate(titles):
+            if index < skip:
+                continue
+            window.append(executor.submit(lookup, title, http, cache, limiter, title_index))
+            while len(window) >= workers * 4 or (window and window[0].done()):
+                flush_head()
+        while window:
+            flush_head()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        checkpoint.save(done, out)
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hromadné vyhledání filmů/seriálů přes OMDb")
+    parser.add_argument("input", nargs="?", default="-", help="soubor s názvy (txt/csv) nebo - pro stdin")
+    parser.add_argument("-o", "--output", required=True, help="výstupní soubor (.jsonl nebo .csv)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="formát výstupu (výchozí podle přípony)")
+    parser.add_argument("--column", help="sloupec s názvem ve vstupním CSV")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=5.0, help="max. požadavků na OMDb za sekundu")
+    parser.add_argument("--burst", type=float, default=None)
+    parser.add_argument("--no-cache", action="store_true", help="nepoužívat cache odpovědí")
+    parser.add_argument("--no-index", action="store_true", help="nepřidávat názvy do lokálního indexu")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    fmt = args.format or ("csv" if output.suffix == ".csv" else "jsonl")
+    checkpoint = Checkpoint(output.with_name(output.name + ".checkpoint"))
+    skip, offset = checkpoint.load() if output.exists() else (0, None)
+    if skip:
+        Checkpoint.rewind(output, offset)
+        print(f"Pokračuji od řádku {skip}", file=sys.stderr)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    try:
+        titles = read_titles(source, args.column)
+    except EmptyInput as e:
+        if source is not sys.stdin:
+            source.close()
+        print(e, file=sys.stderr)
+        return EXIT_NO_INPUT
+
+    http = HttpClient(pool_maxsize=args.workers, no_retry=(OMDB_URL,))
+    cache = None if args.no_cache else open_response_cache()
+    # Shares the daily quota file with the GUI and leaves the reserve to interactive searches
+    scheduler = OmdbScheduler(OMDB_QUOTA_FILE, OMDB_DAILY_QUOTA, args.rate, args.burst)
+    limiter = scheduler.lane(BATCH)
+    title_index = None if args.no_index else TitleIndex(TITLE_INDEX_FILE).load()
+    try:
+        with open(output, "a" if skip else "w", encoding="utf-8", newline="") as out:
+            writer = Writer(out, fmt, header=not skip)
+            done = run(titles, writer, out, checkpoint, skip,
+                       args.workers, limiter, http, cache, title_index)
+    except KeyboardInterrupt:
+        print("Přerušeno - další běh naváže od checkpointu", file=sys.stderr)
+        return 130
+    except QuotaExceeded as e:
+        print(f"{e} - další běh naváže od checkpointu", file=sys.stderr)
+        return EXIT_QUOTA
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        http.close()
+        scheduler.close()
+        if cache is not None:
+            cache.close()
+
+    checkpoint.clear()
+    print(f"Hotovo: {done} řádků -> {output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
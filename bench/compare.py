@@ -0,0 +1,56 @@
+"""Porovná dva JSON reporty z bench.run.
+
+    python -m bench.compare old.json new.json [--threshold 10]
+
+Vypíše změnu každé metriky v procentech; návratový kód 1, pokud se něco
+zhoršilo víc než o --threshold procent.
+"""
+import argparse
+import json
+import sys
+
+# Higher is better for these; every *_ms / *_s / *_mb metric is lower-is-better
+HIGHER_IS_BETTER = {"titles_per_s"}
+METRICS = ("p50_ms", "p95_ms", "mean_ms", "elapsed_s", "titles_per_s", "dicts_mb", "movie_mb", "table_mb")
+
+
+def compare(old, new, threshold):
+    regressions = []
+    rows = []
+    for name, result in new["scenarios"].items():
+        before = old["scenarios"].get(name)
+        if before is None or "skipped" in result or "skipped" in before:
+            continue
+        for metric in METRICS:
+            a, b = before.get(metric), result.get(metric)
+            if not a or b is None:
+                continue
+            change = (b - a) / a * 100
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            rows.append((name, metric, a, b, change))
+            if worse > threshold:
+                regressions.append((name, metric))
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Porovnání dvou benchmark reportů")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=10.0, help="povolené zhoršení v %%")
+    args = parser.parse_args(argv)
+
+    with open(args.old, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    rows, regressions = compare(old, new, args.threshold)
+    print(f"{old.get('revision')} -> {new.get('revision')}")
+    for name, metric, a, b, change in rows:
+        flag = "  !" if (name, metric) in regressions else ""
+        print(f"{name:<16} {metric:<13} {a:>10.2f} -> {b:>10.2f}  {change:+6.1f} %{flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""Lokální náhrada OMDb a serveru s plakáty - pro benchmarky a práci offline.
+
+    python -m bench.fake_omdb --port 8765 --latency 80 --jitter 30 --failure-rate 0.02
+    OMDB_URL=http://127.0.0.1:8765/ python main.py
+    MOVIEVIEWER_RATINGS_URL="http://127.0.0.1:8765/ratings?i={imdb_id}" python main.py
+
+Odpovědi jsou deterministické (podle názvu / imdbID), takže běhy jdou porovnávat.
+"""
+import argparse
+import hashlib
+import json
+import random
+import socket
+import threading
+import time
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+GENRES = ("Drama", "Action, Adventure, Sci-Fi", "Comedy, Romance", "Crime, Drama, Thriller", "Horror", "Animation, Family")
+COUNTRIES = ("United States", "United Kingdom", "France", "Czech Republic", "United States, Canada")
+RATED = ("PG", "PG-13", "R", "N/A")
+
+
+def _seed(text):
+    return zlib.crc32(text.casefold().encode("utf-8"))
+
+
+def _poster_bytes(seed):
+    """Malý JPEG 300x444; bez Pillow jen pár bajtů, které klient stejně stáhne"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return b"\xff\xd8\xff\xd9"
+    color = (seed % 200 + 30, seed // 7 % 200 + 30, seed // 13 % 200 + 30)
+    buf = BytesIO()
+    Image.new("RGB", (300, 444), color).save(buf, "JPEG", quality=85)
+    return buf.getvalue()
+
+
+class FakeOmdb:
+    """HTTP server s odpověďmi ve tvaru OMDb, umělou latencí, jitterem a chybami"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0, failure_rate=0.0, seed=1):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.counters = {"requests": 0, "failures": 0, "posters": 0, "not_modified": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._titles = {}
+        self._posters = [_poster_bytes(i * 7919) for i in range(8)]
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-omdb", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _delay(self):
+        """Latence s jitterem; vrací True, pokud má požadavek selhat"""
+        with self._lock:
+            self.counters["requests"] += 1
+            delay = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            failed = self._random.random() < self.failure_rate
+            if failed:
+                self.counters["failures"] += 1
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return failed
+
+    def movie(self, imdb_id, title=None):
+        seed = _seed(imdb_id)
+        with self._lock:
+            title = self._titles.setdefault(imdb_id, title or f"Movie {imdb_id[2:]}")
+        series = seed % 7 == 0
+        data = {
+            "Title": title,
+            "Year": f"{1950 + seed % 75}" + ("–" if series else ""),
+            "Rated": RATED[seed % len(RATED)],
+            "Released": "16 Jul 2010",
+            "Runtime": f"{40 + seed % 120} min",
+            "Genre": GENRES[seed % len(GENRES)],
+            "Director": f"Director {seed % 500}",
+            "Writer": f"Writer {seed % 900}",
+            "Actors": f"Actor {seed % 300}, Actor {seed % 301}, Actor {seed % 302}",
+            "Plot": "A deterministic plot generated by the benchmark server. " * 3,
+            "Language": "English",
+            "Country": COUNTRIES[seed % len(COUNTRIES)],
+            "Awards": f"{seed % 20} wins",
+            "Poster": f"{self.url}posters/{imdb_id}.jpg",
+            "Ratings": [{"Source": "Internet Movie Database", "Value": f"{1 + seed % 90 / 10:.1f}/10"}],
+            "Metascore": str(seed % 100) if seed % 5 else "N/A",
+            "imdbRating": f"{1 + seed % 90 / 10:.1f}" if seed % 11 else "N/A",
+            "imdbVotes": f"{seed % 2000000:,}",
+            "imdbID": imdb_id,
+            "Type": "series" if series else "movie",
+            "BoxOffice": f"${seed % 900000000:,}" if not series else "N/A",
+            "Response": "True",
+        }
+        if series:
+            data["totalSeasons"] = str(1 + seed % 12)
+        return data
+
+    def season(self, imdb_id, season):
+        seed = _seed(f"{imdb_id}:{season}")
+        episodes = [
+            {
+                "Title": f"Episode {n}",
+                "Released": "2010-01-01",
+                "Episode": str(n),
+                "imdbRating": f"{5 + (seed + n) % 50 / 10:.1f}",
+                "imdbID": f"tt{(seed + n) % 10 ** 7:07d}",
+            }
+            for n in range(1, 8 + seed % 6)
+        ]
+        return {"Title": self._titles.get(imdb_id, imdb_id), "Season": str(season), "Episodes": episodes, "Response": "True"}
+
+    def ratings(self, imdb_id):
+        """Další zdroj hodnocení pro MOVIEVIEWER_RATINGS_URL=<url>ratings?i={imdb_id}"""
+        seed = _seed(f"ratings:{imdb_id}")
+        return {"Ratings": [
+            {"Source": "Letterboxd", "Value": f"{1 + seed % 40 / 10:.1f}/5", "Votes": str(seed % 50000)},
+            {"Source": "Trakt", "Value": f"{40 + seed % 60}%"},
+        ]}
+
+    def respond(self, query):
+        if "t" in query:
+            title = query["t"]
+            if "notfound" in title.casefold():
+                return {"Response": "False", "Error": "Movie not found!"}
+            return self.movie(f"tt{_seed(title) % 10 ** 7:07d}", title.title())
+        if "i" in query and "Season" in query:
+            return self.season(query["i"], query["Season"])
+        if "i" in query:
+            return self.movie(query["i"])
+        if "s" in query:
+            prefix = query["s"].title()
+            results = [
+                {"Title": f"{prefix} {n}", "Year": "2001", "imdbID": f"tt{_seed(f'{prefix} {n}') % 10 ** 7:07d}",
+                 "Type": "movie", "Poster": "N/A"}
+                for n in range(1, 11)
+            ]
+            return {"Search": results, "totalResults": "37", "Response": "True"}
+        return {"Response": "False", "Error": "Incorrect IMDb ID."}
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Buffered, so headers and body leave in one write (no Nagle/delayed-ACK stall)
+            wbufsize = 64 * 1024
+
+            def setup(self):
+                super().setup()
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                failed = fake._delay()
+                if failed:
+                    self._send(503, b"", "text/plain")
+                    return
+                parts = urllib.parse.urlsplit(self.path)
+                if parts.path.startswith("/posters/"):
+                    self._poster(parts.path)
+                    return
+                query = {k: v[0] for k, v in urllib.parse.parse_qs(parts.query).items()}
+                data = fake.ratings(query.get("i", "")) if parts.path == "/ratings" else fake.respond(query)
+                body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                self._send(200, body, "application/json; charset=utf-8")
+
+            def _poster(self, path):
+                data = fake._posters[_seed(path) % len(fake._posters)]
+                etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+                headers = {"ETag": etag, "Cache-Control": "max-age=86400"}
+                if self.headers.get("If-None-Match") == etag:
+                    with fake._lock:
+                        fake.counters["not_modified"] += 1
+                    self._send(304, b"", None, headers)
+                    return
+                with fake._lock:
+                    fake.counters["posters"] += 1
+                self._send(200, data, "image/jpeg", headers)
+
+            def _send(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                if content_type:
+                    self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                self.wfile.flush()
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Falešný OMDb server pro benchmarky")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0, help="průměrná latence v ms")
+    parser.add_argument("--jitter", type=float, default=0, help="± rozptyl latence v ms")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="podíl odpovědí 503 (0-1)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    server = FakeOmdb(args.host, args.port, args.latency, args.jitter, args.failure_rate, args.seed)
+    print(f"OMDB_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""Benchmarky proti lokálnímu falešnému OMDb - výsledek jako JSON report.
+
+    python -m bench.run -o bench-report.json
+    python -m bench.run --scenario cold_search --scenario warm_search --latency 120 --jitter 40
+    python -m bench.compare old.json new.json
+
+Scénáře s GUI se bez displeje přeskočí (v reportu mají "skipped").
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import core
+from perf import percentile
+from bench.fake_omdb import FakeOmdb
+
+SCENARIOS = {}
+
+
+def scenario(name, gui=False):
+    def register(fn):
+        SCENARIOS[name] = (fn, gui)
+        return fn
+    return register
+
+
+def summarize(samples):
+    """Souhrn časů v ms"""
+    return {
+        "n": len(samples),
+        "mean_ms": round(sum(samples) / len(samples), 3) if samples else None,
+        "p50_ms": round(percentile(samples, 50), 3) if samples else None,
+        "p95_ms": round(percentile(samples, 95), 3) if samples else None,
+        "max_ms": round(max(samples), 3) if samples else None,
+    }
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - started) * 1000, result
+
+
+class Env:
+    """Sdílený stav scénářů - dočasné cache, index, plánovač OMDb, HTTP klient a seznam titulů"""
+
+    def __init__(self, directory, titles, server=None):
+        from catalog import OfflineFallback
+        from http_client import HttpClient
+        from poster_cache import PosterCache
+        from response_cache import ResponseCache
+        from scheduler import OmdbScheduler
+        from title_index import TitleIndex
+
+        self.directory = Path(directory)
+        self.titles = titles
+        self.server = server
+        self.http = HttpClient(pool_maxsize=16, no_retry=(core.OMDB_URL,))
+        self.cache = ResponseCache(self.directory / "omdb_cache.sqlite3")
+        self.posters = PosterCache(self.directory / "posters")
+        self.title_index = TitleIndex(self.directory / "title_index.jsonl").load()
+        # Same queueing and coalescing as the GUI; quota and rate high enough never to throttle
+        self.scheduler = OmdbScheduler(self.directory / "omdb_quota.sqlite3", daily_limit=10 ** 9, rate=10 ** 6)
+        self.offline = OfflineFallback()
+        self.movies = []
+
+    def close(self):
+        self.http.close()
+        self.cache.close()
+        self.scheduler.close()
+
+    def search(self, title):
+        """Stejná cesta jako vyhledání v GUI: index/cache/OMDb přes plánovač, Movie a plakát"""
+        from movie import Movie
+        from scheduler import USER
+
+        data = core.find_movie(core.normalize_text(title), self.http, self.cache, self.scheduler.lane(USER),
+                               offline=self.offline, title_index=self.title_index)
+        if data.get("Response") == "False":
+            return None
+        movie = Movie.from_omdb(data)
+        self.title_index.add(movie.imdb_id, movie.title)
+        if movie.poster:
+            self.posters.load(movie.poster, core.POSTER_SIZE, self.download)
+        return movie
+
+    def open_by_id(self, imdb_id):
+        from movie import Movie
+        from scheduler import USER
+
+        movie = Movie.from_omdb(core.fetch_movie_by_id(imdb_id, self.http, self.cache, self.scheduler.lane(USER),
+                                                       offline=self.offline))
+        if movie.poster:
+            self.posters.load(movie.poster, core.POSTER_SIZE, self.download)
+        return movie
+
+    def download(self, url, meta=None):
+        return self.http.conditional_get(url, meta, timeout=8)
+
+
+@scenario("cold_search")
+def cold_search(env, args):
+    samples = []
+    for title in env.titles:
+        ms, movie = timed(env.search, title)
+        samples.append(ms)
+        if movie is not None:
+            env.movies.append(movie)
+    return summarize(samples)
+
+
+@scenario("warm_search")
+def warm_search(env, args):
+    for title in env.titles:
+        env.search(title)
+    samples = [timed(env.search, title)[0] for title in env.titles]
+    return summarize(samples)
+
+
+@scenario("history_click")
+def history_click(env, args):
+    from history_store import HistoryStore
+
+    store = HistoryStore(env.directory / "history.sqlite3")
+    try:
+        for title in env.titles:
+            movie = env.search(title)
+            if movie is not None:
+                store.add(movie.imdb_id, movie.title, title, 0.0)
+        samples = []
+        for _ in range(3):
+            for entry in store.recent(len(env.titles)):
+                samples.append(timed(env.open_by_id, entry.imdb_id)[0])
+    finally:
+        store.close()
+    return summarize(samples)
+
+
+def _tk_root():
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.withdraw()
+    return root
+
+
+def _movies(env, count):
+    if not env.movies:
+        cold_search(env, None)
+    movies = env.movies * (count // max(len(env.movies), 1) + 1)
+    return movies[:count]
+
+
+@scenario("comparison_open", gui=True)
+def comparison_open(env, args):
+    from analytics import MovieTable
+    from theme import ThemeRegistry
+    from views import ComparisonView
+
+    table = MovieTable()
+    for i, movie in enumerate(_movies(env, 500)):
+        table.append(movie.to_omdb() | {"imdbID": f"{movie.imdb_id}-{i}"})
+    root = _tk_root()
+    theme = ThemeRegistry("dark")
+    samples = []
+    try:
+        for _ in range(10):
+            started = time.perf_counter()
+            view = ComparisonView(root, theme, lambda url: None)
+            view.show(table)
+            root.update()
+            samples.append((time.perf_counter() - started) * 1000)
+            view.window.destroy()
+    finally:
+        root.destroy()
+    return summarize(samples)
+
+
+@scenario("theme_toggle", gui=True)
+def theme_toggle(env, args):
+    import tkinter as tk
+
+    from analytics import MovieTable
+    from theme import ThemeRegistry
+    from views import ComparisonView, HistoryList
+
+    root = _tk_root()
+    theme = ThemeRegistry("dark")
+    samples = []
+    try:
+        frame = theme.register(tk.Frame(root), bg="BG_SECONDARY")
+        HistoryList(frame, theme, lambda entry: None)
+        view = ComparisonView(root, theme, lambda url: None)
+        view.show(MovieTable(_movies(env, 50)))
+        root.update()
+        for i in range(20):
+            started = time.perf_counter()
+            theme.apply("light" if i % 2 == 0 else "dark")
+            root.update_idletasks()
+            samples.append((time.perf_counter() - started) * 1000)
+    finally:
+        root.destroy()
+    return summarize(samples)
+
+
+@scenario("batch_10k")
+def batch_10k(env, args):
+    import batch
+    from ratelimit import TokenBucket
+    from response_cache import ResponseCache
+
+    titles = [f"Batch Title {i}" for i in range(args.batch_size)]
+    output = env.directory / "batch.jsonl"
+    cache = ResponseCache(env.directory / "batch_cache.sqlite3", max_entries=args.batch_size * 3)
+    limiter = TokenBucket(args.batch_rate, args.batch_rate)
+    try:
+        with open(output, "w", encoding="utf-8", newline="") as out, contextlib.redirect_stderr(io.StringIO()):
+            started = time.perf_counter()
+            done = batch.run(iter(titles), batch.Writer(out, "jsonl", header=True), out,
+                             batch.Checkpoint(env.directory / "batch.checkpoint"), 0,
+                             args.batch_workers, limiter, env.http, cache)
+            elapsed = time.perf_counter() - started
+    finally:
+        cache.close()
+    with open(output, encoding="utf-8") as f:
+        errors = sum(1 for line in f if '"error"' in line)
+    return {"n": done, "errors": errors, "elapsed_s": round(elapsed, 3), "titles_per_s": round(done / elapsed, 1)}
+
+
+def _traced_mb(build):
+    """Kolik MB zůstane alokováno po build() - jen živá data, dočasné objekty se nepočítají"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del kept
+    return used / 1024 / 1024
+
+
+@scenario("movie_memory")
+def movie_memory(env, args):
+    from analytics import MovieTable
+    from movie import Movie
+
+    count = args.memory_records
+    # Distinct payloads prepared up front; every record is decoded anew, like an OMDb response
+    payloads = [json.dumps(env.server.movie(f"tt{9000000 + i:07d}", f"Memory Movie {i}"), ensure_ascii=False)
+                for i in range(1000)]
+
+    def responses():
+        for i in range(count):
+            data = json.loads(payloads[i % len(payloads)])
+            data["imdbID"] = f"tt{i:07d}"
+            yield data
+
+    started = time.perf_counter()
+    sizes = {
+        "dicts": _traced_mb(lambda: list(responses())),
+        "movie": _traced_mb(lambda: [Movie.from_omdb(data) for data in responses()]),
+        "table": _traced_mb(lambda: MovieTable(responses())),
+    }
+    result = {"n": count, "elapsed_s": round(time.perf_counter() - started, 3)}
+    for name, mb in sizes.items():
+        result[f"{name}_mb"] = round(mb, 1)
+        result[f"{name}_kb_per_record"] = round(mb * 1024 / count, 2)
+    return result
+
+
+def has_display():
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=core.APP_DIR, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarky MovieExploreru proti falešnému OMDb")
+    parser.add_argument("-o", "--output", help="kam uložit JSON report (výchozí stdout)")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="jen vybrané scénáře")
+    parser.add_argument("--titles", type=int, default=200, help="počet titulů pro hledání")
+    parser.add_argument("--latency", type=float, default=50, help="latence serveru v ms")
+    parser.add_argument("--jitter", type=float, default=20, help="± rozptyl latence v ms")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="podíl odpovědí 503")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--batch-workers", type=int, default=16)
+    parser.add_argument("--batch-rate", type=float, default=1000, help="limit požadavků/s pro batch")
+    parser.add_argument("--memory-records", type=int, default=100000, help="počet záznamů pro movie_memory")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    display = has_display()
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "server": {"latency_ms": args.latency, "jitter_ms": args.jitter, "failure_rate": args.failure_rate, "seed": args.seed},
+        "scenarios": {},
+    }
+
+    with FakeOmdb(latency_ms=args.latency, jitter_ms=args.jitter, failure_rate=args.failure_rate, seed=args.seed) as server, \
+            tempfile.TemporaryDirectory(prefix="movieviewer-bench-") as directory:
+        core.OMDB_URL = server.url
+        env = Env(directory, [f"Bench Movie {i}" for i in range(args.titles)], server)
+        try:
+            for name in names:
+                fn, gui = SCENARIOS[name]
+                if gui and not display:
+                    report["scenarios"][name] = {"skipped": "no display"}
+                    continue
+                print(f"{name}...", file=sys.stderr)
+                before = dict(server.counters)
+                result = fn(env, args)
+                result["server_requests"] = server.counters["requests"] - before["requests"]
+                report["scenarios"][name] = result
+        finally:
+            env.close()
+        report["http"] = env.http.stats()
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""Offline katalog - snímek záznamů OMDb v jednom souboru otevíraném přes mmap.
+
+    python catalog.py build -o catalog.snapshot --from-cache
+    python catalog.py build -o catalog.snapshot --jsonl omdb_dump.jsonl
+    python catalog.py lookup "Inception"
+
+Soubor: hlavička, záznamy (JSON za sebou) a seřazený index (hash klíče, offset,
+délka). Klíče jsou stejné jako v cache odpovědí ("i:<imdbID>", "t:<název>"),
+hledá se binárním půlením přímo v mmap - otevření nic nenačítá.
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+
+from core import CATALOG_FILE, OfflineError, normalize_text, open_response_cache
+from response_cache import id_key, query_key
+
+MAGIC = b"MVCATLG1"
+HEADER = struct.Struct("<8sQQQ")  # magic, record count, index offset, index entries
+ENTRY = struct.Struct("<QQI")  # key hash, record offset, record length
+
+
+def key_hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def record_keys(data):
+    keys = []
+    if data.get("imdbID"):
+        keys.append(id_key(data["imdbID"]))
+    if data.get("Title"):
+        keys.append(query_key(normalize_text(data["Title"])))
+    return keys
+
+
+def build(path, records):
+    """Zapíše snímek z iterovatelných záznamů OMDb; vrací počet záznamů"""
+    tmp = f"{path}.tmp"
+    entries = []
+    seen = set()
+    count = 0
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 0, 0, 0))
+        for data in records:
+            if data.get("Response") == "False" or not data.get("imdbID") or data["imdbID"] in seen:
+                continue
+            seen.add(data["imdbID"])
+            blob = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            offset = f.tell()
+            f.write(blob)
+            for key in record_keys(data):
+                entries.append((key_hash(key), offset, len(blob)))
+            count += 1
+        # Stable sort keeps the first record for a title shared by several films
+        entries.sort(key=lambda e: e[0])
+        index_offset = f.tell()
+        for entry in entries:
+            f.write(ENTRY.pack(*entry))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, count, index_offset, len(entries)))
+    os.replace(tmp, path)
+    return count
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+class Catalog:
+    """Snímek katalogu přes mmap - hledání podle klíče cache v O(log n)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self._index, self._entries = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} není snímek katalogu")
+
+    def __len__(self):
+        return self.count
+
+    def get(self, key):
+        """Záznam pod klíčem cache ('i:tt...' nebo 't:...') nebo None"""
+        target = key_hash(key)
+        lo, hi = 0, self._entries
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._hash_at(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        while lo < self._entries and self._hash_at(lo) == target:
+            _, offset, length = ENTRY.unpack_from(self._map, self._index + lo * ENTRY.size)
+            data = json.loads(self._map[offset:offset + length])
+            if key in record_keys(data):
+                return data
+            lo += 1
+        return None
+
+    def by_id(self, imdb_id):
+        return self.get(id_key(imdb_id))
+
+    def by_title(self, title):
+        return self.get(query_key(normalize_text(title)))
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def _hash_at(self, i):
+        return struct.unpack_from("<Q", self._map, self._index + i * ENTRY.size)[0]
+
+
+class OfflineFallback:
+    """Když OMDb nejde, odpovídá z katalogu; po retry_after s zkusí síť znovu"""
+
+    def __init__(self, catalog=None, retry_after=30):
+        self.catalog = catalog
+        self.retry_after = retry_after
+        self._offline_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return time.monotonic() < self._offline_until
+
+    @staticmethod
+    def network_error(error):
+        """Výpadek spojení, ne chybová odpověď serveru (ta má .response)"""
+        return getattr(error, "response", None) is None
+
+    def went_offline(self):
+        with self._lock:
+            self._offline_until = time.monotonic() + self.retry_after
+
+    def back_online(self):
+        with self._lock:
+            self._offline_until = 0.0
+
+    def lookup(self, key):
+        if self.catalog is None:
+            raise OfflineError("Offline - katalog není k dispozici")
+        data = self.catalog.get(key)
+        if data is None:
+            raise OfflineError("Offline - titul není v katalogu")
+        return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline katalog OMDb")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_cmd = commands.add_parser("build", help="vytvořit snímek")
+    build_cmd.add_argument("-o", "--output", default=str(CATALOG_FILE))
+    build_cmd.add_argument("--from-cache", action="store_true", help="převzít záznamy z cache odpovědí")
+    build_cmd.add_argument("--jsonl", action="append", default=[], help="dump záznamů OMDb (jeden JSON na řádek)")
+    lookup_cmd = commands.add_parser("lookup", help="najít titul nebo imdbID ve snímku")
+    lookup_cmd.add_argument("query")
+    lookup_cmd.add_argument("-c", "--catalog", default=str(CATALOG_FILE))
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        sources = [read_jsonl(path) for path in args.jsonl]
+        cache = open_response_cache() if args.from_cache else None
+        if cache is not None:
+            sources.append(cache.records())
+        if not sources:
+            parser.error("zadej --from-cache nebo --jsonl")
+        started = time.perf_counter()
+        try:
+            count = build(args.output, (data for source in sources for data in source))
+        finally:
+            if cache is not None:
+                cache.close()
+        print(f"{count} záznamů -> {args.output} ({time.perf_counter() - started:.1f} s)", file=sys.stderr)
+        return 0
+
+    catalog = Catalog(args.catalog)
+    try:
+        query = args.query
+        data = catalog.by_id(query) if query.startswith("tt") and query[2:].isdigit() else catalog.by_title(query)
+    finally:
+        catalog.close()
+    if data is None:
+        print("nenalezeno", file=sys.stderr)
+        return 1
+    print(json.dumps(data, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
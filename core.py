@@ -0,0 +1,262 @@
+import os
+import threading
+import unicodedata
+import urllib.parse
+from contextlib import nullcontext
+from pathlib import Path
+
+from perf import recorder
+from response_cache import ResponseCache, query_key, id_key, season_key
+from scheduler import QuotaExceeded
+
+API_KEY = os.environ.get("OMDB_API_KEY", "473ea196")
+OMDB_URL = os.environ.get("OMDB_URL", "https://www.omdbapi.com/")
+APP_DIR = Path(__file__).resolve().parent
+CACHE_FILE = APP_DIR / "omdb_cache.sqlite3"
+CACHE_TTL = int(os.environ.get("OMDB_CACHE_TTL", 7 * 24 * 3600))
+CACHE_NEGATIVE_TTL = int(os.environ.get("OMDB_CACHE_NEGATIVE_TTL", 3600))
+CACHE_MAX_ENTRIES = int(os.environ.get("OMDB_CACHE_MAX_ENTRIES", 5000))
+TITLE_INDEX_FILE = APP_DIR / "title_index.jsonl"
+HISTORY_DB_FILE = APP_DIR / "search_history.sqlite3"
+CATALOG_FILE = Path(os.environ.get("MOVIEVIEWER_CATALOG", APP_DIR / "catalog.snapshot"))
+OMDB_QUOTA_FILE = APP_DIR / "omdb_quota.sqlite3"
+OMDB_DAILY_QUOTA = int(os.environ.get("OMDB_DAILY_QUOTA", 1000))
+OMDB_RATE = float(os.environ.get("OMDB_RATE", 5))
+POSTER_CACHE_DIR = APP_DIR / "poster_cache"
+POSTER_CACHE_MAX_BYTES = int(os.environ.get("POSTER_CACHE_MAX_BYTES", 200 * 1024 * 1024))
+# Extra rating providers: a CSV dump (imdbID,Source,Value) and/or an endpoint with {imdb_id}
+RATINGS_CSV = os.environ.get("MOVIEVIEWER_RATINGS_CSV")
+RATINGS_URL = os.environ.get("MOVIEVIEWER_RATINGS_URL")
+POSTER_SIZE = (160, 240)
+COMPARISON_POSTER_SIZE = (100, 150)
+
+FIELDS = (
+    "Title", "Year", "Rated", "Released", "Runtime", "Genre", "Director", "Writer",
+    "Actors", "Plot", "Language", "Country", "Awards", "Poster", "Metascore",
+    "imdbRating", "imdbVotes", "imdbID", "Type", "totalSeasons", "BoxOffice",
+)
+
+
+def no_stage(name):
+    """Výchozí stage pro volání mimo Worker - nic neměří ani neruší"""
+    return nullcontext()
+
+
+class OfflineError(Exception):
+    """Síť nejde a titul není v offline katalogu"""
+
+
+class Lazy:
+    """Objekt vytvořený až při prvním zavolání - odkládá těžké importy (thread-safe)"""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = None
+        self._lock = threading.Lock()
+
+    @property
+    def created(self):
+        return self._value is not None
+
+    def __call__(self):
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._factory()
+        return self._value
+
+
+def normalize_text(text):
+    nfd_form = unicodedata.normalize('NFD', text)
+    return ''.join(char for char in nfd_form if unicodedata.category(char) != 'Mn')
+
+
+def open_response_cache(path=CACHE_FILE):
+    return ResponseCache(path, ttl=CACHE_TTL, negative_ttl=CACHE_NEGATIVE_TTL, max_entries=CACHE_MAX_ENTRIES)
+
+
+def _omdb_get(params, http, timeout):
+    query = urllib.parse.urlencode(dict(params, apikey=API_KEY))
+    response = http.get(f"{OMDB_URL}?{query}", timeout=timeout)
+    # OMDb answers an exhausted key with 401 or with a 'Response: False' body
+    if response.status_code == 401 and "limit" in response.text.lower():
+        raise QuotaExceeded("OMDb: Request limit reached")
+    response.raise_for_status()
+    return response
+
+
+def _omdb_json(response):
+    data = response.json()
+    if data.get("Response") == "False" and "limit" in str(data.get("Error", "")).lower():
+        raise QuotaExceeded(f"OMDb: {data['Error']}")
+    return data
+
+
+def omdb_request(params, http, limiter=None, stage=no_stage, timeout=8):
+    """Jeden dotaz na OMDb; vrací dekódovaný JSON
+
+    limiter je TokenBucket, nebo fronta plánovače (OmdbScheduler.lane) - ta stejné
+    rozběhnuté dotazy sloučí a hlídá prioritu i denní kvótu.
+    """
+    if limiter is not None and hasattr(limiter, "request"):
+        def send():
+            response = _omdb_get(params, http, timeout)
+            with recorder.span("json"):
+                return _omdb_json(response)
+
+        # Cancellation is checked outside the shared request so waiters never inherit it
+        with stage("omdb"):
+            return limiter.request(params, send)
+    if limiter is not None:
+        limiter.acquire()
+    with stage("omdb"):
+        response = _omdb_get(params, http, timeout)
+    with stage("json"):
+        return _omdb_json(response)
+
+
+def _cached_lookup(key, params, http, cache, limiter, stage, timeout, offline=None):
+    if cache is not None:
+        with stage("cache"):
+            data = cache.get(key)
+        if data is not None:
+            return data
+
+    # While offline, the catalog answers without waiting for network timeouts
+    if offline is not None and offline.active:
+        return _offline_lookup(key, cache, offline, stage)
+    try:
+        data = omdb_request(params, http, limiter, stage, timeout)
+    except QuotaExceeded:
+        # Out of quota - an expired answer or the catalog beats an error
+        data = cache.get(key, stale=True) if cache is not None else None
+        if data is None and offline is not None and offline.catalog is not None:
+            data = offline.catalog.get(key)
+        if data is None:
+            raise
+        return data
+    except OSError as e:
+        # requests' exceptions are OSError subclasses; only a lost connection means offline
+        if offline is None or not offline.network_error(e):
+            raise
+        offline.went_offline()
+        return _offline_lookup(key, cache, offline, stage)
+    if offline is not None:
+        offline.back_online()
+
+    if cache is not None:
+        keys = [key]
+        if data.get("Response") != "False":
+            # Only a t= answer may speak for the title - an i= one is just one of its namesakes
+            if "t" in params:
+                keys.append(query_key(normalize_text(data.get('Title', ''))))
+            if data.get('imdbID'):
+                keys.append(id_key(data['imdbID']))
+        cache.put(data, *dict.fromkeys(keys))
+    return data
+
+
+def _offline_lookup(key, cache, offline, stage):
+    """Bez sítě: prošlá odpověď z cache, jinak offline katalog"""
+    with stage("katalog"):
+        data = cache.get(key, stale=True) if cache is not None else None
+        return data if data is not None else offline.lookup(key)
+
+
+def fetch_movie(normalized_name, http, cache=None, limiter=None, stage=no_stage, timeout=8, offline=None):
+    """Najde film podle názvu (t=) - nejdřív v cache, pak na OMDb, bez sítě v offline katalogu"""
+    return _cached_lookup(query_key(normalized_name), {"t": normalized_name}, http, cache, limiter, stage, timeout, offline)
+
+
+def fetch_movie_by_id(imdb_id, http, cache=None, limiter=None, stage=no_stage, timeout=8, offline=None):
+    """Najde film podle imdbID (i=)"""
+    return _cached_lookup(id_key(imdb_id), {"i": imdb_id}, http, cache, limiter, stage, timeout, offline)
+
+
+def find_movie(normalized_name, http, cache=None, limiter=None, stage=no_stage, timeout=8, offline=None,
+               title_index=None):
+    """Hledání názvu jako v GUI - přesná shoda v indexu názvů jde rovnou na imdbID
+
+    Podobný název z indexu (překlep) se použije až když OMDb nic nenajde nebo není
+    dostupné; sám o sobě dotaz nenahradí, jinak by 'Aliens' otevřelo 'Alien'.
+    """
+    if title_index is not None:
+        with stage("index"):
+            imdb_id = title_index.lookup(normalized_name)
+        recorder.count("index hit" if imdb_id else "index miss")
+        if imdb_id:
+            return fetch_movie_by_id(imdb_id, http, cache, limiter, stage, timeout, offline)
+
+    error = None
+    try:
+        data = fetch_movie(normalized_name, http, cache, limiter, stage, timeout, offline)
+    except (OSError, QuotaExceeded, OfflineError) as e:
+        if title_index is None:
+            raise
+        data, error = None, e
+    if title_index is None or data is not None and data.get("Response") != "False":
+        return data
+    with stage("index"):
+        imdb_id = title_index.closest(normalized_name)
+    if imdb_id is None:
+        if error is not None:
+            raise error
+        return data
+    recorder.count("index fuzzy")
+    return fetch_movie_by_id(imdb_id, http, cache, limiter, stage, timeout, offline)
+
+
+def fetch_season(imdb_id, season, http, cache=None, limiter=None, stage=no_stage, timeout=8):
+    """Seznam epizod jedné sezóny seriálu (i=&Season=) - v cache pod imdbID a číslem sezóny"""
+    key = season_key(imdb_id, season)
+    if cache is not None:
+        with stage("cache"):
+            data = cache.get(key)
+        if data is not None:
+            return data
+    try:
+        data = omdb_request({"i": imdb_id, "Season": season}, http, limiter, stage, timeout)
+    except QuotaExceeded:
+        data = cache.get(key, stale=True) if cache is not None else None
+        if data is None:
+            raise
+        return data
+    if cache is not None:
+        cache.put(data, key)
+    return data
+
+
+def search_titles(normalized_name, http, limiter=None, stage=no_stage, timeout=8):
+    """Vyhledávání (s=) - vrací (seznam výsledků, celkový počet)"""
+    data = omdb_request({"s": normalized_name}, http, limiter, stage, timeout)
+    if data.get("Response") == "False":
+        return [], 0
+    results = data.get("Search", [])
+    try:
+        total = int(data.get("totalResults", len(results)))
+    except ValueError:
+        total = len(results)
+    return results, total
+
+
+def extract_fields(data):
+    """Vybere z odpovědi OMDb pole, která zobrazuje aplikace"""
+    return {field: data.get(field, 'N/A') for field in FIELDS}
+
+
+def rating_color_role(rating_str):
+    """Vrátí barevnou roli palety podle hodnocení"""
+    try:
+        rating = float(rating_str)
+    except (TypeError, ValueError):
+        return "TEXT_SECONDARY"
+    if rating != rating:
+        return "TEXT_SECONDARY"
+    elif rating >= 8:
+        return "ACCENT_GREEN"
+    elif rating >= 7:
+        return "ACCENT_BLUE"
+    elif rating >= 6:
+        return "ACCENT_PURPLE"
+    else:
+        return "ACCENT_PINK"
@@ -0,0 +1,158 @@
+import json
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+HistoryEntry = namedtuple("HistoryEntry", "imdb_id title query ts latency_ms")
+
+_STOP = object()
+
+
+def entry_key(imdb_id, title):
+    return imdb_id or f"title:{title}"
+
+
+def title_key(title):
+    return " ".join(title.casefold().split())
+
+
+class HistoryStore:
+    """Historie hledání - append-only SQLite (WAL), deduplikace podle imdbID a zápisy na pozadí"""
+
+    def __init__(self, path, max_rows=50000, memory_entries=500, compact_every=1000, legacy_file=None):
+        self.path = path
+        self.max_rows = max_rows
+        self.memory_entries = memory_entries
+        self.compact_every = compact_every
+        self._recent = OrderedDict()
+        # Entries known only by title (the legacy import) - replaced once the imdbID is known
+        self._title_only = {}
+        self._queue = queue.Queue()
+        self._appended = 0
+
+        db = self._connect()
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS history ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT NOT NULL, imdb_id TEXT, "
+            "title TEXT NOT NULL, query TEXT, ts REAL NOT NULL, latency_ms REAL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS history_key ON history(key, seq)")
+        db.commit()
+        if legacy_file is not None:
+            self._import_legacy(db, legacy_file)
+
+        rows = db.execute(
+            "SELECT imdb_id, title, query, ts, latency_ms FROM history "
+            "WHERE seq IN (SELECT MAX(seq) FROM history GROUP BY key) ORDER BY seq DESC LIMIT ?",
+            (memory_entries,),
+        ).fetchall()
+        for key, title in db.execute("SELECT DISTINCT key, title FROM history WHERE imdb_id IS NULL"):
+            self._title_only.setdefault(title_key(title), set()).add(key)
+        db.close()
+        for row in reversed(rows):
+            entry = HistoryEntry(*row)
+            self._recent[entry_key(entry.imdb_id, entry.title)] = entry
+
+        self._writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+        self._writer.start()
+
+    def add(self, imdb_id, title, query=None, latency_ms=None):
+        """Zapíše hledání - v paměti hned (O(1)), na disk dávkově na pozadí"""
+        entry = HistoryEntry(imdb_id or None, title, query, time.time(), latency_ms)
+        key = entry_key(entry.imdb_id, title)
+        if entry.imdb_id is None:
+            self._title_only.setdefault(title_key(title), set()).add(key)
+        else:
+            for old in self._title_only.pop(title_key(title), ()):
+                self._recent.pop(old, None)
+                self._queue.put((old, None))
+        self._recent.pop(key, None)
+        self._recent[key] = entry
+        while len(self._recent) > self.memory_entries:
+            self._recent.popitem(last=False)
+        self._queue.put((key, entry))
+        return entry
+
+    def recent(self, limit=10):
+        """Posledních `limit` různých titulů, nejnovější první"""
+        result = []
+        for entry in reversed(self._recent.values()):
+            if len(result) == limit:
+                break
+            result.append(entry)
+        return result
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._writer.join(timeout=5)
+
+    def _connect(self):
+        db = sqlite3.connect(str(self.path))
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _write_loop(self):
+        db = self._connect()
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            # Group whatever arrived in the meantime into one transaction
+            while True:
+                try:
+                    batch.append(self._queue.get(timeout=0.2))
+                except queue.Empty:
+                    break
+                if len(batch) >= 256:
+                    break
+            if _STOP in batch:
+                stop = True
+                batch = [item for item in batch if item is not _STOP]
+            if batch:
+                with db:
+                    for key, entry in batch:
+                        if entry is None:
+                            db.execute("DELETE FROM history WHERE key = ?", (key,))
+                        else:
+                            db.execute(
+                                "INSERT INTO history (key, imdb_id, title, query, ts, latency_ms) "
+                                "VALUES (?, ?, ?, ?, ?, ?)",
+                                (key, *entry),
+                            )
+                self._appended += len(batch)
+                if self._appended >= self.compact_every:
+                    self._compact(db)
+                    self._appended = 0
+        db.close()
+
+    def _compact(self, db):
+        """Nechá jen poslední záznam pro každý titul a nejvýš max_rows řádků"""
+        with db:
+            db.execute("DELETE FROM history WHERE seq NOT IN (SELECT MAX(seq) FROM history GROUP BY key)")
+            db.execute(
+                "DELETE FROM history WHERE seq <= (SELECT seq FROM history ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+                (self.max_rows,),
+            )
+        db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _import_legacy(self, db, legacy_file):
+        """Jednorázově převezme starý search_history.json (jen názvy)"""
+        if db.execute("SELECT 1 FROM history LIMIT 1").fetchone() is not None:
+            return
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                titles = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        rows = [
+            (entry_key(None, title), None, title, None, now - i, None)
+            for i, title in enumerate(titles) if isinstance(title, str)
+        ]
+        with db:
+            db.executemany(
+                "INSERT INTO history (key, imdb_id, title, query, ts, latency_ms) VALUES (?, ?, ?, ?, ?, ?)",
+                reversed(rows),
+            )
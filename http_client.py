@@ -0,0 +1,165 @@
+import email.utils
+import threading
+import time
+import urllib.parse
+from io import BytesIO
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_FRESHNESS = 24 * 3600
+CHUNK_SIZE = 64 * 1024
+MAX_DOWNLOAD = 20 * 1024 * 1024
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter, který počítá nově otevřená spojení pro každý host"""
+
+    def __init__(self, on_new_connection, **kwargs):
+        self._on_new_connection = on_new_connection
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        on_new_connection = self._on_new_connection
+
+        def counting(pool_class):
+            class CountingPool(pool_class):
+                def _new_conn(self):
+                    on_new_connection(self.host)
+                    return super()._new_conn()
+            return CountingPool
+
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: counting(pool_class)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class HttpClient:
+    """Sdílená requests.Session - keep-alive, limit spojení na host, opakování s backoffem
+
+    URL začínající některým z `no_retry` (OMDb) se neopakují: každý pokus by
+    spotřeboval denní kvótu mimo plánovač a zdržel přepnutí do offline režimu.
+    """
+
+    def __init__(self, pool_maxsize=8, retries=3, backoff=0.5, no_retry=()):
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._adapter = self._make_adapter(pool_maxsize, retry)
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "MovieExplorer"
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        if no_retry:
+            # Same as requests' default: read=False re-raises a timeout as itself
+            single = self._make_adapter(pool_maxsize, Retry(0, read=False))
+            for prefix in no_retry:
+                self.session.mount(prefix, single)
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._connections = {}
+
+    def get(self, url, timeout=8, **kwargs):
+        host = urllib.parse.urlsplit(url).hostname
+        with self._lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+        return self.session.get(url, timeout=timeout, **kwargs)
+
+    def conditional_get(self, url, meta=None, timeout=8, on_chunk=None, max_bytes=MAX_DOWNLOAD):
+        """GET s If-None-Match/If-Modified-Since; při 304 vrátí (None, meta)
+
+        Tělo se stahuje po kusech; on_chunk(přijato, celkem) může stahování přerušit výjimkou.
+        """
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        with self.get(url, timeout=timeout, headers=headers, stream=True) as response:
+            if response.status_code == 304 and meta:
+                return None, cache_meta(response, meta)
+            response.raise_for_status()
+            return read_body(response, on_chunk, max_bytes), cache_meta(response, {})
+
+    def stats(self):
+        """Počet požadavků a nových spojení na host - reused ukazuje ušetřené handshaky"""
+        with self._lock:
+            return {
+                host: {
+                    "requests": count,
+                    "connections": self._connections.get(host, 0),
+                    "reused": max(count - self._connections.get(host, 0), 0),
+                }
+                for host, count in self._requests.items()
+            }
+
+    def close(self):
+        self.session.close()
+
+    def _make_adapter(self, pool_maxsize, retry):
+        return _CountingAdapter(
+            self._connection_opened,
+            pool_connections=16,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+            max_retries=retry,
+        )
+
+    def _connection_opened(self, host):
+        with self._lock:
+            self._connections[host] = self._connections.get(host, 0) + 1
+
+
+def read_body(response, on_chunk=None, max_bytes=MAX_DOWNLOAD):
+    """Přečte streamované tělo odpovědi s limitem velikosti"""
+    total = int(response.headers.get("Content-Length") or 0)
+    if total > max_bytes:
+        raise ValueError(f"Odpověď má {total} B, limit je {max_bytes} B")
+    body = BytesIO()
+    received = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValueError(f"Odpověď je větší než {max_bytes} B")
+        body.write(chunk)
+        if on_chunk is not None:
+            on_chunk(received, total)
+    return body.getvalue()
+
+
+def cache_meta(response, previous):
+    """Z hlaviček ETag/Last-Modified/Cache-Control/Expires spočítá validátory a čerstvost"""
+    now = time.time()
+    headers = response.headers
+    meta = {
+        "etag": headers.get("ETag", previous.get("etag")),
+        "last_modified": headers.get("Last-Modified", previous.get("last_modified")),
+    }
+
+    directives = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives or "no-cache" in directives:
+        meta["expires"] = now
+    elif directives.get("max-age", "").isdigit():
+        meta["expires"] = now + int(directives["max-age"])
+    elif headers.get("Expires"):
+        try:
+            meta["expires"] = email.utils.parsedate_to_datetime(headers["Expires"]).timestamp()
+        except (TypeError, ValueError):
+            meta["expires"] = now
+    else:
+        meta["expires"] = now + DEFAULT_FRESHNESS
+    return meta
@@ -1,25 +1,104 @@
 import os
-import urllib.parse
-import requests
+import sys
+import time
+
+START_TIME = time.perf_counter()
+
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
-from PIL import Image, ImageTk
-from io import BytesIO
 from pathlib import Path
-import unicodedata
-import json
+from worker import Worker, Cancelled, format_timings
+from core import (normalize_text, find_movie, fetch_movie_by_id, fetch_season, search_titles, open_response_cache,
+                  Lazy, POSTER_CACHE_DIR, POSTER_CACHE_MAX_BYTES,
+                  TITLE_INDEX_FILE, HISTORY_DB_FILE, CATALOG_FILE, POSTER_SIZE, COMPARISON_POSTER_SIZE,
+                  RATINGS_CSV, RATINGS_URL, OMDB_URL, OMDB_QUOTA_FILE, OMDB_DAILY_QUOTA, OMDB_RATE)
+from response_cache import id_key
+from suggest import SuggestionCache, prefix_key
+from views import HistoryList, ComparisonView, SeriesView, DiagnosticsPanel
+from analytics import MovieTable
+from movie import Movie
+from series import SeriesStats, SeriesLoader
+from theme import ThemeRegistry
+from perf import recorder, timed
+from history_store import HistoryStore
+from prefetch import Prefetcher, DEFERRED
+from ratelimit import TokenBucket
+from ratings import ScoreLoader, format_aggregate
+from scheduler import USER, BACKGROUND
 
-API_KEY = os.environ.get("OMDB_API_KEY", "473ea196")
 HISTORY_FILE = Path(__file__).resolve().parent / "search_history.json"
+SUGGEST_DELAY_MS = 250
+SUGGEST_MIN_CHARS = 3
+SUGGEST_LOCAL_MIN = 5
+# Prefetching may only spend a small share of the OMDb/poster request budget
+PREFETCH_RATE = 0.2
+PREFETCH_BURST = 5
+PREFETCH_SUGGESTIONS = 3
+SERIES_PARALLEL = 4
+COMPARISON_SCORE_PARALLEL = 2
 
 dark_mode = True
-search_history = []
-comparison_movies = []
-current_movie_data = {}
-
-def normalize_text(text):
-    nfd_form = unicodedata.normalize('NFD', text)
-    return ''.join(char for char in nfd_form if unicodedata.category(char) != 'Mn')
+theme = ThemeRegistry("dark")
+colors = theme.colors
+search_history = None
+comparison_table = MovieTable()
+current_movie = None
+pending_query = None
+time_to_first_frame = None
+suggestions = SuggestionCache()
+suggest_results = []
+suggest_after_id = None
+comparison_view = None
+prefetch_budget = TokenBucket(PREFETCH_RATE, PREFETCH_BURST)
+series_view = None
+diagnostics_panel = None
+series_stats = None
+
+def _make_http():
+    from http_client import HttpClient
+    return HttpClient(no_retry=(OMDB_URL,))
+
+def _make_poster_cache():
+    from poster_cache import PosterCache
+    return PosterCache(POSTER_CACHE_DIR, max_bytes=POSTER_CACHE_MAX_BYTES)
+
+def _make_title_index():
+    from title_index import TitleIndex
+    return TitleIndex(TITLE_INDEX_FILE).load()
+
+def _make_offline():
+    from catalog import Catalog, OfflineFallback
+    return OfflineFallback(Catalog(CATALOG_FILE) if CATALOG_FILE.exists() else None)
+
+def _make_scheduler():
+    from scheduler import OmdbScheduler
+    return OmdbScheduler(OMDB_QUOTA_FILE, OMDB_DAILY_QUOTA, OMDB_RATE)
+
+def _make_ratings():
+    from ratings import RatingsAggregator, OmdbRatings, CsvRatings, HttpRatings
+    providers = [OmdbRatings()]
+    if RATINGS_CSV:
+        providers.append(CsvRatings(RATINGS_CSV, name="csv"))
+    if RATINGS_URL:
+        providers.append(HttpRatings(RATINGS_URL, http()))
+    return RatingsAggregator(providers)
+
+# Heavy imports (requests, PIL) and cache files are opened on first use
+response_cache = Lazy(open_response_cache)
+http = Lazy(_make_http)
+poster_cache = Lazy(_make_poster_cache)
+title_index = Lazy(_make_title_index)
+offline = Lazy(_make_offline)
+scheduler = Lazy(_make_scheduler)
+ratings = Lazy(_make_ratings)
+
+def download_poster(url, meta=None, timeout=8, task=None):
+    if offline().active:
+        # The poster cache falls back to a stale copy
+        raise ConnectionError("offline")
+    # Checking between chunks stops a superseded download instead of finishing it
+    on_chunk = (lambda received, total: task.check()) if task is not None else None
+    return http().conditional_get(url, meta, timeout=timeout, on_chunk=on_chunk)
 
 def create_rounded_button(parent, **kwargs):
     """Vytvoří zaoblené tlačítko s shadow efektem"""
@@ -39,152 +118,272 @@ def create_rounded_button(parent, **kwargs):
 
 def load_search_history():
     global search_history
-    try:
-        if HISTORY_FILE.exists():
-            with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                search_history = json.load(f)[:10]
-    except:
-        search_history = []
-
-def save_search_history(title):
-    global search_history
-    if title not in search_history:
-        search_history.insert(0, title)
-        search_history = search_history[:10]
-        try:
-            with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(search_history, f, ensure_ascii=False, indent=2)
-        except:
-            pass
+    # The old JSON history is imported once into the SQLite store
+    search_history = HistoryStore(HISTORY_DB_FILE, legacy_file=HISTORY_FILE)
+
+def save_search_history(movie, query=None, latency_ms=None):
+    search_history.add(movie.imdb_id, movie.title, query, latency_ms)
 
 def toggle_dark_mode():
-    global dark_mode, BG_PRIMARY, BG_SECONDARY, BG_TERTIARY, TEXT_PRIMARY, TEXT_SECONDARY, ACCENT_BLUE, ACCENT_PURPLE, ACCENT_PINK, ACCENT_GREEN
-    
+    global dark_mode
     dark_mode = not dark_mode
-    
-    if dark_mode:
-        # Dark mode
-        BG_PRIMARY = "#0a0e27"
-        BG_SECONDARY = "#161b35"
-        BG_TERTIARY = "#1f2847"
-        TEXT_PRIMARY = "#e8f0ff"
-        TEXT_SECONDARY = "#a0b9d8"
-        ACCENT_BLUE = "#00d4ff"
-        ACCENT_PURPLE = "#bb86fc"
-        ACCENT_PINK = "#ff4081"
-        ACCENT_GREEN = "#00e676"
-        theme_btn.config(text="🌙 Dark")
+    # Every registered widget, including open comparison windows, in one pass
+    theme.apply("dark" if dark_mode else "light")
+    theme_btn.config(text="🌙 Dark" if dark_mode else "☀️ Light")
+    show_logo()
+
+def fetch_movie_job(task, normalized_name, imdb_id=None):
+    """Běží na pozadí: dotaz na OMDb, JSON a příprava plakátu"""
+    if imdb_id:
+        data = fetch_movie_by_id(imdb_id, http(), response_cache(), scheduler().lane(USER), task.stage, offline=offline())
     else:
-        # Light mode
-        BG_PRIMARY = "#f8f9fc"
-        BG_SECONDARY = "#eff2f8"
-        BG_TERTIARY = "#ffffff"
-        TEXT_PRIMARY = "#0f1419"
-        TEXT_SECONDARY = "#3a4a6a"
-        ACCENT_BLUE = "#0066dd"
-        ACCENT_PURPLE = "#8b5cf6"
-        ACCENT_PINK = "#ec4899"
-        ACCENT_GREEN = "#059669"
-        theme_btn.config(text="☀️ Light")
-    
-    # Update all widget colors
-    root.config(bg=BG_PRIMARY)
-    header_frame.config(bg=BG_SECONDARY)
-    separator.config(bg=ACCENT_BLUE)
-    search_section.config(bg=BG_SECONDARY)
-    search_inner.config(bg=BG_SECONDARY)
-    search_label.config(bg=BG_SECONDARY, fg=ACCENT_BLUE)
-    entry.config(bg=BG_TERTIARY, fg=TEXT_PRIMARY)
-    search_btn.config(bg=ACCENT_PINK)
-    comp_btn.config(bg=ACCENT_PURPLE)
-    status_label.config(bg=BG_SECONDARY, fg=TEXT_SECONDARY)
-    main_frame.config(bg=BG_PRIMARY)
-    history_panel.config(bg=BG_SECONDARY)
-    history_frame.config(bg=BG_SECONDARY)
-    content_frame.config(bg=BG_PRIMARY)
-    canvas.config(bg=BG_PRIMARY)
-    scrollbar.config(bg=BG_SECONDARY)
-    scrollable_frame.config(bg=BG_PRIMARY)
-    title_card.config(bg=BG_TERTIARY)
-    title_label.config(bg=BG_TERTIARY, fg=ACCENT_BLUE)
-    info_card.config(bg=BG_TERTIARY)
-    year_label.config(bg=BG_TERTIARY, fg=ACCENT_PURPLE)
-    genre_label.config(bg=BG_TERTIARY, fg=TEXT_SECONDARY)
-    details_frame.config(bg=BG_PRIMARY)
-    poster_frame.config(bg=BG_TERTIARY)
-    poster_label.config(bg=BG_TERTIARY, fg=TEXT_SECONDARY)
-    right_frame.config(bg=BG_PRIMARY)
-    add_comp_btn.config(bg=ACCENT_GREEN)
-    clear_comp_btn.config(bg=ACCENT_PINK)
-    plot_text.config(bg=BG_TERTIARY, fg=TEXT_PRIMARY)
-    
-    update_history_buttons()
-    load_logo()
-    logo_label.config(bg=BG_SECONDARY)
-
-BG_PRIMARY = "#0a0e27"
-BG_SECONDARY = "#161b35"
-BG_TERTIARY = "#1f2847"
-TEXT_PRIMARY = "#e8f0ff"
-TEXT_SECONDARY = "#a0b9d8"
-ACCENT_BLUE = "#00d4ff"
-ACCENT_PURPLE = "#bb86fc"
-ACCENT_PINK = "#ff4081"
-ACCENT_GREEN = "#00e676"
-
-def search_movie():
-    global current_movie_data
-    
+        data = find_movie(normalized_name, http(), response_cache(), scheduler().lane(USER), task.stage,
+                          offline=offline(), title_index=title_index())
+
+    if data.get("Response") == "False":
+        return None, None
+    movie = Movie.from_omdb(data)
+    title_index().add(movie.imdb_id, movie.title)
+
+    # Only a ready variant is loaded here; anything else streams in after the details are shown
+    poster = None
+    if movie.poster and poster_cache().contains(movie.poster, POSTER_SIZE):
+        try:
+            poster = poster_cache().load(movie.poster, POSTER_SIZE, download_poster, stage=task.stage)
+        except Cancelled:
+            raise
+        except Exception:
+            poster = None
+    return movie, poster
+
+def load_poster_job(task, poster_url):
+    return poster_cache().load(poster_url, POSTER_SIZE, lambda url, meta: download_poster(url, meta, task=task),
+                               stage=task.stage, on_preview=task.progress)
+
+def request_poster(poster_url):
+    poster_label.config(image='', text="Načítám\nplakát…", width=20, height=12)
+    poster_label.current_image = None
+    worker.submit(load_poster_job, poster_url, group="poster", supersede=True,
+                  on_progress=lambda task, img: show_poster(poster_url, img),
+                  on_done=lambda task, img: show_poster(poster_url, img),
+                  on_error=lambda task, error: show_poster(poster_url, None))
+
+def show_poster(poster_url, img):
+    if current_movie is None or current_movie.poster != poster_url:
+        return
+    if img is not None:
+        from PIL import ImageTk
+        poster_label.current_image = ImageTk.PhotoImage(img)
+        poster_label.config(image=poster_label.current_image, text='', width=160, height=240)
+    else:
+        poster_label.config(image='', text="Bez\nplakátu", width=20, height=12)
+        poster_label.current_image = None
+
+def ratings_job(task, movie):
+    return ratings().collect(movie, on_partial=task.progress)
+
+def request_ratings(movie):
+    """Hodnocení z OMDb hned, ostatní zdroje doběhnou na pozadí"""
+    aggregate = ratings().cached(movie)
+    show_ratings(movie.imdb_id, aggregate)
+    if aggregate.missing:
+        worker.submit(ratings_job, movie, group="ratings", supersede=True,
+                      on_progress=lambda task, result: show_ratings(movie.imdb_id, result),
+                      on_done=lambda task, result: show_ratings(movie.imdb_id, result))
+    else:
+        worker.cancel("ratings")
+
+def show_ratings(imdb_id, aggregate):
+    if current_movie is not None and current_movie.imdb_id == imdb_id:
+        ratings_var.set(format_aggregate(aggregate))
+
+def prefetch_job(task, imdb_id):
+    """Běží na pozadí s nízkou prioritou: doplní cache odpovědí a plakátů"""
+    cache = response_cache()
+    if offline().active:
+        return DEFERRED
+    if not cache.contains(id_key(imdb_id)) and not prefetch_budget.try_acquire():
+        return DEFERRED
+    data = fetch_movie_by_id(imdb_id, http(), cache, scheduler().lane(BACKGROUND), task.stage)
+    if data.get("Response") == "False":
+        return data
+    title_index().add(data.get('imdbID'), data.get('Title'))
+
+    poster_url = data.get("Poster")
+    if poster_url and poster_url != "N/A":
+        sizes = [size for size in (POSTER_SIZE, COMPARISON_POSTER_SIZE) if not poster_cache().contains(poster_url, size)]
+        if sizes and not prefetch_budget.try_acquire():
+            return DEFERRED
+        for size in sizes:
+            poster_cache().load(poster_url, size, lambda url, meta: download_poster(url, meta, task=task), stage=task.stage)
+    return data
+
+def prefetch_idle():
+    return not worker.busy("search") and not worker.busy("suggest")
+
+def schedule_prefetch():
+    """Historie a porovnání - to, co uživatel pravděpodobně otevře příště"""
+    ids = [item.imdb_id for item in search_history.recent(5)]
+    ids += [movie.imdb_id for movie in comparison_table.records]
+    prefetcher.schedule(ids)
+
+@timed("ui search")
+def search_movie(imdb_id=None):
+    global pending_query
+
     movie_name = entry.get().strip()
     if not movie_name:
         messagebox.showwarning("Chyba", "Zadej název filmu!")
         return
 
+    hide_suggestions()
     normalized_name = normalize_text(movie_name)
-    status_label.config(text="🔍 Hledám...", fg=ACCENT_PURPLE)
-    root.update()
-
-    try:
-        q = urllib.parse.quote_plus(normalized_name)
-        url = f"https://www.omdbapi.com/?t={q}&apikey={API_KEY}"
-        response = requests.get(url, timeout=8)
-        response.raise_for_status()
-        data = response.json()
-    except Exception as e:
-        status_label.config(text=f"❌ Chyba: {str(e)[:40]}", fg=ACCENT_PINK)
+    status_label.config(text="🔍 Hledám...", fg=colors["ACCENT_PURPLE"])
+    pending_query = normalized_name
+    prefetcher.pause()
+    worker.submit(fetch_movie_job, normalized_name, imdb_id, group="search", supersede=True,
+                  on_done=show_movie, on_error=show_search_error)
+
+def suggest_job(task, key):
+    # Suggestions are speculative, so they never eat into the quota kept for searches
+    return search_titles(key, http(), scheduler().lane(BACKGROUND), task.stage)
+
+def on_entry_key(event):
+    """Našeptávač - debounce, zrušení starého dotazu a lokální filtrování podle prefixu"""
+    global suggest_after_id
+    if event.keysym in ("Return", "KP_Enter", "Tab", "Up", "Left", "Right", "Shift_L", "Shift_R",
+                        "Control_L", "Control_R"):
+        return
+    if event.keysym == "Escape":
+        hide_suggestions()
+        return
+    if event.keysym == "Down":
+        if suggest_list.winfo_ismapped():
+            suggest_list.focus_set()
+            suggest_list.selection_clear(0, tk.END)
+            suggest_list.selection_set(0)
+            suggest_list.activate(0)
         return
 
-    if data.get("Response") == "False":
-        status_label.config(text="❌ Film/Seriál nebyl nalezen", fg=ACCENT_PINK)
+    if suggest_after_id is not None:
+        root.after_cancel(suggest_after_id)
+        suggest_after_id = None
+    worker.cancel("suggest")
+
+    key = prefix_key(entry.get())
+    if len(key) < SUGGEST_MIN_CHARS:
+        hide_suggestions()
         return
 
-    current_movie_data = data
-    title = data.get('Title', 'N/A')
-    save_search_history(title)
-    update_history_buttons()
+    cached = suggestions.lookup(key)
+    recorder.count("suggest hit" if cached is not None else "suggest miss")
+    if cached is not None:
+        results, complete = cached
+        show_suggestions(results)
+        if complete or len(results) >= SUGGEST_LOCAL_MIN:
+            return
+    suggest_after_id = root.after(SUGGEST_DELAY_MS, request_suggestions, key)
+
+def request_suggestions(key):
+    global suggest_after_id
+    suggest_after_id = None
+    worker.submit(suggest_job, key, group="suggest", supersede=True,
+                  on_done=lambda task, result: receive_suggestions(key, result))
+
+def receive_suggestions(key, result):
+    results, total = result
+    if results:
+        suggestions.put(key, results, total)
+        prefetcher.schedule(movie.get('imdbID') for movie in results[:PREFETCH_SUGGESTIONS])
+    if prefix_key(entry.get()) == key:
+        show_suggestions(results)
+
+def show_suggestions(results):
+    global suggest_results
+    suggest_results = results
+    if not results:
+        hide_suggestions()
+        return
+    suggest_list.delete(0, tk.END)
+    for movie in results:
+        suggest_list.insert(tk.END, f"{movie.get('Title', 'N/A')} ({movie.get('Year', 'N/A')})")
+    suggest_list.config(height=min(len(results), 8))
+    suggest_list.place(in_=entry, x=0, rely=1.0, relwidth=1.0)
+    suggest_list.lift()
+
+def hide_suggestions(event=None):
+    suggest_list.place_forget()
+
+def hide_suggestions_on_blur(event=None):
+    root.after(150, lambda: None if root.focus_get() in (entry, suggest_list) else hide_suggestions())
+
+def choose_suggestion(event=None):
+    selection = suggest_list.curselection()
+    if not selection:
+        return
+    movie = suggest_results[selection[0]]
+    entry.delete(0, tk.END)
+    entry.insert(0, movie.get('Title', ''))
+    entry.focus_set()
+    search_movie(imdb_id=movie.get('imdbID'))
+
+def cancel_stale_search(event=None):
+    """Zruší rozběhnuté hledání, jakmile uživatel přepíše název"""
+    global pending_query
+    if pending_query is None or not worker.busy("search"):
+        return
+    if normalize_text(entry.get().strip()) != pending_query:
+        worker.cancel("search")
+        pending_query = None
+        status_label.config(text="Začni psaním...", fg=colors["TEXT_SECONDARY"])
+
+def show_search_error(task, error):
+    global pending_query
+    pending_query = None
+    status_label.config(text=f"❌ Chyba: {str(error)[:40]}", fg=colors["ACCENT_PINK"])
+
+@timed("ui detail")
+def show_movie(task, result):
+    global current_movie, pending_query
+    query = pending_query
+    pending_query = None
+    movie, poster = result
+
+    if movie is None:
+        status_label.config(text="❌ Film/Seriál nebyl nalezen", fg=colors["ACCENT_PINK"])
+        return
 
-    year = data.get('Year', 'N/A')
-    genre = data.get('Genre', 'N/A')
-    plot = data.get('Plot', 'N/A')
-    rating = data.get('imdbRating', 'N/A')
-    director = data.get('Director', 'N/A')
-    actors = data.get('Actors', 'N/A')
-    runtime = data.get('Runtime', 'N/A')
-    movie_type = data.get('Type', 'N/A')
-    country = data.get('Country', 'N/A')
-    awards = data.get('Awards', 'N/A')
-    rated = data.get('Rated', 'N/A')
-    imdb_id = data.get('imdbID', '')
+    current_movie = movie
+    title = movie.title
+    save_search_history(movie, query, (time.perf_counter() - task.created) * 1000)
+    update_history_buttons()
+    schedule_prefetch()
+
+    year = movie.get('Year')
+    genre = movie.get('Genre')
+    plot = movie.get('Plot')
+    rating = movie.get('imdbRating')
+    director = movie.get('Director')
+    actors = movie.get('Actors')
+    runtime = movie.get('Runtime')
+    movie_type = movie.get('Type')
+    country = movie.get('Country')
+    awards = movie.get('Awards')
+    rated = movie.get('Rated')
+    imdb_id = movie.get('imdbID', '')
     
     if movie_type.lower() == 'series':
-        total_seasons = data.get('totalSeasons', 'N/A')
+        total_seasons = movie.get('totalSeasons')
         runtime_info = f"{runtime} za epizodu | {total_seasons} sezón"
+        series_btn.pack(anchor="w", pady=(0, 10), after=add_comp_btn)
     else:
         runtime_info = runtime
+        series_btn.pack_forget()
 
     title_var.set(title)
     year_var.set(f"{year} | Hodnocení: {rating}/10 | Typ: {movie_type}")
     genre_var.set(f"Žánr: {genre}")
+    request_ratings(movie)
     
     detailed_info = f"""• REŽISÉR: {director}
 
@@ -204,370 +403,395 @@ def search_movie():
 
 {plot}"""
     plot_var.set(detailed_info)
-    status_label.config(text="✓ Nalezeno!", fg=ACCENT_GREEN)
 
-    poster_url = data.get("Poster")
-    if poster_url and poster_url != "N/A":
-        try:
-            poster_response = requests.get(poster_url, timeout=8)
-            poster_response.raise_for_status()
-            img_data = poster_response.content
-            img = Image.open(BytesIO(img_data)).convert("RGBA")
-            img = img.resize((160, 240), Image.LANCZOS)
-            poster_label.current_image = ImageTk.PhotoImage(img)
-            poster_label.config(image=poster_label.current_image, text='', width=160, height=240, bg=BG_TERTIARY)
-        except Exception:
-            poster_label.config(image='', TEXT_PRIMARY="Bez\nplakátu", fg=TEXT_SECONDARY, width=20, height=12)
-            poster_label.current_image = None
+    worker.cancel("poster")
+    if poster is None and movie.poster:
+        request_poster(movie.poster)
     else:
-        poster_label.config(image='', text="Bez\nplakátu", fg=TEXT_SECONDARY, width=20, height=12)
-        poster_label.current_image = None
+        show_poster(movie.poster, poster)
+
+    source = "📴 offline · " if offline().active else ""
+    status_label.config(text=f"✓ Nalezeno! ({source}{format_timings(task.timings)})", fg=colors["ACCENT_GREEN"])
+    trace_layout("ui detail layout")
+
+def trace_layout(name):
+    """Doba do chvíle, kdy Tk dopočítá geometrii (idle callback běží až po ní)"""
+    start = time.perf_counter()
+    root.after_idle(lambda: recorder.record(name, start, time.perf_counter() - start))
+
+def diagnostics_counters():
+    """Počítadla pro panel diagnostiky - jen u služeb, které už vznikly"""
+    sections = {"Aplikace": recorder.counters()}
+    if response_cache.created:
+        sections["Cache odpovědí"] = response_cache().stats()
+    if poster_cache.created:
+        sections["Cache plakátů"] = poster_cache().stats()
+    if scheduler.created:
+        sections["OMDb plánovač"] = scheduler().stats()
+    if ratings.created:
+        sections["Hodnocení"] = ratings().stats()
+    if http.created:
+        for host, stats in http().stats().items():
+            sections[f"HTTP {host}"] = stats
+    return sections
+
+def toggle_diagnostics(event=None):
+    global diagnostics_panel
+    if diagnostics_panel is not None and diagnostics_panel.exists():
+        diagnostics_panel.window.destroy()
+        diagnostics_panel = None
+        return
+    diagnostics_panel = DiagnosticsPanel(root, theme, recorder, diagnostics_counters)
 
-def search_from_history(title):
+def search_from_history(item):
     entry.delete(0, tk.END)
-    entry.insert(0, title)
-    search_movie()
+    entry.insert(0, item.title)
+    search_movie(imdb_id=item.imdb_id)
 
 def update_history_buttons():
-    for widget in history_frame.winfo_children():
-        widget.destroy()
-    
-    tk.Label(history_frame, text="📜 Historie:", font=("Segoe UI", 10, "bold"), fg=ACCENT_BLUE, bg=BG_SECONDARY).pack(anchor="w", padx=10, pady=(5, 5))
-    
-    for movie in search_history[:5]:
-        btn = tk.Button(
-            history_frame,
-            text=f"• {movie[:25]}{'...' if len(movie) > 25 else ''}",
-            font=("Segoe UI", 9),
-            bg=BG_TERTIARY,
-            fg=TEXT_PRIMARY,
-            activebackground=ACCENT_BLUE,
-            activeforeground="white",
-            relief="flat",
-            bd=0,
-            highlightthickness=0,
-            anchor="w",
-            command=lambda m=movie: search_from_history(m)
-        )
-        btn.pack(fill='x', padx=8, pady=2)
+    history_list.update(search_history.recent(5))
 
 def add_to_comparison():
-    global comparison_movies
-    if not current_movie_data:
+    if current_movie is None:
         messagebox.showwarning("Info", "Nejdřív si vyhledej film!")
         return
     
-    title = current_movie_data.get('Title', 'N/A')
-    if title not in [m.get('Title') for m in comparison_movies]:
-        comparison_movies.append(current_movie_data)
-        if len(comparison_movies) <= 3:
-            messagebox.showinfo("✓ Přidáno", f"Film '{title}' přidán!\n({len(comparison_movies)}/3)")
-            update_comparison_display()
-        else:
-            comparison_movies.pop()
-            messagebox.showwarning("Limit", "Max 3 filmy!")
+    title = current_movie.title
+    if comparison_table.append(current_movie):
+        messagebox.showinfo("✓ Přidáno", f"Film '{title}' přidán!\n({len(comparison_table)})")
+        update_comparison_display()
+        schedule_prefetch()
     else:
         messagebox.showinfo("Info", "Už v porovnání!")
 
-def rating_to_percentage(rating_str):
-    """Převede IMDB hodnocení na procenta"""
-    try:
-        rating = float(rating_str)
-        return int((rating / 10) * 100)
-    except:
-        return 0
-
-def get_rating_color(rating_str):
-    """Vrátí barvu podle hodnocení"""
-    try:
-        rating = float(rating_str)
-        if rating >= 8:
-            return ACCENT_GREEN
-        elif rating >= 7:
-            return ACCENT_BLUE
-        elif rating >= 6:
-            return ACCENT_PURPLE
-        else:
-            return ACCENT_PINK
-    except:
-        return TEXT_SECONDARY
+def load_comparison_poster_job(task, poster_url):
+    return poster_cache().load(poster_url, COMPARISON_POSTER_SIZE, lambda url, meta: download_poster(url, meta, timeout=5, task=task),
+                               stage=task.stage, on_preview=task.progress)
+
+def request_comparison_poster(poster_url):
+    worker.submit(load_comparison_poster_job, poster_url, group="comparison",
+                  on_progress=lambda task, img: show_comparison_poster(poster_url, img, final=False),
+                  on_done=lambda task, img: show_comparison_poster(poster_url, img),
+                  on_error=lambda task, error: show_comparison_poster(poster_url, None))
+
+def show_comparison_poster(poster_url, img, final=True):
+    if comparison_view is None or not comparison_view.exists():
+        return
+    photo = None
+    if img is not None:
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(img)
+    if final:
+        comparison_view.poster_ready(poster_url, photo)
+    else:
+        comparison_view.poster_preview(poster_url, photo)
+
+def comparison_score_job(task, movie):
+    return ratings().collect(movie)
+
+def request_comparison_score(movie):
+    aggregate = ratings().cached(movie)
+    if not aggregate.missing:
+        comparison_view.score_ready(movie.imdb_id, aggregate)
+        return
+    comparison_view.score_ready(movie.imdb_id, aggregate, final=False)
+    score_loader.request(movie, aggregate)
 
+def show_comparison_score(imdb_id, aggregate):
+    if comparison_view is not None and comparison_view.exists():
+        comparison_view.score_ready(imdb_id, aggregate)
+
+@timed("ui comparison")
 def show_comparison():
-    if len(comparison_movies) == 0:
+    global comparison_view
+    if len(comparison_table) == 0:
         messagebox.showinfo("Info", "Přidej alespoň 1 film!")
         return
-    
-    comp_window = tk.Toplevel(root)
-    comp_window.title("⚖️ Porovnání filmů/seriálů")
-    comp_window.geometry("1100x700")
-    comp_window.configure(bg=BG_PRIMARY)
-    
-    comp_canvas = tk.Canvas(comp_window, bg=BG_PRIMARY, highlightthickness=0)
-    comp_scrollbar = tk.Scrollbar(comp_window, orient="vertical", command=comp_canvas.yview)
-    comp_frame = tk.Frame(comp_canvas, bg=BG_PRIMARY)
-    
-    comp_frame.bind("<Configure>", lambda e: comp_canvas.configure(scrollregion=comp_canvas.bbox("all")))
-    comp_canvas.create_window((0, 0), window=comp_frame, anchor="nw")
-    comp_canvas.configure(yscrollcommand=comp_scrollbar.set)
-    
-    comp_canvas.pack(side="left", fill="both", expand=True)
-    comp_scrollbar.pack(side="right", fill="y")
-    
-    # Header
-    header = tk.Frame(comp_frame, bg=BG_PRIMARY)
-    header.pack(fill='x', padx=20, pady=20)
-    tk.Label(header, text="⚖️ Porovnání", font=("Segoe UI", 18, "bold"), fg=ACCENT_BLUE, bg=BG_PRIMARY).pack(side='left')
-    tk.Label(header, text=f"({len(comparison_movies)} film/seriál)", font=("Segoe UI", 11), fg=TEXT_SECONDARY, bg=BG_PRIMARY).pack(side='left', padx=(10, 0))
-    
-    # Sort by rating descending for better comparison
-    sorted_movies = sorted(comparison_movies, key=lambda x: float(x.get('imdbRating', '0')), reverse=True)
-    
-    for idx, movie in enumerate(sorted_movies, 1):
-        card = tk.Frame(comp_frame, bg=BG_TERTIARY, relief="flat", bd=1)
-        card.pack(fill='x', padx=15, pady=12)
-        
-        title = movie.get('Title', 'N/A')
-        year = movie.get('Year', 'N/A')
-        rating_str = movie.get('imdbRating', 'N/A')
-        percentage = rating_to_percentage(rating_str) if rating_str != 'N/A' else 0
-        genre = movie.get('Genre', 'N/A')
-        director = movie.get('Director', 'N/A')
-        runtime = movie.get('Runtime', 'N/A')
-        movie_type = movie.get('Type', 'N/A')
-        poster_url = movie.get("Poster")
-        
-        # Main container for horizontal layout
-        main_container = tk.Frame(card, bg=BG_TERTIARY)
-        main_container.pack(fill='both', expand=True, padx=14, pady=14)
-        
-        # Left side - Poster
-        poster_side = tk.Frame(main_container, bg=BG_SECONDARY, relief="flat", bd=0)
-        poster_side.pack(side='left', padx=(0, 16), pady=0)
-        
-        poster_display = tk.Label(poster_side, bg=BG_SECONDARY, text="Bez\nplakátu", fg=TEXT_SECONDARY, font=("Segoe UI", 9), width=12, height=16)
-        poster_display.pack()
-        
-        # Try to load poster image
-        if poster_url and poster_url != "N/A":
-            try:
-                poster_response = requests.get(poster_url, timeout=5)
-                poster_response.raise_for_status()
-                img_data = poster_response.content
-                img = Image.open(BytesIO(img_data)).convert("RGBA")
-                img = img.resize((100, 150), Image.LANCZOS)
-                poster_tk = ImageTk.PhotoImage(img)
-                poster_display.config(image=poster_tk, text='', width=100, height=150, bg=BG_SECONDARY)
-                poster_display.image = poster_tk
-            except Exception:
-                pass
-        
-        # Right side - Info
-        info_side = tk.Frame(main_container, bg=BG_TERTIARY)
-        info_side.pack(side='left', fill='both', expand=True)
-        
-        # Top section with title and year
-        top_section = tk.Frame(info_side, bg=BG_TERTIARY)
-        top_section.pack(fill='x', pady=(0, 10))
-        
-        tk.Label(top_section, text=f"{idx}. {title}", font=("Segoe UI", 13, "bold"), fg=ACCENT_BLUE, bg=BG_TERTIARY, wraplength=600, justify="left").pack(anchor="w")
-        tk.Label(top_section, text=f"{year} • {movie_type.upper()} • {runtime}", font=("Segoe UI", 9), fg=TEXT_SECONDARY, bg=BG_TERTIARY).pack(anchor="w", pady=(2, 0))
-        
-        # Rating section with progress bar
-        rating_section = tk.Frame(info_side, bg=BG_TERTIARY)
-        rating_section.pack(fill='x', pady=(0, 10))
-        
-        rating_color = get_rating_color(rating_str)
-        
-        # Rating display with percentage
-        rating_label_frame = tk.Frame(rating_section, bg=BG_TERTIARY)
-        rating_label_frame.pack(anchor="w")
-        
-        tk.Label(rating_label_frame, text="IMDb:", font=("Segoe UI", 10, "bold"), fg=TEXT_SECONDARY, bg=BG_TERTIARY).pack(side='left')
-        tk.Label(rating_label_frame, text=f"  {rating_str}/10", font=("Segoe UI", 11, "bold"), fg=rating_color, bg=BG_TERTIARY).pack(side='left')
-        tk.Label(rating_label_frame, text=f"  ({percentage}%)", font=("Segoe UI", 10), fg=rating_color, bg=BG_TERTIARY).pack(side='left', padx=(4, 0))
-        
-        # Visual progress bar
-        progress_frame = tk.Frame(rating_section, bg=BG_SECONDARY, height=8)
-        progress_frame.pack(fill='x', pady=(6, 0))
-        
-        if percentage > 0:
-            bar_width = int(percentage * 3.5)  # Scale to fit
-            bar = tk.Frame(progress_frame, bg=rating_color, height=8)
-            bar.place(x=0, y=0, width=bar_width, height=8)
-        
-        # Info section
-        info_section = tk.Frame(info_side, bg=BG_TERTIARY)
-        info_section.pack(fill='x', pady=(0, 0))
-        
-        # Genre line
-        genre_frame = tk.Frame(info_section, bg=BG_TERTIARY)
-        genre_frame.pack(anchor="w")
-        tk.Label(genre_frame, text="🎭", font=("Segoe UI", 9), fg=TEXT_SECONDARY, bg=BG_TERTIARY).pack(side='left')
-        tk.Label(genre_frame, text=genre, font=("Segoe UI", 9), fg=TEXT_SECONDARY, bg=BG_TERTIARY, justify="left").pack(side='left', anchor="w")
-        
-        # Director line
-        director_frame = tk.Frame(info_section, bg=BG_TERTIARY)
-        director_frame.pack(anchor="w", pady=(2, 0))
-        tk.Label(director_frame, text="📽️", font=("Segoe UI", 9), fg=TEXT_SECONDARY, bg=BG_TERTIARY).pack(side='left')
-        tk.Label(director_frame, text=f"Režie: {director}", font=("Segoe UI", 9), fg=TEXT_SECONDARY, bg=BG_TERTIARY, justify="left").pack(side='left', anchor="w")
+
+    # The window and its cards are reused while it stays open
+    if comparison_view is None or not comparison_view.exists():
+        comparison_view = ComparisonView(root, theme, request_comparison_poster, request_comparison_score)
+        window = comparison_view.window
+        window.bind("<Destroy>", lambda e: close_comparison_jobs() if e.widget is window else None, add="+")
+    comparison_view.show(comparison_table)
+    trace_layout("ui comparison layout")
+
+def close_comparison_jobs():
+    worker.cancel("comparison")
+    score_loader.cancel()
+
+def season_job(task, imdb_id, season):
+    return fetch_season(imdb_id, season, http(), response_cache(), scheduler().lane(USER), task.stage)
+
+def show_series():
+    """Sezóny a epizody seriálu - stahují se souběžně a vykreslují postupně"""
+    global series_view, series_stats
+    if current_movie is None or current_movie.type != 'series':
+        messagebox.showinfo("Info", "Nejdřív si vyhledej seriál!")
+        return
+    total_seasons = current_movie.total_seasons
+    if not total_seasons:
+        messagebox.showinfo("Info", "OMDb neuvádí počet sezón.")
+        return
+
+    if series_view is None or not series_view.exists():
+        series_view = SeriesView(root, theme, open_episode)
+        window = series_view.window
+        window.bind("<Destroy>", lambda e: series_loader.cancel() if e.widget is window else None, add="+")
+    series_stats = SeriesStats(current_movie.runtime)
+    series_view.start(current_movie.title, total_seasons)
+    series_loader.start(current_movie.imdb_id, total_seasons)
+
+def show_season(season, data):
+    if series_view is None or not series_view.exists():
+        return
+    if data.get("Response") == "False":
+        series_view.season_failed(season, data.get("Error", "Sezóna nebyla nalezena"))
+        return
+    summary = series_stats.add_season(season, data.get("Episodes", []))
+    series_view.show_season(season, summary, series_stats.seasons[season])
+    series_view.show_summary(series_stats.totals())
+
+def show_season_error(season, error):
+    if series_view is not None and series_view.exists():
+        series_view.season_failed(season, f"❌ Chyba: {str(error)[:60]}")
+
+def open_episode(episode):
+    entry.delete(0, tk.END)
+    entry.insert(0, episode.get('Title', ''))
+    search_movie(imdb_id=episode.get('imdbID'))
 
 def clear_comparison():
-    global comparison_movies
-    comparison_movies = []
+    global comparison_table
+    comparison_table = MovieTable()
     update_comparison_display()
     messagebox.showinfo("✓", "Porovnání vymazáno!")
 
 def update_comparison_display():
-    count = len(comparison_movies)
-    comp_btn.config(text=f"⚖️ Porovnání ({count}/3)")
-
-root = tk.Tk()
-root.title("🎬 MovieExplorer")
-root.configure(bg=BG_PRIMARY)
-root.geometry("1500x900")
-root.minsize(1100, 750)
-
-load_search_history()
+    count = len(comparison_table)
+    comp_btn.config(text=f"⚖️ Porovnání ({count})")
+    if comparison_view is not None and comparison_view.exists():
+        comparison_view.show(comparison_table)
 
 root_dir = Path(__file__).resolve().parent
-logo_path = root_dir / "logo.png"
-logo2_path = root_dir / "logo2.png"
-logo_tk = None
-
-def load_logo():
-    """Load appropriate logo based on dark_mode"""
-    global logo_tk
-    try:
-        if dark_mode:
-            path = logo_path
-        else:
-            path = logo2_path
-        
-        if path.exists():
-            logo = Image.open(path).convert("RGBA")
+logo_paths = {"dark": root_dir / "logo.png", "light": root_dir / "logo2.png"}
+logo_images = {}
+
+def on_close():
+    worker.shutdown()
+    search_history.close()
+    if response_cache.created:
+        response_cache().close()
+    if http.created:
+        http().close()
+    if offline.created and offline().catalog is not None:
+        offline().catalog.close()
+    if ratings.created:
+        ratings().close()
+    if scheduler.created:
+        scheduler().close()
+    root.destroy()
+
+def load_logo(name):
+    """Dekóduje logo pro daný motiv jen jednou"""
+    if name not in logo_images:
+        try:
+            from PIL import Image, ImageTk
+            logo = Image.open(logo_paths[name]).convert("RGBA")
             logo = logo.resize((420, 100), Image.LANCZOS)
-            logo_tk = ImageTk.PhotoImage(logo)
-            if logo_label:
-                logo_label.config(image=logo_tk)
-    except:
-        pass
+            logo_images[name] = ImageTk.PhotoImage(logo)
+        except Exception:
+            logo_images[name] = None
+    return logo_images[name]
 
-header_frame = tk.Frame(root, bg=BG_SECONDARY, height=120)
-header_frame.pack(fill='x', pady=0)
-header_frame.pack_propagate(False)
+def show_logo():
+    logo = load_logo(theme.name)
+    if logo is not None:
+        logo_label.config(image=logo)
 
-separator = tk.Frame(header_frame, bg=ACCENT_BLUE, height=2)
-separator.pack(side='bottom', fill='x')
+def update_plot(text):
+    plot_text.config(state='normal')
+    plot_text.delete('1.0', 'end')
+    plot_text.insert('1.0', text)
+    plot_text.config(state='disabled')
 
-logo_label = tk.Label(header_frame, bg=BG_SECONDARY)
-logo_label.pack(side='left', padx=24, pady=12)
+def warm_up(task):
+    """Na pozadí po prvním snímku načte requests, PIL a cache"""
+    response_cache()
+    http()
+    poster_cache()
+    title_index()
+    offline()
+    scheduler()
+
+def on_first_frame(event):
+    global time_to_first_frame
+    if event.widget is not root or time_to_first_frame is not None:
+        return
+    time_to_first_frame = (time.perf_counter() - START_TIME) * 1000
+    if os.environ.get("MOVIEVIEWER_STARTUP_TIMING"):
+        print(f"time to first frame: {time_to_first_frame:.0f} ms", file=sys.stderr)
+    # Logo decode and heavy imports wait until the window is on screen
+    root.after(1, show_logo)
+    root.after(200, lambda: load_logo("light" if dark_mode else "dark"))
+    worker.submit(warm_up, group="warm-up", on_done=lambda task, result: schedule_prefetch())
 
-load_logo()
+def build_window():
+    """Hlavní okno a jeho widgety - vzniká až v main(), samotný import modulu nic neotevírá"""
+    global root, worker, prefetcher, series_loader, score_loader, logo_label, theme_btn, entry, suggest_list, \
+        comp_btn, status_label, history_list, title_var, year_var, genre_var, ratings_var, poster_label, \
+        add_comp_btn, series_btn, plot_var, plot_text
+    root = tk.Tk()
+    root.title("🎬 MovieExplorer")
+    theme.register(root, bg="BG_PRIMARY")
+    root.geometry("1500x900")
+    root.minsize(1100, 750)
 
-theme_btn = tk.Button(header_frame, text="🌙 Dark", font=("Segoe UI", 10, "bold"), bg=ACCENT_PURPLE, fg="white", activebackground="#9d6ddb", relief="flat", bd=0, padx=12, pady=8, highlightthickness=0, highlightcolor=ACCENT_PURPLE, highlightbackground=ACCENT_PURPLE, command=toggle_dark_mode)
-theme_btn.pack(side='right', padx=24, pady=12)
+    worker = Worker(max_workers=8)
+    worker.attach(root)
+    prefetcher = Prefetcher(root, worker, prefetch_job, prefetch_idle)
+    series_loader = SeriesLoader(worker, season_job, show_season, show_season_error, parallel=SERIES_PARALLEL)
+    score_loader = ScoreLoader(worker, comparison_score_job, show_comparison_score, parallel=COMPARISON_SCORE_PARALLEL)
 
-search_section = tk.Frame(root, bg=BG_SECONDARY, height=100)
-search_section.pack(fill='x', padx=0, pady=0)
-search_section.pack_propagate(False)
+    root.protocol("WM_DELETE_WINDOW", on_close)
 
-search_inner = tk.Frame(search_section, bg=BG_SECONDARY)
-search_inner.pack(fill='both', expand=True, padx=28, pady=16)
+    header_frame = theme.register(tk.Frame(root, height=120), bg="BG_SECONDARY")
+    header_frame.pack(fill='x', pady=0)
+    header_frame.pack_propagate(False)
 
-search_label = tk.Label(search_inner, text="🔎 Vyhledej film nebo seriál", font=("Segoe UI", 14, "bold"), fg=ACCENT_BLUE, bg=BG_SECONDARY)
-search_label.pack(anchor="w", pady=(0, 12))
+    separator = theme.register(tk.Frame(header_frame, height=2), bg="ACCENT_BLUE")
+    separator.pack(side='bottom', fill='x')
 
-entry_frame = tk.Frame(search_inner, bg=BG_SECONDARY)
-entry_frame.pack(fill='x', pady=0)
+    logo_label = theme.register(tk.Label(header_frame), bg="BG_SECONDARY")
+    logo_label.pack(side='left', padx=24, pady=12)
 
-entry = tk.Entry(entry_frame, width=60, font=("Segoe UI", 13), bg=BG_TERTIARY, fg=TEXT_PRIMARY, insertbackground=ACCENT_BLUE, relief="flat", bd=0, highlightthickness=0)
-entry.pack(side='left', fill='x', expand=True, ipady=12)
-entry.bind('<Return>', lambda e: search_movie())
+    theme_btn = theme.register(tk.Button(header_frame, text="🌙 Dark", font=("Segoe UI", 10, "bold"), fg="white", activebackground="#9d6ddb", relief="flat", bd=0, padx=12, pady=8, highlightthickness=0, command=toggle_dark_mode), bg="ACCENT_PURPLE", highlightcolor="ACCENT_PURPLE", highlightbackground="ACCENT_PURPLE")
+    theme_btn.pack(side='right', padx=24, pady=12)
 
-search_btn = tk.Button(entry_frame, text="🔍 Hledej", font=("Segoe UI", 12, "bold"), bg=ACCENT_PINK, fg="white", activebackground="#e61e63", relief="flat", bd=0, padx=28, pady=12, highlightthickness=0, highlightcolor=ACCENT_PINK, highlightbackground=ACCENT_PINK, command=search_movie)
-search_btn.pack(side='left', padx=(14, 0))
+    diag_btn = theme.register(tk.Button(header_frame, text="📊", font=("Segoe UI", 10, "bold"), fg="white", activebackground="#0099cc", relief="flat", bd=0, padx=10, pady=8, highlightthickness=0, command=toggle_diagnostics), bg="ACCENT_BLUE", highlightcolor="ACCENT_BLUE", highlightbackground="ACCENT_BLUE")
+    diag_btn.pack(side='right', pady=12)
+    root.bind("<F12>", toggle_diagnostics)
 
-comp_btn = tk.Button(entry_frame, text="⚖️ Porovnání (0/3)", font=("Segoe UI", 11, "bold"), bg=ACCENT_PURPLE, fg="white", activebackground="#9d6ddb", relief="flat", bd=0, padx=16, pady=12, highlightthickness=0, highlightcolor=ACCENT_PURPLE, highlightbackground=ACCENT_PURPLE, command=show_comparison)
-comp_btn.pack(side='left', padx=(8, 0))
+    search_section = theme.register(tk.Frame(root, height=100), bg="BG_SECONDARY")
+    search_section.pack(fill='x', padx=0, pady=0)
+    search_section.pack_propagate(False)
 
-status_label = tk.Label(search_inner, text="Začni psaním...", font=("Segoe UI", 10), fg=TEXT_SECONDARY, bg=BG_SECONDARY)
-status_label.pack(anchor="w", pady=(12, 0))
+    search_inner = theme.register(tk.Frame(search_section), bg="BG_SECONDARY")
+    search_inner.pack(fill='both', expand=True, padx=28, pady=16)
 
-main_frame = tk.Frame(root, bg=BG_PRIMARY)
-main_frame.pack(fill='both', expand=True, padx=28, pady=20)
+    search_label = theme.register(tk.Label(search_inner, text="🔎 Vyhledej film nebo seriál", font=("Segoe UI", 14, "bold")), fg="ACCENT_BLUE", bg="BG_SECONDARY")
+    search_label.pack(anchor="w", pady=(0, 12))
 
-history_panel = tk.Frame(main_frame, bg=BG_SECONDARY, width=180)
-history_panel.pack(side='left', fill='y', padx=(0, 20))
-history_panel.pack_propagate(False)
+    entry_frame = theme.register(tk.Frame(search_inner), bg="BG_SECONDARY")
+    entry_frame.pack(fill='x', pady=0)
 
-history_frame = tk.Frame(history_panel, bg=BG_SECONDARY)
-history_frame.pack(fill='both', expand=True, padx=0, pady=10)
+    entry = theme.register(tk.Entry(entry_frame, width=60, font=("Segoe UI", 13), relief="flat", bd=0, highlightthickness=0), bg="BG_TERTIARY", fg="TEXT_PRIMARY", insertbackground="ACCENT_BLUE")
+    entry.pack(side='left', fill='x', expand=True, ipady=12)
+    entry.bind('<Return>', lambda e: search_movie())
+    entry.bind('<KeyRelease>', cancel_stale_search)
+    entry.bind('<KeyRelease>', on_entry_key, add="+")
+    entry.bind('<FocusOut>', hide_suggestions_on_blur)
 
-update_history_buttons()
+    suggest_list = theme.register(tk.Listbox(root, font=("Segoe UI", 11), selectforeground="white", relief="flat", bd=0, highlightthickness=0, activestyle="none", height=8), bg="BG_TERTIARY", fg="TEXT_PRIMARY", selectbackground="ACCENT_BLUE")
+    suggest_list.bind('<ButtonRelease-1>', choose_suggestion)
+    suggest_list.bind('<Return>', choose_suggestion)
+    suggest_list.bind('<Escape>', lambda e: (hide_suggestions(), entry.focus_set()))
+    suggest_list.bind('<FocusOut>', hide_suggestions_on_blur)
 
-content_frame = tk.Frame(main_frame, bg=BG_PRIMARY)
-content_frame.pack(side='left', fill='both', expand=True)
+    search_btn = theme.register(tk.Button(entry_frame, text="🔍 Hledej", font=("Segoe UI", 12, "bold"), fg="white", activebackground="#e61e63", relief="flat", bd=0, padx=28, pady=12, highlightthickness=0, command=search_movie), bg="ACCENT_PINK", highlightcolor="ACCENT_PINK", highlightbackground="ACCENT_PINK")
+    search_btn.pack(side='left', padx=(14, 0))
 
-canvas = tk.Canvas(content_frame, bg=BG_PRIMARY, highlightthickness=0)
-scrollbar = tk.Scrollbar(content_frame, orient="vertical", command=canvas.yview, bg=BG_SECONDARY, activebackground=ACCENT_BLUE, width=14)
-scrollable_frame = tk.Frame(canvas, bg=BG_PRIMARY)
+    comp_btn = theme.register(tk.Button(entry_frame, text="⚖️ Porovnání (0)", font=("Segoe UI", 11, "bold"), fg="white", activebackground="#9d6ddb", relief="flat", bd=0, padx=16, pady=12, highlightthickness=0, command=show_comparison), bg="ACCENT_PURPLE", highlightcolor="ACCENT_PURPLE", highlightbackground="ACCENT_PURPLE")
+    comp_btn.pack(side='left', padx=(8, 0))
 
-scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+    status_label = theme.register(tk.Label(search_inner, text="Začni psaním...", font=("Segoe UI", 10)), fg="TEXT_SECONDARY", bg="BG_SECONDARY")
+    status_label.pack(anchor="w", pady=(12, 0))
 
-canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-canvas.configure(yscrollcommand=scrollbar.set)
+    main_frame = theme.register(tk.Frame(root), bg="BG_PRIMARY")
+    main_frame.pack(fill='both', expand=True, padx=28, pady=20)
 
-canvas.pack(side="left", fill="both", expand=True)
-scrollbar.pack(side="right", fill="y")
+    history_panel = theme.register(tk.Frame(main_frame, width=180), bg="BG_SECONDARY")
+    history_panel.pack(side='left', fill='y', padx=(0, 20))
+    history_panel.pack_propagate(False)
 
-title_card = tk.Frame(scrollable_frame, bg=BG_TERTIARY)
-title_card.pack(fill='x', pady=(0, 18))
+    history_frame = theme.register(tk.Frame(history_panel), bg="BG_SECONDARY")
+    history_frame.pack(fill='both', expand=True, padx=0, pady=10)
 
-title_var = tk.StringVar()
-title_label = tk.Label(title_card, textvariable=title_var, font=("Segoe UI", 26, "bold"), fg=ACCENT_BLUE, bg=BG_TERTIARY, wraplength=1100, justify="left")
-title_label.pack(anchor="w", padx=18, pady=16)
+    history_list = HistoryList(history_frame, theme, search_from_history)
 
-info_card = tk.Frame(scrollable_frame, bg=BG_TERTIARY)
-info_card.pack(fill='x', pady=(0, 18))
+    update_history_buttons()
 
-year_var = tk.StringVar()
-year_label = tk.Label(info_card, textvariable=year_var, font=("Segoe UI", 12), fg=ACCENT_PURPLE, bg=BG_TERTIARY)
-year_label.pack(anchor="w", padx=18, pady=(12, 4))
+    content_frame = theme.register(tk.Frame(main_frame), bg="BG_PRIMARY")
+    content_frame.pack(side='left', fill='both', expand=True)
 
-genre_var = tk.StringVar()
-genre_label = tk.Label(info_card, textvariable=genre_var, font=("Segoe UI", 11), fg=TEXT_SECONDARY, bg=BG_TERTIARY, wraplength=1100, justify="left")
-genre_label.pack(anchor="w", padx=18, pady=(0, 12))
+    canvas = theme.register(tk.Canvas(content_frame, highlightthickness=0), bg="BG_PRIMARY")
+    scrollbar = theme.register(tk.Scrollbar(content_frame, orient="vertical", command=canvas.yview, width=14), bg="BG_SECONDARY", activebackground="ACCENT_BLUE")
+    scrollable_frame = theme.register(tk.Frame(canvas), bg="BG_PRIMARY")
 
-details_frame = tk.Frame(scrollable_frame, bg=BG_PRIMARY)
-details_frame.pack(fill='both', expand=True, pady=(0, 24))
+    scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
 
-poster_frame = tk.Frame(details_frame, bg=BG_TERTIARY)
-poster_frame.pack(side='left', padx=(0, 24), pady=0)
+    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
 
-poster_label = tk.Label(poster_frame, bg=BG_TERTIARY, text="Bez\nplakátu", fg=TEXT_SECONDARY, font=("Segoe UI", 11), width=20, height=14)
-poster_label.pack(padx=14, pady=14)
-poster_label.current_image = None
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
 
-right_frame = tk.Frame(details_frame, bg=BG_PRIMARY)
-right_frame.pack(side='left', fill='both', expand=True)
+    title_card = theme.register(tk.Frame(scrollable_frame), bg="BG_TERTIARY")
+    title_card.pack(fill='x', pady=(0, 18))
 
-add_comp_btn = tk.Button(right_frame, text="⭐ Přidat k porovnání", font=("Segoe UI", 10, "bold"), bg=ACCENT_GREEN, fg="white", activebackground="#00cc55", relief="flat", bd=0, padx=12, pady=8, highlightthickness=0, highlightcolor=ACCENT_GREEN, highlightbackground=ACCENT_GREEN, command=add_to_comparison)
-add_comp_btn.pack(anchor="w", pady=(0, 10))
+    title_var = tk.StringVar()
+    title_label = theme.register(tk.Label(title_card, textvariable=title_var, font=("Segoe UI", 26, "bold"), wraplength=1100, justify="left"), fg="ACCENT_BLUE", bg="BG_TERTIARY")
+    title_label.pack(anchor="w", padx=18, pady=16)
 
-clear_comp_btn = tk.Button(right_frame, text="🗑️ Vymazat porovnání", font=("Segoe UI", 9), bg=ACCENT_PINK, fg="white", activebackground="#e61e63", relief="flat", bd=0, padx=12, pady=6, highlightthickness=0, highlightcolor=ACCENT_PINK, highlightbackground=ACCENT_PINK, command=clear_comparison)
-clear_comp_btn.pack(anchor="w", pady=(0, 12))
+    info_card = theme.register(tk.Frame(scrollable_frame), bg="BG_TERTIARY")
+    info_card.pack(fill='x', pady=(0, 18))
 
-plot_var = tk.StringVar()
-plot_text = scrolledtext.ScrolledText(right_frame, width=92, height=26, font=("Segoe UI", 11), fg=TEXT_PRIMARY, bg=BG_TERTIARY, wrap='word', relief="flat", bd=0)
-plot_text.pack(fill='both', expand=True)
-plot_text.config(state='disabled')
+    year_var = tk.StringVar()
+    year_label = theme.register(tk.Label(info_card, textvariable=year_var, font=("Segoe UI", 12)), fg="ACCENT_PURPLE", bg="BG_TERTIARY")
+    year_label.pack(anchor="w", padx=18, pady=(12, 4))
 
-def update_plot(text):
-    plot_text.config(state='normal')
-    plot_text.delete('1.0', 'end')
-    plot_text.insert('1.0', text)
+    genre_var = tk.StringVar()
+    genre_label = theme.register(tk.Label(info_card, textvariable=genre_var, font=("Segoe UI", 11), wraplength=1100, justify="left"), fg="TEXT_SECONDARY", bg="BG_TERTIARY")
+    genre_label.pack(anchor="w", padx=18, pady=(0, 4))
+
+    ratings_var = tk.StringVar()
+    ratings_label = theme.register(tk.Label(info_card, textvariable=ratings_var, font=("Segoe UI", 11, "bold"), wraplength=1100, justify="left"), fg="ACCENT_GREEN", bg="BG_TERTIARY")
+    ratings_label.pack(anchor="w", padx=18, pady=(0, 12))
+
+    details_frame = theme.register(tk.Frame(scrollable_frame), bg="BG_PRIMARY")
+    details_frame.pack(fill='both', expand=True, pady=(0, 24))
+
+    poster_frame = theme.register(tk.Frame(details_frame), bg="BG_TERTIARY")
+    poster_frame.pack(side='left', padx=(0, 24), pady=0)
+
+    poster_label = theme.register(tk.Label(poster_frame, text="Bez\nplakátu", font=("Segoe UI", 11), width=20, height=14), bg="BG_TERTIARY", fg="TEXT_SECONDARY")
+    poster_label.pack(padx=14, pady=14)
+    poster_label.current_image = None
+
+    right_frame = theme.register(tk.Frame(details_frame), bg="BG_PRIMARY")
+    right_frame.pack(side='left', fill='both', expand=True)
+
+    add_comp_btn = theme.register(tk.Button(right_frame, text="⭐ Přidat k porovnání", font=("Segoe UI", 10, "bold"), fg="white", activebackground="#00cc55", relief="flat", bd=0, padx=12, pady=8, highlightthickness=0, command=add_to_comparison), bg="ACCENT_GREEN", highlightcolor="ACCENT_GREEN", highlightbackground="ACCENT_GREEN")
+    add_comp_btn.pack(anchor="w", pady=(0, 10))
+
+    series_btn = theme.register(tk.Button(right_frame, text="📺 Sezóny a epizody", font=("Segoe UI", 10, "bold"), fg="white", activebackground="#0099cc", relief="flat", bd=0, padx=12, pady=8, highlightthickness=0, command=show_series), bg="ACCENT_BLUE", highlightcolor="ACCENT_BLUE", highlightbackground="ACCENT_BLUE")
+
+    clear_comp_btn = theme.register(tk.Button(right_frame, text="🗑️ Vymazat porovnání", font=("Segoe UI", 9), fg="white", activebackground="#e61e63", relief="flat", bd=0, padx=12, pady=6, highlightthickness=0, command=clear_comparison), bg="ACCENT_PINK", highlightcolor="ACCENT_PINK", highlightbackground="ACCENT_PINK")
+    clear_comp_btn.pack(anchor="w", pady=(0, 12))
+
+    plot_var = tk.StringVar()
+    plot_text = theme.register(scrolledtext.ScrolledText(right_frame, width=92, height=26, font=("Segoe UI", 11), wrap='word', relief="flat", bd=0), fg="TEXT_PRIMARY", bg="BG_TERTIARY")
+    plot_text.pack(fill='both', expand=True)
     plot_text.config(state='disabled')
 
-plot_var.trace('w', lambda *args: update_plot(plot_var.get()))
+    plot_var.trace('w', lambda *args: update_plot(plot_var.get()))
+
+    root.bind("<Map>", on_first_frame, add="+")
+
+def main():
+    load_search_history()
+    build_window()
+    root.mainloop()
 
-root.mainloop()
+if __name__ == "__main__":
+    main()
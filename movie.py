@@ -0,0 +1,142 @@
+import math
+import sys
+
+NA = "N/A"
+
+
+def na(value):
+    """OMDb 'N/A' a prázdné hodnoty -> None; jediné místo, které tuhle konvenci zná"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if not value or value == NA else value
+
+
+def parse_number(value):
+    """'7.1' / '1,234,567' / '$292,587,330' / '142 min' -> číslo; None, když chybí"""
+    value = na(value)
+    if value is None:
+        return None
+    token = value.split()[0].replace(",", "").lstrip("$")
+    try:
+        number = float(token)
+    except ValueError:
+        return None
+    # float() also accepts 'nan' and 'inf', which no OMDb field means
+    if not math.isfinite(number):
+        return None
+    return int(number) if number.is_integer() and "." not in token else number
+
+
+def parse_year(value):
+    """'2008' / '2010–2015' -> 2008 / 2010"""
+    value = na(value)
+    return int(value[:4]) if value is not None and value[:4].isdigit() else None
+
+
+def _interned(value):
+    value = na(value)
+    return sys.intern(value) if value is not None else None
+
+
+class Movie:
+    """Kompaktní záznam filmu - __slots__, čísla převedená jednou, opakované řetězce internované
+
+    Chybějící hodnoty jsou None; get() vrací hodnoty ve tvaru OMDb (včetně 'N/A').
+    """
+
+    __slots__ = (
+        "imdb_id", "title", "year", "year_start", "rated", "released", "runtime", "genre",
+        "director", "writer", "actors", "plot", "language", "country", "awards", "poster",
+        "rating", "votes", "metascore", "box_office", "type", "total_seasons", "ratings",
+    )
+
+    def __init__(self, imdb_id, title, **fields):
+        self.imdb_id = imdb_id
+        self.title = title
+        for name in self.__slots__[2:]:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_omdb(cls, data):
+        """Převede odpověď OMDb (dict) na Movie"""
+        ratings = tuple(
+            (sys.intern(r.get("Source", "")), r.get("Value", ""))
+            for r in data.get("Ratings") or ()
+        )
+        return cls(
+            na(data.get("imdbID")),
+            na(data.get("Title")) or NA,
+            year=na(data.get("Year")),
+            year_start=parse_year(data.get("Year")),
+            rated=_interned(data.get("Rated")),
+            released=na(data.get("Released")),
+            runtime=parse_number(data.get("Runtime")),
+            genre=_interned(data.get("Genre")),
+            director=_interned(data.get("Director")),
+            writer=na(data.get("Writer")),
+            actors=na(data.get("Actors")),
+            plot=na(data.get("Plot")),
+            language=_interned(data.get("Language")),
+            country=_interned(data.get("Country")),
+            awards=na(data.get("Awards")),
+            poster=na(data.get("Poster")),
+            rating=parse_number(data.get("imdbRating")),
+            votes=parse_number(data.get("imdbVotes")),
+            metascore=parse_number(data.get("Metascore")),
+            box_office=parse_number(data.get("BoxOffice")),
+            type=_interned(data.get("Type")),
+            total_seasons=parse_number(data.get("totalSeasons")),
+            ratings=ratings,
+        )
+
+    def get(self, field, default=NA):
+        """Hodnota pole pod názvem z OMDb ('imdbRating', 'Runtime', ...) jako text"""
+        getter = _FIELDS.get(field)
+        value = getter(self) if getter is not None else None
+        return default if value is None else value
+
+    def to_omdb(self):
+        data = {field: self.get(field) for field in _FIELDS}
+        data["Ratings"] = [{"Source": source, "Value": value} for source, value in self.ratings]
+        return data
+
+    def __repr__(self):
+        return f"Movie({self.imdb_id!r}, {self.title!r})"
+
+
+def _format(template):
+    def getter(value):
+        return template.format(value) if value is not None else None
+    return getter
+
+
+_runtime = _format("{} min")
+_rating = _format("{:.1f}")
+_votes = _format("{:,}")
+_box_office = _format("${:,}")
+_number = _format("{}")
+
+_FIELDS = {
+    "imdbID": lambda m: m.imdb_id,
+    "Title": lambda m: m.title,
+    "Year": lambda m: m.year,
+    "Rated": lambda m: m.rated,
+    "Released": lambda m: m.released,
+    "Runtime": lambda m: _runtime(m.runtime),
+    "Genre": lambda m: m.genre,
+    "Director": lambda m: m.director,
+    "Writer": lambda m: m.writer,
+    "Actors": lambda m: m.actors,
+    "Plot": lambda m: m.plot,
+    "Language": lambda m: m.language,
+    "Country": lambda m: m.country,
+    "Awards": lambda m: m.awards,
+    "Poster": lambda m: m.poster,
+    "imdbRating": lambda m: _rating(m.rating),
+    "imdbVotes": lambda m: _votes(m.votes),
+    "Metascore": lambda m: _number(m.metascore),
+    "BoxOffice": lambda m: _box_office(m.box_office),
+    "Type": lambda m: m.type,
+    "totalSeasons": lambda m: _number(m.total_seasons),
+}
@@ -0,0 +1,105 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+
+def percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    low = int(k)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (k - low)
+
+
+class Recorder:
+    """Měření horkých cest - časy fází pro p50/p95 a poslední události pro trace"""
+
+    def __init__(self, max_events=5000, max_samples=500):
+        self._events = deque(maxlen=max_events)
+        self._samples = defaultdict(lambda: deque(maxlen=max_samples))
+        self._counters = defaultdict(int)
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def record(self, name, start, duration, **args):
+        """Zapíše hotový úsek (start a duration v sekundách z perf_counter)"""
+        event = (name, start, duration, threading.get_ident(), args or None)
+        with self._lock:
+            self._events.append(event)
+            self._samples[name].append(duration * 1000)
+
+    @contextmanager
+    def span(self, name, **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - start, **args)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self._counters[name] += n
+
+    def stats(self):
+        """{fáze: {n, p50_ms, p95_ms, max_ms}} z posledních vzorků"""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        return {
+            name: {"n": len(values), "p50_ms": percentile(values, 50), "p95_ms": percentile(values, 95), "max_ms": max(values)}
+            for name, values in samples.items() if values
+        }
+
+    def counters(self):
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+            self._samples.clear()
+            self._counters.clear()
+
+    def chrome_trace(self):
+        """Události ve formátu Chrome trace (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+        trace = [
+            {
+                "name": name, "ph": "X", "pid": pid, "tid": tid,
+                "ts": round((start - self._origin) * 1e6, 1), "dur": round(duration * 1e6, 1),
+                **({"args": args} if args else {}),
+            }
+            for name, start, duration, tid, args in events
+        ]
+        names = {threading.main_thread().ident: "tk"}
+        names.update((t.ident, t.name) for t in threading.enumerate())
+        trace.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": names.get(tid, str(tid))}}
+            for tid in {event[3] for event in events}
+        )
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def timed(name):
+    """Dekorátor - celé volání funkce jako jeden úsek"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with recorder.span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+recorder = Recorder()
@@ -0,0 +1,222 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+from core import no_stage
+
+
+def _open(data, size):
+    """Otevře obrázek; JPEG rovnou dekóduje v DCT měřítku nejblíž nad cílovou velikostí"""
+    img = Image.open(BytesIO(data))
+    if img.format == "JPEG":
+        img.draft("RGB", size)
+    return img
+
+
+def _opaque(img):
+    """Převod do RGB/RGBA - alfa kanál jen pro obrázky, které průhlednost opravdu mají"""
+    if img.mode in ("RGB", "RGBA"):
+        return img
+    if img.mode in ("LA", "PA", "RGBa") or "transparency" in img.info:
+        return img.convert("RGBA")
+    return img.convert("RGB")
+
+
+def fit(data, size):
+    """Zmenší originál na size; velké obrázky nejdřív hrubě (draft/reduce), pak LANCZOS"""
+    img = _opaque(_open(data, size))
+    return img.resize(size, Image.LANCZOS, reducing_gap=3.0)
+
+
+def preview(data, size):
+    """Rychlý rozmazaný náhled z JPEG dekódovaného ve zlomku rozlišení
+
+    None, pokud se nevyplatí - jiný formát nebo tak malý originál, že hotový obrázek je hned.
+    """
+    img = Image.open(BytesIO(data))
+    if img.format != "JPEG" or img.width < 4 * size[0] or img.height < 4 * size[1]:
+        return None
+    img.draft("RGB", (max(size[0] // 4, 1), max(size[1] // 4, 1)))
+    return _opaque(img).resize(size, Image.BILINEAR)
+
+
+class PosterCache:
+    """Cache plakátů podle hashe URL - originál jednou a k tomu hotové zmenšené varianty"""
+
+    def __init__(self, directory, max_bytes=200 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._files = OrderedDict()
+        self._total = 0
+        self.counters = {"variant_hits": 0, "original_hits": 0, "downloads": 0, "not_modified": 0, "stale": 0, "evictions": 0}
+
+        entries = []
+        for path in self.directory.iterdir():
+            if path.suffix in (".orig", ".png", ".json"):
+                st = path.stat()
+                entries.append((st.st_mtime, path.name, st.st_size))
+        for _, name, size in sorted(entries):
+            self._files[name] = size
+            self._total += size
+
+    @staticmethod
+    def digest(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:40]
+
+    def load(self, url, size, fetch, stage=no_stage, on_preview=None):
+        """Vrátí PIL obrázek v dané velikosti; stahuje a zmenšuje jen když je to nutné
+
+        fetch(url, meta) vrací (data, meta); data je None, pokud server odpověděl 304.
+        on_preview(img) dostane hrubý náhled, pokud na hotový obrázek bude třeba čekat.
+        """
+        digest = self.digest(url)
+        variant_name = f"{digest}_{size[0]}x{size[1]}.png"
+        original_name = f"{digest}.orig"
+        original = None
+
+        meta = self._read_meta(digest)
+        if meta is not None and meta.get("expires", 0) <= time.time():
+            # Stale entry - revalidate with ETag/Last-Modified
+            original = self._read(original_name)
+            if on_preview is not None and self._preview_from_variant(digest, size, on_preview):
+                on_preview = None
+            try:
+                with stage("plakát"):
+                    data, meta = fetch(url, meta if original is not None else None)
+            except OSError:
+                # No network - a stale poster is better than none
+                if original is None:
+                    raise
+                self.counters["stale"] += 1
+            else:
+                self._write_meta(digest, meta)
+                if data is None:
+                    self.counters["not_modified"] += 1
+                else:
+                    self.counters["downloads"] += 1
+                    if data != original:
+                        self._discard_variants(digest)
+                        self._write(original_name, data)
+                    original = data
+
+        data = self._read(variant_name)
+        if data is not None:
+            self.counters["variant_hits"] += 1
+            img = Image.open(BytesIO(data))
+            img.load()
+            return img
+
+        if original is None:
+            original = self._read(original_name)
+            if original is None:
+                if on_preview is not None and self._preview_from_variant(digest, size, on_preview):
+                    on_preview = None
+                with stage("plakát"):
+                    original, meta = fetch(url, None)
+                self.counters["downloads"] += 1
+                self._write(original_name, original)
+                self._write_meta(digest, meta)
+            else:
+                self.counters["original_hits"] += 1
+
+        if on_preview is not None:
+            with stage("náhled"):
+                img = preview(original, size)
+            if img is not None:
+                on_preview(img)
+        with stage("resize"):
+            img = fit(original, size)
+        buf = BytesIO()
+        img.save(buf, "PNG", compress_level=1)
+        self._write(variant_name, buf.getvalue())
+        return img
+
+    def contains(self, url, size):
+        """Je varianta připravená a ještě čerstvá? (nic nestahuje)"""
+        digest = self.digest(url)
+        with self._lock:
+            if f"{digest}_{size[0]}x{size[1]}.png" not in self._files:
+                return False
+        meta = self._read_meta(digest)
+        return meta is None or meta.get("expires", 0) > time.time()
+
+    def _preview_from_variant(self, digest, size, on_preview):
+        """Náhled z jiné už hotové varianty téhož plakátu (třeba miniatury z porovnání)"""
+        prefix = f"{digest}_"
+        with self._lock:
+            names = [name for name in self._files if name.startswith(prefix)]
+        for name in names:
+            data = self._read(name)
+            if data is not None:
+                img = Image.open(BytesIO(data))
+                on_preview(img.resize(size, Image.BILINEAR))
+                return True
+        return False
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, files=len(self._files), bytes=self._total, max_bytes=self.max_bytes)
+
+    def _read_meta(self, digest):
+        data = self._read(f"{digest}.json")
+        return json.loads(data) if data is not None else None
+
+    def _write_meta(self, digest, meta):
+        if meta:
+            self._write(f"{digest}.json", json.dumps(meta).encode("utf-8"))
+
+    def _discard_variants(self, digest):
+        prefix = f"{digest}_"
+        with self._lock:
+            names = [name for name in self._files if name.startswith(prefix)]
+            for name in names:
+                self._total -= self._files.pop(name)
+        for name in names:
+            try:
+                (self.directory / name).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _read(self, name):
+        path = self.directory / name
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if name in self._files:
+                self._files.move_to_end(name)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write(self, name, data):
+        path = self.directory / name
+        tmp = path.with_name(f"{name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._total += len(data) - self._files.pop(name, 0)
+            self._files[name] = len(data)
+            victims = []
+            while self._total > self.max_bytes and len(self._files) > 1:
+                victim, victim_size = self._files.popitem(last=False)
+                self._total -= victim_size
+                victims.append(victim)
+            self.counters["evictions"] += len(victims)
+        for victim in victims:
+            try:
+                (self.directory / victim).unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,81 @@
+from collections import deque
+
+DEFERRED = "deferred"
+
+
+class Prefetcher:
+    """Přednačítání pravděpodobných dalších dotazů - po jednom a jen když uživatel nic nehledá
+
+    job(task, imdb_id) běží na pozadí a vrací DEFERRED, když došel rozpočet požadavků.
+    """
+
+    def __init__(self, root, worker, job, is_idle, delay_ms=400, retry_ms=2000, max_pending=50):
+        self.root = root
+        self.worker = worker
+        self.job = job
+        self.is_idle = is_idle
+        self.delay_ms = delay_ms
+        self.retry_ms = retry_ms
+        self.max_pending = max_pending
+        self.pending = deque()
+        self.done = set()
+        self.counters = {"fetched": 0, "deferred": 0, "failed": 0}
+        self._current = None
+        self._task = None
+        self._after_id = None
+
+    def schedule(self, imdb_ids):
+        """Zařadí ID na konec fronty (bez duplicit a už hotových)"""
+        for imdb_id in imdb_ids:
+            if not imdb_id or imdb_id in self.done or imdb_id in self.pending or imdb_id == self._current:
+                continue
+            if len(self.pending) >= self.max_pending:
+                break
+            self.pending.append(imdb_id)
+        self._kick(self.delay_ms)
+
+    def pause(self):
+        """Uživatel hledá - rozběhnutý prefetch se zruší a vrátí do fronty"""
+        if self._task is not None:
+            self._task.cancel()
+            self.pending.appendleft(self._current)
+            self._task = None
+            self._current = None
+        self._kick(self.delay_ms)
+
+    def _kick(self, delay):
+        if self._task is None and self._after_id is None and self.pending:
+            self._after_id = self.root.after(delay, self._next)
+
+    def _next(self):
+        self._after_id = None
+        if self._task is not None or not self.pending:
+            return
+        if not self.is_idle():
+            self._kick(self.delay_ms)
+            return
+        self._current = self.pending.popleft()
+        self._task = self.worker.submit(
+            self.job, self._current, group="prefetch", on_done=self._finished, on_error=self._failed
+        )
+
+    def _finished(self, task, result):
+        imdb_id = self._current
+        self._task = None
+        self._current = None
+        if result == DEFERRED:
+            # Out of budget - try again once the bucket refills
+            self.counters["deferred"] += 1
+            self.pending.appendleft(imdb_id)
+            self._kick(self.retry_ms)
+            return
+        self.counters["fetched"] += 1
+        self.done.add(imdb_id)
+        self._kick(self.delay_ms)
+
+    def _failed(self, task, error):
+        self.counters["failed"] += 1
+        self.done.add(self._current)
+        self._task = None
+        self._current = None
+        self._kick(self.delay_ms)
@@ -0,0 +1,287 @@
+import csv
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from movie import parse_number
+
+Rating = namedtuple("Rating", "source score raw votes")  # score 0-100
+Aggregate = namedtuple("Aggregate", "score ratings missing")  # score None = žádné hodnocení
+
+SHORT_NAMES = {
+    "Internet Movie Database": "IMDb",
+    "Rotten Tomatoes": "RT",
+    "Metacritic": "Metacritic",
+}
+
+
+def normalize(raw):
+    """'7.8/10' / '87%' / '74/100' / '3.9/5' -> 0-100; None, když to číslo není"""
+    raw = str(raw or "").strip()
+    if raw.endswith("%"):
+        value, scale = parse_number(raw[:-1]), 100
+    elif "/" in raw:
+        value, _, scale = raw.partition("/")
+        value, scale = parse_number(value), parse_number(scale)
+    else:
+        value = parse_number(raw)
+        scale = 10 if value is not None and value <= 10 else 100
+    if value is None or not scale or not 0 <= value <= scale:
+        return None
+    return round(value * 100 / scale, 1)
+
+
+def make_rating(source, raw, votes=None):
+    score = normalize(raw)
+    return Rating(source, score, raw, parse_number(votes)) if score is not None else None
+
+
+def merge(results, missing=()):
+    """Spojí hodnocení poskytovatelů (v jejich pořadí) - každý zdroj jednou, skóre je průměr"""
+    ratings = {}
+    for provider_ratings in results:
+        for rating in provider_ratings:
+            ratings.setdefault(rating.source, rating)
+    ratings = list(ratings.values())
+    score = round(sum(r.score for r in ratings) / len(ratings)) if ratings else None
+    return Aggregate(score, ratings, tuple(missing))
+
+
+class OmdbRatings:
+    """Hodnocení, která už jsou v odpovědi OMDb - Ratings, imdbRating/imdbVotes a Metascore"""
+
+    name = "omdb"
+    timeout = 0.5
+    inline = True  # nic nestahuje, jde volat i z Tk vlákna
+
+    def fetch(self, movie):
+        votes = movie.votes
+        ratings = [
+            make_rating(source, value, votes if source == "Internet Movie Database" else None)
+            for source, value in movie.ratings or ()
+        ]
+        sources = {r.source for r in ratings if r is not None}
+        if "Internet Movie Database" not in sources and movie.rating is not None:
+            ratings.append(make_rating("Internet Movie Database", f"{movie.rating}/10", votes))
+        if "Metacritic" not in sources and movie.metascore is not None:
+            ratings.append(make_rating("Metacritic", f"{movie.metascore}/100"))
+        return [r for r in ratings if r is not None]
+
+
+class CsvRatings:
+    """Lokální CSV dump se sloupci imdbID, Source, Value (a volitelně Votes); načte se jednou"""
+
+    inline = False
+
+    def __init__(self, path, name=None, timeout=1.0):
+        self.path = path
+        self.name = name or f"csv:{path}"
+        self.timeout = timeout
+        self._rows = None
+        self._lock = threading.Lock()
+
+    def fetch(self, movie):
+        return self._load().get(movie.imdb_id, [])
+
+    def _load(self):
+        with self._lock:
+            if self._rows is None:
+                rows = {}
+                with open(self.path, encoding="utf-8", newline="") as f:
+                    for row in csv.DictReader(f):
+                        rating = make_rating(row.get("Source", ""), row.get("Value"), row.get("Votes"))
+                        if rating is not None and row.get("imdbID"):
+                            rows.setdefault(row["imdbID"], []).append(rating)
+                self._rows = rows
+            return self._rows
+
+
+class HttpRatings:
+    """Další endpoint: GET url s {imdb_id}, odpověď {"Ratings": [{"Source", "Value"}, ...]}"""
+
+    inline = False
+
+    def __init__(self, url, http, name="http", timeout=2.0):
+        self.url = url
+        self.http = http
+        self.name = name
+        self.timeout = timeout
+
+    def fetch(self, movie):
+        response = self.http.get(self.url.format(imdb_id=urllib.parse.quote(movie.imdb_id)), timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        items = data.get("Ratings", []) if isinstance(data, dict) else data
+        ratings = (make_rating(item.get("Source", self.name), item.get("Value"), item.get("Votes")) for item in items)
+        return [r for r in ratings if r is not None]
+
+
+class RatingsAggregator:
+    """Poskytovatelé běží souběžně ve vlastním poolu; pomalý nebo rozbitý zdroj nic neblokuje
+
+    Každý poskytovatel má svůj timeout - po něm se vrátí částečný výsledek a zdroj je
+    v `missing`. Dotažená odpověď se i tak uloží do cache a příště už je k dispozici.
+    """
+
+    def __init__(self, providers, ttl=6 * 3600, max_entries=2000, max_workers=4):
+        self.providers = list(providers)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.counters = {"hits": 0, "fetched": 0, "timeouts": 0, "errors": 0}
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ratings")
+
+    def collect(self, movie, on_partial=None):
+        """Hodnocení ze všech zdrojů; on_partial(Aggregate) po každém dalším hotovém zdroji"""
+        results = {}
+        pending = {}
+        started = time.monotonic()
+        for provider in self.providers:
+            cached = self._cached(provider, movie.imdb_id)
+            if cached is not None:
+                results[provider.name] = cached
+            else:
+                pending[self._executor.submit(self._fetch, provider, movie)] = provider
+        missing = []
+
+        while pending:
+            now = time.monotonic()
+            expired = [f for f, p in pending.items() if now >= started + p.timeout]
+            for future in expired:
+                provider = pending.pop(future)
+                missing.append(provider.name)
+                with self._lock:
+                    self.counters["timeouts"] += 1
+            if not pending:
+                break
+            deadline = min(started + p.timeout for p in pending.values())
+            done, _ = wait(pending, timeout=max(deadline - now, 0), return_when=FIRST_COMPLETED)
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    results[provider.name] = future.result()
+                except Exception:
+                    missing.append(provider.name)
+            if done and on_partial is not None and pending:
+                on_partial(self._merge(results, missing + [p.name for p in pending.values()]))
+        return self._merge(results, missing)
+
+    def cached(self, movie):
+        """Bez čekání: co je v cache plus poskytovatelé, kteří nic nestahují"""
+        results = {}
+        missing = []
+        for provider in self.providers:
+            ratings = self._cached(provider, movie.imdb_id)
+            if ratings is None and provider.inline:
+                ratings = provider.fetch(movie)
+            if ratings is None:
+                missing.append(provider.name)
+            else:
+                results[provider.name] = ratings
+        return self._merge(results, missing)
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, entries=len(self._cache), providers=len(self.providers))
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _merge(self, results, missing):
+        return merge((results[p.name] for p in self.providers if p.name in results), missing)
+
+    def _fetch(self, provider, movie):
+        try:
+            ratings = provider.fetch(movie)
+        except Exception:
+            with self._lock:
+                self.counters["errors"] += 1
+            raise
+        # Stored even when the caller already gave up waiting
+        with self._lock:
+            self.counters["fetched"] += 1
+            self._cache[(provider.name, movie.imdb_id)] = (time.monotonic() + self.ttl, ratings)
+            self._cache.move_to_end((provider.name, movie.imdb_id))
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return ratings
+
+    def _cached(self, provider, imdb_id):
+        key = (provider.name, imdb_id)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            self.counters["hits"] += 1
+            return entry[1]
+
+
+class ScoreLoader:
+    """Dotahuje skóre pro srovnání přes Worker - nejvýš `parallel` najednou
+
+    collect() čeká na pomalé poskytovatele, takže bez stropu by velké srovnání
+    obsadilo všechna vlákna Workeru. on_score(imdb_id, aggregate) se volá
+    v hlavním vlákně; při chybě dostane zadaný náhradní výsledek.
+    """
+
+    def __init__(self, worker, job, on_score, parallel=2, group="scores"):
+        self.worker = worker
+        self.job = job
+        self.on_score = on_score
+        self.parallel = parallel
+        self.group = group
+        self.pending = deque()
+        self.queued = set()
+        self.active = 0
+
+    def request(self, movie, fallback=None):
+        if movie.imdb_id in self.queued:
+            return
+        self.queued.add(movie.imdb_id)
+        self.pending.append((movie, fallback))
+        while self.active < self.parallel and self.pending:
+            self._submit_next()
+
+    def cancel(self):
+        self.worker.cancel(self.group)
+        self.pending.clear()
+        self.queued.clear()
+        self.active = 0
+
+    def _submit_next(self):
+        movie, fallback = self.pending.popleft()
+        self.active += 1
+        self.worker.submit(
+            self.job, movie, group=self.group,
+            on_done=lambda task, aggregate: self._finished(movie, aggregate),
+            on_error=lambda task, error: self._finished(movie, fallback),
+        )
+
+    def _finished(self, movie, aggregate):
+        self.active -= 1
+        self.queued.discard(movie.imdb_id)
+        if self.pending:
+            self._submit_next()
+        self.on_score(movie.imdb_id, aggregate)
+
+
+def format_aggregate(aggregate):
+    """'Skóre 81/100 · IMDb 8.8/10 (2 345 678 hlasů) · RT 87% · bez odpovědi: http'"""
+    if aggregate is None:
+        return ""
+    parts = [f"Skóre {aggregate.score}/100" if aggregate.score is not None else "Skóre N/A"]
+    for rating in aggregate.ratings:
+        text = f"{SHORT_NAMES.get(rating.source, rating.source)} {rating.raw}"
+        if rating.votes:
+            text += f" ({rating.votes:,} hlasů)".replace(",", " ")
+        parts.append(text)
+    if aggregate.missing:
+        parts.append("bez odpovědi: " + ", ".join(aggregate.missing))
+    return " · ".join(parts)
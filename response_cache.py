@@ -0,0 +1,176 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def query_key(normalized_name):
+    """Klíč pro dotaz podle názvu (výstup normalize_text)"""
+    return "t:" + " ".join(normalized_name.casefold().split())
+
+
+def id_key(imdb_id):
+    return "i:" + imdb_id
+
+
+def season_key(imdb_id, season):
+    return f"s:{imdb_id}:{season}"
+
+
+class ResponseCache:
+    """Cache odpovědí OMDb - LRU v paměti před SQLite souborem na disku"""
+
+    def __init__(self, path, ttl=7 * 24 * 3600, negative_ttl=3600, max_entries=5000, memory_entries=256):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        # Memory hits waiting to be written to accessed_at - flushed before eviction and on close
+        self._touched = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, data TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed_at)")
+        self._db.commit()
+        self.counters = {
+            "hits": 0,
+            "misses": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "negative_hits": 0,
+            "expired": 0,
+            "stale_hits": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+    def get(self, key, stale=False):
+        """Vrátí uloženou odpověď (i negativní) nebo None; stale=True vrátí i prošlou
+
+        Prošlé řádky zůstávají na disku (uklízí je LRU), aby bylo co vrátit, když OMDb
+        neodpovídá nebo je vyčerpaná kvóta.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                data, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._touched[key] = now
+                    self._hit("memory_hits", data)
+                    return data
+                del self._memory[key]
+
+            row = self._db.execute("SELECT data, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.counters["misses"] += 1
+                return None
+            if row[1] <= now:
+                if stale:
+                    self.counters["stale_hits"] += 1
+                    return json.loads(row[0])
+                self.counters["expired"] += 1
+                self.counters["misses"] += 1
+                return None
+
+            data = json.loads(row[0])
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self._remember(key, data, row[1])
+            self._hit("disk_hits", data)
+            return data
+
+    def contains(self, key):
+        """Je pod klíčem platný záznam? (nepočítá se do hit/miss)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[1] > now:
+                return True
+            row = self._db.execute("SELECT expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            return row is not None and row[0] > now
+
+    def put(self, data, *keys):
+        """Uloží odpověď pod všechny klíče; 'Response: False' dostane kratší TTL"""
+        now = time.time()
+        ttl = self.negative_ttl if data.get("Response") == "False" else self.ttl
+        expires_at = now + ttl
+        payload = json.dumps(data, ensure_ascii=False)
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO responses (key, data, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                [(key, payload, expires_at, now) for key in keys],
+            )
+            for key in keys:
+                self._touched.pop(key, None)
+                self._remember(key, data, expires_at)
+            self.counters["stores"] += len(keys)
+            self._flush_touched()
+            self._evict()
+            self._db.commit()
+
+    def records(self, prefix="i:"):
+        """Všechny kladné odpovědi pod klíči s prefixem - i prošlé (pro offline katalog)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM responses WHERE key >= ? AND key < ?",
+                (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)),
+            ).fetchall()
+        for (payload,) in rows:
+            data = json.loads(payload)
+            if data.get("Response") != "False":
+                yield data
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return dict(self.counters, entries=entries, memory_entries=len(self._memory))
+
+    def close(self):
+        with self._lock:
+            if self._touched:
+                self._flush_touched()
+                self._db.commit()
+            self._db.close()
+
+    def _hit(self, layer, data):
+        self.counters["hits"] += 1
+        self.counters[layer] += 1
+        if data.get("Response") == "False":
+            self.counters["negative_hits"] += 1
+
+    def _remember(self, key, data, expires_at):
+        self._memory[key] = (data, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_touched(self):
+        if self._touched:
+            self._db.executemany("UPDATE responses SET accessed_at = ? WHERE key = ?",
+                                 [(at, key) for key, at in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self):
+        count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+            self.counters["evictions"] += excess
@@ -0,0 +1,179 @@
+import heapq
+import itertools
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timezone
+
+from ratelimit import TokenBucket
+
+# Lower number goes first
+USER = 0
+BACKGROUND = 1
+BATCH = 2
+
+
+class QuotaExceeded(Exception):
+    """Denní kvóta klíče OMDb je vyčerpaná (nebo zbytek patří uživateli)"""
+
+
+class Quota:
+    """Počet dotazů za den (UTC) v SQLite - sdílí ho GUI i batch a přežije restart
+
+    Každý dotaz se započítá jedním atomickým UPDATE, takže souběžné procesy
+    si navzájem nepřepíšou počty.
+    """
+
+    def __init__(self, path, limit):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+        # Autocommit; a second process waits on the write lock instead of failing
+        self._db = sqlite3.connect(str(path), timeout=10, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS quota (day TEXT PRIMARY KEY, used INTEGER NOT NULL)")
+        self._db.execute("DELETE FROM quota WHERE day < ?", (self._today(),))
+
+    @staticmethod
+    def _today():
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def remaining(self):
+        with self._lock:
+            row = self._db.execute("SELECT used FROM quota WHERE day = ?", (self._today(),)).fetchone()
+            self.used = row[0] if row else 0
+            return max(self.limit - self.used, 0)
+
+    def consume(self, keep=0):
+        """Započítá jeden dotaz, jen když po něm zbyde aspoň `keep`; jinak vrátí False"""
+        return self._update("used = used + 1", "used < :cap", cap=self.limit - keep)
+
+    def exhaust(self):
+        """OMDb hlásí vyčerpaný limit - do konce dne už se nic neposílá"""
+        self._update("used = MAX(used, :limit)", limit=self.limit)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _update(self, assignment, condition="1", **params):
+        params["day"] = self._today()
+        with self._lock:
+            self._db.execute("INSERT OR IGNORE INTO quota (day, used) VALUES (:day, 0)", params)
+            cursor = self._db.execute(f"UPDATE quota SET {assignment} WHERE day = :day AND {condition}", params)
+            self.used = self._db.execute("SELECT used FROM quota WHERE day = :day", params).fetchone()[0]
+            return cursor.rowcount == 1
+
+
+class OmdbScheduler:
+    """Jediná brána na OMDb - slučuje stejné rozběhnuté dotazy, drží rate limit a kvótu
+
+    Čekající dotazy se pouští podle priority (USER před BACKGROUND před BATCH).
+    Poslední `reserve` z denní kvóty smí spotřebovat jen dotazy uživatele.
+    """
+
+    def __init__(self, quota_path, daily_limit=1000, rate=5, burst=None, reserve=0.1):
+        self.quota = Quota(quota_path, daily_limit)
+        self.bucket = TokenBucket(rate, burst)
+        self.reserve = int(daily_limit * reserve)
+        self.counters = {"requests": 0, "coalesced": 0, "rejected": 0}
+        self._cond = threading.Condition()
+        self._inflight = {}
+        self._queue = []
+        self._waiting = {}
+        self._seq = itertools.count()
+
+    def lane(self, priority):
+        """Objekt pro parametr `limiter` funkcí v core - dotazy s danou prioritou"""
+        return _Lane(self, priority)
+
+    def request(self, params, send, priority=USER):
+        """Pošle dotaz přes send(), nebo počká na výsledek stejného rozběhnutého dotazu"""
+        key = tuple(sorted(params.items()))
+        with self._cond:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.counters["coalesced"] += 1
+                self._boost(key, priority)
+        if not leader:
+            return future.result()
+
+        try:
+            self._admit(key, priority)
+            try:
+                result = send()
+            except QuotaExceeded:
+                # OMDb itself says the key is used up
+                with self._cond:
+                    self.quota.exhaust()
+                raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._cond:
+                del self._inflight[key]
+
+    def stats(self):
+        with self._cond:
+            remaining = self.quota.remaining()
+            return dict(self.counters, waiting=len(self._queue), inflight=len(self._inflight),
+                        quota_used=self.quota.used, quota_remaining=remaining)
+
+    def close(self):
+        with self._cond:
+            self.quota.close()
+
+    def _admit(self, key, priority):
+        """Čeká, až je dotaz první ve frontě, je volný token a zbývá kvóta"""
+        with self._cond:
+            entry = [priority, next(self._seq), key]
+            heapq.heappush(self._queue, entry)
+            self._waiting[key] = entry
+            try:
+                while True:
+                    # entry[0] may have been raised by _boost while waiting
+                    keep = 0 if entry[0] == USER else self.reserve
+                    if self.quota.remaining() <= keep:
+                        self.counters["rejected"] += 1
+                        raise QuotaExceeded("Denní kvóta OMDb je vyčerpaná")
+                    if self._queue[0] is not entry:
+                        self._cond.wait()
+                    elif self.bucket.try_acquire():
+                        # Another process may have used the rest since remaining()
+                        if not self.quota.consume(keep):
+                            self.counters["rejected"] += 1
+                            raise QuotaExceeded("Denní kvóta OMDb je vyčerpaná")
+                        self.counters["requests"] += 1
+                        return
+                    else:
+                        self._cond.wait(max(self.bucket.wait_time(), 0.005))
+            finally:
+                if entry in self._queue:
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                del self._waiting[key]
+                self._cond.notify_all()
+
+    def _boost(self, key, priority):
+        """Uživatel čeká na dotaz zařazený na pozadí - posune ho dopředu"""
+        entry = self._waiting.get(key)
+        if entry is not None and priority < entry[0]:
+            entry[0] = priority
+            heapq.heapify(self._queue)
+            self._cond.notify_all()
+
+
+class _Lane:
+    def __init__(self, scheduler, priority):
+        self.scheduler = scheduler
+        self.priority = priority
+
+    def request(self, params, send):
+        return self.scheduler.request(params, send, self.priority)
@@ -0,0 +1,92 @@
+from collections import deque
+
+from movie import parse_number
+
+
+def episode_rating(episode):
+    return parse_number(episode.get('imdbRating'))
+
+
+def _summarize(episodes, season=None):
+    rated = []
+    for episode in episodes:
+        rating = episode_rating(episode)
+        if rating is not None:
+            rated.append((rating, episode.get('Season', season), episode))
+    summary = {"episodes": len(episodes), "rated": len(rated), "average": None, "best": None, "worst": None}
+    if rated:
+        summary["average"] = sum(r[0] for r in rated) / len(rated)
+        summary["best"] = max(rated, key=lambda r: r[0])
+        summary["worst"] = min(rated, key=lambda r: r[0])
+    return summary
+
+
+class SeriesStats:
+    """Průběžné souhrny seriálu - sezóny mohou dorazit v libovolném pořadí"""
+
+    def __init__(self, episode_runtime=None):
+        self.episode_runtime = episode_runtime
+        self.seasons = {}
+
+    def add_season(self, number, episodes):
+        for episode in episodes:
+            episode.setdefault('Season', number)
+        self.seasons[number] = episodes
+        return _summarize(episodes, number)
+
+    def totals(self):
+        """Souhrn za všechny dosud načtené sezóny; délka je odhad z délky epizody"""
+        episodes = [episode for number in sorted(self.seasons) for episode in self.seasons[number]]
+        summary = _summarize(episodes)
+        summary["seasons"] = len(self.seasons)
+        summary["runtime"] = self.episode_runtime * len(episodes) if self.episode_runtime else None
+        return summary
+
+
+class SeriesLoader:
+    """Stáhne všechny sezóny přes Worker - nejvýš `parallel` najednou, výsledky po sezónách
+
+    job(task, imdb_id, season) běží na pozadí; on_season(season, data) a
+    on_error(season, error) se volají v hlavním vlákně.
+    """
+
+    def __init__(self, worker, job, on_season, on_error, parallel=4, group="series"):
+        self.worker = worker
+        self.job = job
+        self.on_season = on_season
+        self.on_error = on_error
+        self.parallel = parallel
+        self.group = group
+        self.imdb_id = None
+        self.pending = deque()
+        self.active = 0
+
+    def start(self, imdb_id, total_seasons):
+        self.cancel()
+        self.imdb_id = imdb_id
+        self.pending.extend(range(1, total_seasons + 1))
+        while self.active < self.parallel and self.pending:
+            self._submit_next()
+
+    def cancel(self):
+        self.worker.cancel(self.group)
+        self.pending.clear()
+        self.active = 0
+
+    def _submit_next(self):
+        season = self.pending.popleft()
+        self.active += 1
+        self.worker.submit(
+            self.job, self.imdb_id, season, group=self.group,
+            on_done=lambda task, data: self._finished(season, data, None),
+            on_error=lambda task, error: self._finished(season, None, error),
+        )
+
+    def _finished(self, season, data, error):
+        self.active -= 1
+        if self.pending:
+            self._submit_next()
+        if error is not None:
+            self.on_error(season, error)
+        else:
+            self.on_season(season, data)
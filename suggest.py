@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+from core import normalize_text
+
+
+def prefix_key(text):
+    return " ".join(normalize_text(text).casefold().split())
+
+
+def title_matches(title, key):
+    """Každé slovo dotazu musí být začátkem některého slova v názvu"""
+    title_words = prefix_key(title).split()
+    return all(any(word.startswith(part) for word in title_words) for part in key.split())
+
+
+class SuggestionCache:
+    """Výsledky s= podle prefixu; delší prefix se dá dofiltrovat lokálně z kratšího"""
+
+    def __init__(self, max_entries=200):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def put(self, key, results, total):
+        self._entries[key] = (results, total)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def lookup(self, key):
+        """Vrátí (výsledky, úplné) nebo None; úplné = není třeba se ptát sítě"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0], True
+
+        for end in range(len(key) - 1, 0, -1):
+            entry = self._entries.get(key[:end])
+            if entry is None:
+                continue
+            results, total = entry
+            filtered = [r for r in results if title_matches(r.get("Title", ""), key)]
+            return filtered, total <= len(results)
+        return None
@@ -0,0 +1,65 @@
+import math
+import unittest
+
+from analytics import MovieTable
+
+
+def omdb(imdb_id, title, rating, genre, year="2000", director="N/A", votes="N/A"):
+    return {"imdbID": imdb_id, "Title": title, "imdbRating": rating, "Genre": genre, "Year": year,
+            "Director": director, "imdbVotes": votes, "Type": "movie", "Response": "True"}
+
+
+class MovieTableTest(unittest.TestCase):
+    def setUp(self):
+        self.table = MovieTable([
+            omdb("tt1", "Heat", "8.3", "Action, Crime, Drama", "1995", "Michael Mann", "700,000"),
+            omdb("tt2", "Alien", "8.5", "Horror, Sci-Fi", "1979", "Ridley Scott"),
+            omdb("tt3", "Collateral", "7.5", "Action, Crime, Drama", "2004", "Michael Mann"),
+            omdb("tt4", "Unrated", "N/A", "Drama", "N/A"),
+            omdb("tt5", "Gladiator", "8.5", "Action, Adventure, Drama", "2000", "Ridley Scott"),
+        ])
+
+    def titles(self, rows):
+        return [self.table.records[r].title for r in rows]
+
+    def test_append_deduplicates_by_imdb_id(self):
+        self.assertFalse(self.table.append(omdb("tt1", "Heat", "8.3", "Action")))
+        self.assertEqual(len(self.table), 5)
+        self.assertTrue(math.isnan(self.table.column("rating")[3]))
+
+    def test_sort_puts_missing_last(self):
+        self.assertEqual(self.titles(self.table.sort("rating")), ["Alien", "Gladiator", "Heat", "Collateral", "Unrated"])
+        self.assertEqual(self.titles(self.table.sort("rating", descending=False)),
+                         ["Collateral", "Heat", "Alien", "Gladiator", "Unrated"])
+
+    def test_sort_subset(self):
+        self.assertEqual(self.titles(self.table.sort("year", rows=[0, 2, 3])), ["Collateral", "Heat", "Unrated"])
+
+    def test_rank_shares_ties(self):
+        self.assertEqual(list(self.table.rank("rating")), [3, 1, 4, 0, 1])
+
+    def test_filter(self):
+        self.assertEqual(self.titles(self.table.filter(rating=(8, None))), ["Heat", "Alien", "Gladiator"])
+        self.assertEqual(self.titles(self.table.filter(genre="Crime", year=(None, 2000))), ["Heat"])
+        self.assertEqual(self.table.filter(genre="Western"), [])
+        self.assertEqual(self.table.filter(rating=(None, 10), rows=[3]), [])
+
+    def test_summary(self):
+        stats = self.table.summary("rating")
+        self.assertEqual((stats.count, stats.min, stats.max), (4, 7.5, 8.5))
+        self.assertAlmostEqual(stats.mean, 8.2)
+
+    def test_group_stats(self):
+        groups = {g.label: g for g in self.table.group_stats("director")}
+        self.assertEqual(groups["Ridley Scott"].count, 2)
+        self.assertAlmostEqual(groups["Michael Mann"].mean, 7.9)
+        self.assertEqual([g.label for g in self.table.group_stats("director")], ["Ridley Scott", "Michael Mann"])
+
+    def test_group_stats_multi_value_and_min_count(self):
+        groups = self.table.group_stats("genre", min_count=3)
+        self.assertEqual([(g.label, g.count) for g in groups], [("Action", 3), ("Drama", 3)])
+        self.assertEqual((groups[0].min, groups[0].max), (7.5, 8.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import batch
+from batch import EXIT_NO_INPUT, EXIT_QUOTA, Checkpoint, EmptyInput, Writer, main, read_titles, run
+from scheduler import QuotaExceeded
+
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.output = Path(self.dir.name) / "out.jsonl"
+        self.checkpoint = Checkpoint(self.output.with_name("out.jsonl.checkpoint"))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_rows_after_checkpoint_are_dropped_on_resume(self):
+        with open(self.output, "w", encoding="utf-8", newline="") as out:
+            out.write('{"query": "Alien"}\n{"query": "Žralok"}\n')
+            self.checkpoint.save(2, out)
+            # Hard kill: written, but never checkpointed
+            out.write('{"query": "Aliens"}\n')
+        done, offset = self.checkpoint.load()
+        Checkpoint.rewind(self.output, offset)
+        self.assertEqual(done, 2)
+        self.assertEqual(self.output.read_text(encoding="utf-8"), '{"query": "Alien"}\n{"query": "Žralok"}\n')
+
+    def test_old_checkpoint_without_offset(self):
+        self.checkpoint.path.write_text('{"done": 5}', encoding="utf-8")
+        self.assertEqual(self.checkpoint.load(), (5, None))
+
+    def test_missing_checkpoint(self):
+        self.assertEqual(self.checkpoint.load(), (0, None))
+
+
+class QuotaLimiter:
+    """Fronta plánovače, které po `allowed` dotazech dojde kvóta"""
+
+    def __init__(self, allowed):
+        self.allowed = allowed
+
+    def request(self, params, send):
+        if self.allowed <= 0:
+            raise QuotaExceeded("Denní kvóta OMDb je vyčerpaná")
+        self.allowed -= 1
+        return {"Response": "True", "Title": params["t"], "imdbID": "tt%07d" % self.allowed}
+
+
+class QuotaStopTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.output = Path(self.dir.name) / "out.jsonl"
+        self.checkpoint = Checkpoint(self.output.with_name("out.jsonl.checkpoint"))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_run_stops_at_last_real_result(self):
+        titles = ["Alien", "Aliens", "Alien 3", "Heat"]
+        with open(self.output, "w", encoding="utf-8", newline="") as out:
+            with self.assertRaises(QuotaExceeded):
+                run(titles, Writer(out, "jsonl", header=True), out, self.checkpoint, 0, 1,
+                    QuotaLimiter(2), None, None)
+        done, offset = self.checkpoint.load()
+        self.assertEqual(done, 2)
+        self.assertEqual(offset, self.output.stat().st_size)
+        self.assertNotIn("error", self.output.read_text(encoding="utf-8"))
+
+    def test_main_exits_non_zero_and_keeps_checkpoint(self):
+        titles = Path(self.dir.name) / "titles.txt"
+        titles.write_text("Alien\n", encoding="utf-8")
+        with mock.patch.object(batch, "OMDB_QUOTA_FILE", Path(self.dir.name) / "quota"), \
+                mock.patch.object(batch.OmdbScheduler, "lane", lambda scheduler, priority: QuotaLimiter(0)):
+            code = main([str(titles), "-o", str(self.output), "--no-cache", "--no-index"])
+        self.assertEqual(code, EXIT_QUOTA)
+        self.assertEqual(self.checkpoint.load()[0], 0)
+        self.assertTrue(self.checkpoint.path.exists())
+
+
+class ReadTitlesTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.input = Path(self.dir.name) / "titles.csv"
+        self.output = Path(self.dir.name) / "out.jsonl"
+
+    def read(self, text, column=None):
+        self.input.write_text(text, encoding="utf-8")
+        with open(self.input, encoding="utf-8", newline="") as source:
+            return list(read_titles(source, column))
+
+    def test_csv_first_column_by_default(self):
+        self.assertEqual(self.read("title,year\nAlien,1979\n Heat ,1995\n"), ["Alien", "Heat"])
+
+    def test_csv_named_column(self):
+        self.assertEqual(self.read("year,title\n1979,Alien\n1995,\n", column="title"), ["Alien", ""])
+
+    def test_empty_csv(self):
+        with self.assertRaises(EmptyInput):
+            self.read("")
+
+    def test_main_reports_empty_input(self):
+        self.input.write_text("", encoding="utf-8")
+        with mock.patch.object(batch, "OMDB_QUOTA_FILE", Path(self.dir.name) / "quota"), \
+                mock.patch("sys.stderr") as stderr:
+            code = main([str(self.input), "-o", str(self.output), "--no-cache", "--no-index"])
+        self.assertEqual(code, EXIT_NO_INPUT)
+        self.assertIn("Žádný vstup", "".join(call.args[0] for call in stderr.write.call_args_list))
+        self.assertFalse(self.output.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
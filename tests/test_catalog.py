@@ -0,0 +1,199 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import catalog
+import core
+from catalog import Catalog, OfflineFallback, build, read_jsonl
+from core import OfflineError
+from response_cache import ResponseCache, id_key, query_key
+
+
+def movie(imdb_id, title):
+    return {"imdbID": imdb_id, "Title": title, "Response": "True"}
+
+
+class DeadHttp:
+    """Síť, která vůbec neodpovídá"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, timeout=8, **kwargs):
+        self.calls += 1
+        raise ConnectionError("network down")
+
+
+class LiveHttp:
+    """OMDb, které na cokoli vrátí jeden film"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def get(self, url, timeout=8, **kwargs):
+        return self
+
+    status_code = 200
+    text = ""
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class CatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = Path(self.dir.name) / "catalog.snapshot"
+
+    def open(self, records):
+        build(self.path, records)
+        snapshot = Catalog(self.path)
+        self.addCleanup(snapshot.close)
+        return snapshot
+
+    def test_lookup_by_id_and_title(self):
+        snapshot = self.open([movie("tt0078748", "Alien"), movie("tt0090605", "Aliens")])
+        self.assertEqual(len(snapshot), 2)
+        self.assertEqual(snapshot.by_id("tt0090605")["Title"], "Aliens")
+        self.assertEqual(snapshot.by_title("alien")["imdbID"], "tt0078748")
+        self.assertEqual(snapshot.get(id_key("tt0078748"))["Title"], "Alien")
+        self.assertEqual(snapshot.get(query_key("aliens"))["imdbID"], "tt0090605")
+
+    def test_title_is_normalized(self):
+        snapshot = self.open([movie("tt0211915", "Amélie")])
+        self.assertEqual(snapshot.by_title("AMELIE")["imdbID"], "tt0211915")
+
+    def test_missing_key(self):
+        snapshot = self.open([movie("tt0078748", "Alien")])
+        self.assertIsNone(snapshot.by_id("tt0000000"))
+        self.assertIsNone(snapshot.by_title("Predator"))
+
+    def test_empty_snapshot(self):
+        snapshot = self.open([])
+        self.assertEqual(len(snapshot), 0)
+        self.assertIsNone(snapshot.by_title("Alien"))
+
+    def test_skips_negative_and_duplicate_records(self):
+        count = build(self.path, [
+            movie("tt0078748", "Alien"),
+            {"Response": "False", "Error": "Movie not found!"},
+            {"Title": "No id", "Response": "True"},
+            dict(movie("tt0078748", "Alien"), Year="1979"),
+        ])
+        self.assertEqual(count, 1)
+        snapshot = Catalog(self.path)
+        self.addCleanup(snapshot.close)
+        self.assertNotIn("Year", snapshot.by_id("tt0078748"))
+
+    def test_shared_title_keeps_first_record(self):
+        snapshot = self.open([movie("tt0093773", "Predator"), movie("tt1234567", "Predator")])
+        self.assertEqual(snapshot.by_title("Predator")["imdbID"], "tt0093773")
+        self.assertEqual(snapshot.by_id("tt1234567")["imdbID"], "tt1234567")
+
+    def test_rejects_other_files(self):
+        self.path.write_bytes(b"x" * catalog.HEADER.size)
+        with self.assertRaises(ValueError):
+            Catalog(self.path)
+
+    def test_build_replaces_snapshot(self):
+        self.open([movie("tt0078748", "Alien")])
+        snapshot = self.open([movie("tt0090605", "Aliens")])
+        self.assertIsNone(snapshot.by_title("Alien"))
+        self.assertEqual(snapshot.by_title("Aliens")["imdbID"], "tt0090605")
+        self.assertEqual([p.name for p in Path(self.dir.name).iterdir()], ["catalog.snapshot"])
+
+    def test_read_jsonl_skips_broken_lines(self):
+        dump = Path(self.dir.name) / "dump.jsonl"
+        dump.write_text('{"imdbID": "tt0078748", "Title": "Alien"}\n\nnot json\n'
+                        '{"imdbID": "tt0090605", "Title": "Aliens"}\n', encoding="utf-8")
+        self.assertEqual([r["imdbID"] for r in read_jsonl(dump)], ["tt0078748", "tt0090605"])
+
+    def test_build_from_response_cache(self):
+        cache = ResponseCache(Path(self.dir.name) / "cache.sqlite3")
+        self.addCleanup(cache.close)
+        alien = movie("tt0078748", "Alien")
+        cache.put(alien, query_key("alien"), id_key("tt0078748"))
+        cache.put({"Response": "False", "Error": "Incorrect IMDb ID."}, id_key("tt0000000"))
+        snapshot = self.open(cache.records())
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot.by_title("Alien"), alien)
+
+    def test_cli_build_and_lookup(self):
+        dump = Path(self.dir.name) / "dump.jsonl"
+        dump.write_text('{"imdbID": "tt0078748", "Title": "Alien", "Response": "True"}\n', encoding="utf-8")
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            self.assertEqual(catalog.main(["build", "-o", str(self.path), "--jsonl", str(dump)]), 0)
+            self.assertEqual(catalog.main(["lookup", "tt0078748", "-c", str(self.path)]), 0)
+            self.assertEqual(catalog.main(["lookup", "Predator", "-c", str(self.path)]), 1)
+        self.assertIn('"Title": "Alien"', out.getvalue())
+        self.assertIn("nenalezeno", err.getvalue())
+
+
+class OfflineFallbackTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        path = Path(self.dir.name) / "catalog.snapshot"
+        build(path, [movie("tt0078748", "Alien")])
+        self.catalog = Catalog(path)
+        self.addCleanup(self.catalog.close)
+        self.now = 100.0
+        patcher = mock.patch.object(catalog.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_switch(self):
+        offline = OfflineFallback(self.catalog, retry_after=30)
+        self.assertFalse(offline.active)
+        offline.went_offline()
+        self.assertTrue(offline.active)
+        offline.back_online()
+        self.assertFalse(offline.active)
+
+    def test_retries_network_after_timeout(self):
+        offline = OfflineFallback(self.catalog, retry_after=30)
+        offline.went_offline()
+        self.now += 29
+        self.assertTrue(offline.active)
+        self.now += 1
+        self.assertFalse(offline.active)
+
+    def test_network_error(self):
+        self.assertTrue(OfflineFallback.network_error(ConnectionError()))
+        error = OSError()
+        error.response = object()
+        self.assertFalse(OfflineFallback.network_error(error))
+
+    def test_lookup(self):
+        offline = OfflineFallback(self.catalog)
+        self.assertEqual(offline.lookup(query_key("alien"))["imdbID"], "tt0078748")
+        with self.assertRaises(OfflineError):
+            offline.lookup(query_key("predator"))
+        with self.assertRaises(OfflineError):
+            OfflineFallback().lookup(query_key("alien"))
+
+    def test_fetch_goes_offline_and_back(self):
+        offline = OfflineFallback(self.catalog, retry_after=30)
+        dead = DeadHttp()
+        self.assertEqual(core.fetch_movie("Alien", dead, offline=offline)["imdbID"], "tt0078748")
+        self.assertTrue(offline.active)
+        # While offline the network is not tried at all
+        core.fetch_movie("Alien", dead, offline=offline)
+        self.assertEqual(dead.calls, 1)
+
+        self.now += 30
+        data = core.fetch_movie("Aliens", LiveHttp(movie("tt0090605", "Aliens")), offline=offline)
+        self.assertEqual(data["imdbID"], "tt0090605")
+        self.assertFalse(offline.active)
+
+
+if __name__ == "__main__":
+    unittest.main()
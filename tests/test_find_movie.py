@@ -0,0 +1,158 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import core
+from catalog import OfflineFallback
+from perf import recorder
+from response_cache import ResponseCache, query_key
+from scheduler import USER, OmdbScheduler
+from title_index import TitleIndex
+
+
+class FakeResponse:
+    status_code = 200
+    text = ""
+
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class FakeHttp:
+    """OMDb, které zná jen zadané názvy; zaznamenává dotazy"""
+
+    def __init__(self, movies):
+        self.movies = movies
+        self.urls = []
+
+    def get(self, url, timeout=8, **kwargs):
+        self.urls.append(url)
+        query = dict(part.split("=", 1) for part in url.split("?", 1)[1].split("&"))
+        if "i" in query:
+            found = [m for m in self.movies.values() if m["imdbID"] == query["i"]]
+            return FakeResponse(found[0] if found else {"Response": "False", "Error": "Incorrect IMDb ID."})
+        title = query["t"].replace("+", " ").casefold()
+        return FakeResponse(self.movies.get(title, {"Response": "False", "Error": "Movie not found!"}))
+
+
+def movie(imdb_id, title):
+    return {"imdbID": imdb_id, "Title": title, "Response": "True"}
+
+
+class FindMovieTest(unittest.TestCase):
+    def setUp(self):
+        self.index = TitleIndex()
+        self.index.add("tt0078748", "Alien")
+        self.index.add("tt0111161", "The Shawshank Redemption")
+        self.http = FakeHttp({
+            "alien": movie("tt0078748", "Alien"),
+            "aliens": movie("tt0090605", "Aliens"),
+            "the shawshank redemption": movie("tt0111161", "The Shawshank Redemption"),
+        })
+
+    def find(self, name):
+        return core.find_movie(name, self.http, title_index=self.index)
+
+    def test_sequel_asks_omdb(self):
+        self.assertEqual(self.find("Aliens")["imdbID"], "tt0090605")
+
+    def test_exact_match_goes_by_id(self):
+        self.assertEqual(self.find("Alien")["imdbID"], "tt0078748")
+        self.assertIn("i=tt0078748", self.http.urls[-1])
+
+    def test_typo_falls_back_after_not_found(self):
+        self.assertEqual(self.find("The Shawshank Redemptoin")["imdbID"], "tt0111161")
+        self.assertIn("t=The+Shawshank+Redemptoin", self.http.urls[0])
+
+    def test_unknown_title_stays_not_found(self):
+        self.assertEqual(self.find("Alien 3")["Response"], "False")
+
+
+class OfflineStaleCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        # ttl=0: everything stored is already expired
+        self.cache = ResponseCache(Path(self.dir.name) / "cache.sqlite3", ttl=0)
+        self.cache.put(movie("tt0078748", "Alien"), query_key("Alien"))
+        self.offline = OfflineFallback()
+
+    def tearDown(self):
+        self.cache.close()
+        self.dir.cleanup()
+
+    def test_stale_answer_while_offline(self):
+        self.offline.went_offline()
+        data = core.fetch_movie("Alien", FakeHttp({}), self.cache, offline=self.offline)
+        self.assertEqual(data["imdbID"], "tt0078748")
+
+    def test_stale_answer_when_connection_drops(self):
+        class DeadHttp:
+            def get(self, url, timeout=8):
+                raise ConnectionError("down")
+
+        data = core.fetch_movie("Alien", DeadHttp(), self.cache, offline=self.offline)
+        self.assertEqual(data["imdbID"], "tt0078748")
+        self.assertTrue(self.offline.active)
+
+    def test_catalog_error_without_stale_answer(self):
+        self.offline.went_offline()
+        with self.assertRaises(core.OfflineError):
+            core.fetch_movie("Aliens", FakeHttp({}), self.cache, offline=self.offline)
+
+
+class TitleAliasTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(Path(self.dir.name) / "cache.sqlite3")
+        self.http = FakeHttp({"dune": movie("tt15239678", "Dune")})
+        self.http.movies["dune 1984"] = movie("tt0087182", "Dune")
+
+    def tearDown(self):
+        self.cache.close()
+        self.dir.cleanup()
+
+    def test_open_by_id_does_not_answer_title_search(self):
+        core.fetch_movie_by_id("tt0087182", self.http, self.cache)
+        data = core.fetch_movie("Dune", self.http, self.cache)
+        self.assertEqual(data["imdbID"], "tt15239678")
+        self.assertIn("t=Dune", self.http.urls[-1])
+
+    def test_title_search_answers_by_id(self):
+        core.fetch_movie("Dune", self.http, self.cache)
+        core.fetch_movie_by_id("tt15239678", self.http, self.cache)
+        self.assertEqual(len(self.http.urls), 1)
+
+
+class OmdbRequestSpanTest(unittest.TestCase):
+    def setUp(self):
+        recorder.reset()
+        self.http = FakeHttp({"alien": movie("tt0078748", "Alien")})
+
+    def test_json_span_through_scheduler(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scheduler = OmdbScheduler(Path(tmp) / "quota.sqlite3", rate=1000)
+            try:
+                core.omdb_request({"t": "Alien"}, self.http, scheduler.lane(USER))
+            finally:
+                scheduler.close()
+        self.assertEqual(recorder.stats()["json"]["n"], 1)
+
+    def test_json_stage_without_scheduler(self):
+        stages = []
+
+        def stage(name):
+            stages.append(name)
+            return recorder.span(name)
+
+        core.omdb_request({"t": "Alien"}, self.http, stage=stage)
+        self.assertEqual(stages, ["omdb", "json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from history_store import HistoryStore
+
+
+class LegacyImportTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.db = Path(self.dir.name) / "history.sqlite3"
+        self.legacy = Path(self.dir.name) / "search_history.json"
+        self.legacy.write_text(json.dumps(["Inception", "Heat"]), encoding="utf-8")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def open(self):
+        return HistoryStore(self.db, legacy_file=self.legacy)
+
+    def test_imdb_entry_replaces_migrated_title(self):
+        store = self.open()
+        store.add("tt1375666", "inception ", "inception")
+        self.assertEqual([(e.imdb_id, e.title) for e in store.recent()],
+                         [("tt1375666", "inception "), (None, "Heat")])
+        store.close()
+
+        store = self.open()
+        self.assertEqual([(e.imdb_id, e.title) for e in store.recent()],
+                         [("tt1375666", "inception "), (None, "Heat")])
+        store.close()
+
+    def test_unrelated_titles_stay(self):
+        store = self.open()
+        store.add("tt0113277", "Heat 2")
+        self.assertEqual([e.title for e in store.recent()], ["Heat 2", "Inception", "Heat"])
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
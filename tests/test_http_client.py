@@ -0,0 +1,48 @@
+import socket
+import time
+import unittest
+
+import requests
+
+from http_client import HttpClient
+
+
+class SilentServer:
+    """Přijme spojení (backlog jádra), ale nikdy neodpoví"""
+
+    def __enter__(self):
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(16)
+        self.url = "http://127.0.0.1:%d/" % self.sock.getsockname()[1]
+        return self
+
+    def __exit__(self, *exc):
+        self.sock.close()
+
+
+class RetryTest(unittest.TestCase):
+    def test_no_retry_prefix_fails_after_one_timeout(self):
+        with SilentServer() as server:
+            http = HttpClient(no_retry=(server.url,))
+            started = time.monotonic()
+            with self.assertRaises(requests.Timeout):
+                http.get(server.url + "?t=Alien", timeout=0.3)
+            elapsed = time.monotonic() - started
+            stats = http.stats()["127.0.0.1"]
+            http.close()
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(stats["connections"], 1)
+
+    def test_other_urls_keep_retrying(self):
+        with SilentServer() as server:
+            http = HttpClient(retries=2, backoff=0)
+            with self.assertRaises(requests.ConnectionError):
+                http.get(server.url, timeout=0.2)
+            stats = http.stats()["127.0.0.1"]
+            http.close()
+        self.assertEqual(stats["connections"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,15 @@
+import tkinter as tk
+import unittest
+
+
+class ImportTest(unittest.TestCase):
+    def test_import_builds_no_window(self):
+        import main
+
+        self.assertFalse(hasattr(main, "root"))
+        self.assertIsNone(tk._default_root)
+        self.assertTrue(callable(main.main))
+
+
+if __name__ == "__main__":
+    unittest.main()
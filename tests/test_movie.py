@@ -0,0 +1,82 @@
+import unittest
+
+from movie import Movie, na, parse_number, parse_year
+
+INCEPTION = {
+    "Title": "Inception", "Year": "2010", "Rated": "PG-13", "Released": "16 Jul 2010",
+    "Runtime": "148 min", "Genre": "Action, Adventure, Sci-Fi", "Director": "Christopher Nolan",
+    "Writer": "Christopher Nolan", "Actors": "Leonardo DiCaprio", "Plot": "A thief...",
+    "Language": "English, Japanese, French", "Country": "United States, United Kingdom",
+    "Awards": "Won 4 Oscars", "Poster": "https://example.com/inception.jpg",
+    "Ratings": [{"Source": "Internet Movie Database", "Value": "8.8/10"},
+                {"Source": "Rotten Tomatoes", "Value": "87%"}],
+    "Metascore": "74", "imdbRating": "8.8", "imdbVotes": "2,345,678", "imdbID": "tt1375666",
+    "Type": "movie", "BoxOffice": "$292,587,330", "Response": "True",
+}
+
+
+class ParseTest(unittest.TestCase):
+    def test_na(self):
+        self.assertIsNone(na("N/A"))
+        self.assertIsNone(na("  "))
+        self.assertIsNone(na(None))
+        self.assertEqual(na(" Drama "), "Drama")
+
+    def test_parse_number(self):
+        self.assertEqual(parse_number("7.1"), 7.1)
+        self.assertEqual(parse_number("1,234,567"), 1234567)
+        self.assertEqual(parse_number("$292,587,330"), 292587330)
+        self.assertEqual(parse_number("142 min"), 142)
+        self.assertIsInstance(parse_number("8.0"), float)
+        self.assertIsInstance(parse_number("74"), int)
+
+    def test_parse_number_missing_or_invalid(self):
+        for value in ("N/A", "", None, "abc", "nan", "NaN", "inf", "-Infinity"):
+            self.assertIsNone(parse_number(value), value)
+
+    def test_parse_year(self):
+        self.assertEqual(parse_year("2008"), 2008)
+        self.assertEqual(parse_year("2010–2015"), 2010)
+        self.assertEqual(parse_year("2019–"), 2019)
+        self.assertIsNone(parse_year("N/A"))
+        self.assertIsNone(parse_year("19xx"))
+
+
+class MovieTest(unittest.TestCase):
+    def test_from_omdb(self):
+        movie = Movie.from_omdb(INCEPTION)
+        self.assertEqual((movie.imdb_id, movie.title, movie.year_start), ("tt1375666", "Inception", 2010))
+        self.assertEqual((movie.runtime, movie.rating, movie.votes), (148, 8.8, 2345678))
+        self.assertEqual((movie.metascore, movie.box_office), (74, 292587330))
+        self.assertEqual(movie.ratings[1], ("Rotten Tomatoes", "87%"))
+        self.assertIsNone(movie.total_seasons)
+
+    def test_missing_values(self):
+        movie = Movie.from_omdb({"Title": "N/A", "imdbRating": "N/A", "Type": "series", "totalSeasons": "N/A"})
+        self.assertEqual(movie.title, "N/A")
+        self.assertIsNone(movie.imdb_id)
+        self.assertIsNone(movie.rating)
+        self.assertEqual(movie.get("imdbRating"), "N/A")
+        self.assertEqual(movie.ratings, ())
+
+    def test_get_returns_omdb_format(self):
+        movie = Movie.from_omdb(INCEPTION)
+        self.assertEqual(movie.get("Runtime"), "148 min")
+        self.assertEqual(movie.get("imdbVotes"), "2,345,678")
+        self.assertEqual(movie.get("BoxOffice"), "$292,587,330")
+        self.assertEqual(movie.get("Unknown", "-"), "-")
+
+    def test_round_trip(self):
+        movie = Movie.from_omdb(Movie.from_omdb(INCEPTION).to_omdb())
+        self.assertEqual((movie.imdb_id, movie.rating, movie.votes, movie.ratings),
+                         ("tt1375666", 8.8, 2345678, Movie.from_omdb(INCEPTION).ratings))
+
+    def test_repeated_strings_are_shared(self):
+        first = Movie.from_omdb(dict(INCEPTION))
+        second = Movie.from_omdb({key: "".join(value) if isinstance(value, str) else value
+                                  for key, value in INCEPTION.items()})
+        self.assertIs(first.genre, second.genre)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import time
+import unittest
+from io import BytesIO
+
+from PIL import Image
+
+from poster_cache import PosterCache
+
+URL = "https://example.com/poster.jpg"
+
+
+def jpeg(color, size=(300, 444)):
+    buf = BytesIO()
+    Image.new("RGB", size, color).save(buf, "JPEG", quality=85)
+    return buf.getvalue()
+
+
+def noise_jpeg(size=(300, 444)):
+    """Nekomprimovatelný plakát - soubory mají desítky kB"""
+    buf = BytesIO()
+    Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3)).save(buf, "JPEG", quality=85)
+    return buf.getvalue()
+
+
+class FakeServer:
+    """fetch(url, meta) pro PosterCache - ETag podle obsahu, 304 při shodě"""
+
+    def __init__(self, data, max_age=3600):
+        self.data = data
+        self.max_age = max_age
+        self.calls = []
+        self.offline = False
+
+    def etag(self):
+        return f'"{hash(self.data)}"'
+
+    def fetch(self, url, meta):
+        self.calls.append(meta)
+        if self.offline:
+            raise ConnectionError("offline")
+        fresh = {"etag": self.etag(), "expires": time.time() + self.max_age}
+        if meta and meta.get("etag") == self.etag():
+            return None, fresh
+        return self.data, fresh
+
+
+class PosterCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.cache = PosterCache(self.dir.name)
+        self.server = FakeServer(jpeg((200, 30, 30)))
+
+    def test_variants_share_one_download(self):
+        img = self.cache.load(URL, (160, 240), self.server.fetch)
+        self.assertEqual(img.size, (160, 240))
+        self.assertEqual(self.cache.load(URL, (160, 240), self.server.fetch).size, (160, 240))
+        self.assertEqual(self.cache.load(URL, (100, 150), self.server.fetch).size, (100, 150))
+        self.assertEqual(len(self.server.calls), 1)
+        self.assertEqual(self.cache.counters["variant_hits"], 1)
+        self.assertEqual(self.cache.counters["original_hits"], 1)
+        self.assertTrue(self.cache.contains(URL, (100, 150)))
+        self.assertFalse(self.cache.contains(URL, (50, 75)))
+
+    def test_survives_restart(self):
+        self.cache.load(URL, (160, 240), self.server.fetch)
+        reopened = PosterCache(self.dir.name)
+        reopened.load(URL, (160, 240), self.server.fetch)
+        self.assertEqual(len(self.server.calls), 1)
+        self.assertEqual(reopened.counters["variant_hits"], 1)
+
+    def test_stale_entry_revalidates_with_etag(self):
+        self.server.max_age = -1
+        self.cache.load(URL, (160, 240), self.server.fetch)
+        self.cache.load(URL, (160, 240), self.server.fetch)
+        self.assertEqual(self.server.calls[-1]["etag"], self.server.etag())
+        self.assertEqual(self.cache.counters["not_modified"], 1)
+        self.assertEqual(self.cache.counters["variant_hits"], 1)
+
+    def test_changed_poster_replaces_variants(self):
+        self.server.max_age = -1
+        self.cache.load(URL, (160, 240), self.server.fetch)
+        self.server.data = jpeg((30, 30, 200))
+        img = self.cache.load(URL, (160, 240), self.server.fetch)
+        self.assertEqual(self.cache.counters["variant_hits"], 0)
+        red, green, blue = img.convert("RGB").getpixel((80, 120))
+        self.assertGreater(blue, red)
+
+    def test_stale_poster_when_offline(self):
+        self.server.max_age = -1
+        self.cache.load(URL, (160, 240), self.server.fetch)
+        self.server.offline = True
+        self.assertEqual(self.cache.load(URL, (160, 240), self.server.fetch).size, (160, 240))
+        self.assertEqual(self.cache.counters["stale"], 1)
+
+    def test_eviction_keeps_size_limit(self):
+        cache = PosterCache(self.dir.name, max_bytes=600 * 1024)
+        for n in range(6):
+            server = FakeServer(noise_jpeg())
+            cache.load(f"https://example.com/{n}.jpg", (160, 240), server.fetch)
+        stats = cache.stats()
+        self.assertLessEqual(stats["bytes"], 600 * 1024)
+        self.assertEqual(stats["bytes"], sum(f.stat().st_size for f in os.scandir(self.dir.name)))
+        self.assertGreater(stats["evictions"], 0)
+        self.assertTrue(cache.contains("https://example.com/5.jpg", (160, 240)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from types import SimpleNamespace
+
+from ratings import ScoreLoader
+
+
+class ManualWorker:
+    """Worker, jehož úlohy dokončuje test ručně"""
+
+    def __init__(self):
+        self.tasks = []
+        self.cancelled = []
+
+    def submit(self, fn, *args, group=None, on_done=None, on_error=None):
+        self.tasks.append((args, on_done, on_error))
+
+    def cancel(self, group):
+        self.cancelled.append(group)
+
+    def finish(self, result):
+        args, on_done, _ = self.tasks.pop(0)
+        on_done(None, result)
+
+    def fail(self):
+        args, _, on_error = self.tasks.pop(0)
+        on_error(None, RuntimeError("down"))
+
+
+def movie(imdb_id):
+    return SimpleNamespace(imdb_id=imdb_id)
+
+
+class ScoreLoaderTest(unittest.TestCase):
+    def setUp(self):
+        self.worker = ManualWorker()
+        self.scores = []
+        self.loader = ScoreLoader(self.worker, None, lambda imdb_id, score: self.scores.append((imdb_id, score)),
+                                  parallel=2)
+
+    def test_at_most_parallel_jobs(self):
+        for i in range(5):
+            self.loader.request(movie(f"tt{i}"))
+        self.assertEqual(len(self.worker.tasks), 2)
+        self.worker.finish(80)
+        self.assertEqual(len(self.worker.tasks), 2)
+        self.assertEqual(self.scores, [("tt0", 80)])
+
+    def test_error_reports_fallback(self):
+        self.loader.request(movie("tt1"), fallback=55)
+        self.worker.fail()
+        self.assertEqual(self.scores, [("tt1", 55)])
+        self.assertEqual(self.loader.active, 0)
+
+    def test_same_movie_once(self):
+        self.loader.request(movie("tt1"))
+        self.loader.request(movie("tt1"))
+        self.assertEqual(len(self.worker.tasks), 1)
+
+    def test_cancel_resets(self):
+        for i in range(4):
+            self.loader.request(movie(f"tt{i}"))
+        self.loader.cancel()
+        self.assertEqual(self.worker.cancelled, ["scores"])
+        self.worker.tasks.clear()
+        self.loader.request(movie("tt0"))
+        self.assertEqual(len(self.worker.tasks), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
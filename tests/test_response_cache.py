@@ -0,0 +1,102 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import response_cache
+from response_cache import ResponseCache, id_key, query_key
+
+
+def movie(imdb_id):
+    return {"imdbID": imdb_id, "Title": imdb_id, "Response": "True"}
+
+
+NOT_FOUND = {"Response": "False", "Error": "Movie not found!"}
+
+
+class Clock:
+    """Ruční hodiny místo time.time"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = Path(self.dir.name) / "cache.sqlite3"
+        self.clock = Clock()
+        patcher = mock.patch.object(response_cache.time, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def open(self, **kwargs):
+        cache = ResponseCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_hit_from_memory_and_disk(self):
+        cache = self.open()
+        cache.put(movie("tt1"), id_key("tt1"), query_key("alien"))
+        self.assertEqual(cache.get(query_key("alien"))["imdbID"], "tt1")
+        self.assertEqual(cache.counters["memory_hits"], 1)
+        cache.close()
+        self.assertEqual(self.open().get(id_key("tt1"))["imdbID"], "tt1")
+
+    def test_ttl_expires(self):
+        cache = self.open(ttl=60)
+        cache.put(movie("tt1"), id_key("tt1"))
+        self.clock.now += 59
+        self.assertIsNotNone(cache.get(id_key("tt1")))
+        self.clock.now += 2
+        self.assertIsNone(cache.get(id_key("tt1")))
+        self.assertFalse(cache.contains(id_key("tt1")))
+        self.assertEqual(cache.counters["expired"], 1)
+
+    def test_negative_answers_get_shorter_ttl(self):
+        cache = self.open(ttl=3600, negative_ttl=60)
+        cache.put(NOT_FOUND, query_key("nic"))
+        cache.put(movie("tt1"), id_key("tt1"))
+        self.assertEqual(cache.get(query_key("nic")), NOT_FOUND)
+        self.assertEqual(cache.counters["negative_hits"], 1)
+        self.clock.now += 61
+        self.assertIsNone(cache.get(query_key("nic")))
+        self.assertIsNotNone(cache.get(id_key("tt1")))
+
+    def test_stale_returns_expired_row(self):
+        cache = self.open(ttl=60)
+        cache.put(movie("tt1"), id_key("tt1"))
+        self.clock.now += 120
+        self.assertIsNone(cache.get(id_key("tt1")))
+        self.assertEqual(cache.get(id_key("tt1"), stale=True)["imdbID"], "tt1")
+        self.assertEqual(cache.counters["stale_hits"], 1)
+
+    def test_eviction_drops_least_recently_used(self):
+        cache = self.open(max_entries=3)
+        for n in range(1, 4):
+            cache.put(movie(f"tt{n}"), id_key(f"tt{n}"))
+            self.clock.now += 1
+        cache.get(id_key("tt1"))  # answered from memory
+        self.clock.now += 1
+        cache.put(movie("tt4"), id_key("tt4"))
+        keys = {row[0] for row in cache._db.execute("SELECT key FROM responses")}
+        self.assertEqual(keys, {id_key("tt1"), id_key("tt3"), id_key("tt4")})
+        self.assertEqual(cache.counters["evictions"], 1)
+
+    def test_memory_hits_reach_disk_on_close(self):
+        cache = self.open()
+        cache.put(movie("tt1"), id_key("tt1"))
+        self.clock.now += 100
+        cache.get(id_key("tt1"))
+        cache.close()
+        reopened = self.open()
+        accessed = reopened._db.execute("SELECT accessed_at FROM responses").fetchone()[0]
+        self.assertEqual(accessed, self.clock.now)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from scheduler import BATCH, USER, OmdbScheduler, Quota, QuotaExceeded
+
+
+class QuotaTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "quota.sqlite3"
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_two_processes_add_up(self):
+        # Two connections to one file behave like the GUI and batch.py side by side
+        first, second = Quota(self.path, 1000), Quota(self.path, 1000)
+
+        def spend(quota):
+            for _ in range(200):
+                quota.consume()
+
+        threads = [threading.Thread(target=spend, args=(q,)) for q in (first, second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(first.remaining(), 600)
+        self.assertEqual(Quota(self.path, 1000).remaining(), 600)
+        first.close()
+        second.close()
+
+    def test_consume_keeps_reserve(self):
+        quota = Quota(self.path, 3)
+        self.assertTrue(quota.consume(keep=1))
+        self.assertTrue(quota.consume(keep=1))
+        self.assertFalse(quota.consume(keep=1))
+        self.assertTrue(quota.consume())
+        self.assertFalse(quota.consume())
+        quota.close()
+
+    def test_exhaust(self):
+        quota = Quota(self.path, 10)
+        quota.exhaust()
+        self.assertEqual(Quota(self.path, 10).remaining(), 0)
+        quota.close()
+
+
+class SchedulerQuotaTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.scheduler = OmdbScheduler(Path(self.dir.name) / "quota.sqlite3", daily_limit=10, rate=1000, reserve=0.2)
+
+    def tearDown(self):
+        self.scheduler.close()
+        self.dir.cleanup()
+
+    def test_background_leaves_reserve_to_user(self):
+        lane = self.scheduler.lane(BATCH)
+        for i in range(8):
+            lane.request({"t": str(i)}, dict)
+        with self.assertRaises(QuotaExceeded):
+            lane.request({"t": "over"}, dict)
+        self.scheduler.lane(USER).request({"t": "user"}, dict)
+        self.assertEqual(self.scheduler.stats()["quota_used"], 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import tkinter as tk
+import unittest
+from types import SimpleNamespace
+
+from theme import PALETTES, ThemeRegistry
+from views import SeriesView, _TextTag
+
+
+class FakeText:
+    """Náhrada tk.Text bez displeje - pamatuje si vazby a nastavení tagů"""
+
+    def __init__(self, path):
+        self.path = path
+        self.bindings = {}
+        self.tags = {}
+
+    def bind(self, sequence, func, add=None):
+        self.bindings.setdefault(sequence, []).append(func)
+
+    def tag_configure(self, name, **options):
+        self.tags.setdefault(name, {}).update(options)
+
+    def destroy(self):
+        for func in self.bindings.get("<Destroy>", ()):
+            func(SimpleNamespace(widget=self))
+
+    def __str__(self):
+        return self.path
+
+
+class TextTagTest(unittest.TestCase):
+    def test_tag_registers_and_goes_with_its_text(self):
+        theme = ThemeRegistry("dark")
+        text = FakeText(".series.text")
+        theme.register(_TextTag(text, "season"), foreground="ACCENT_BLUE")
+        self.assertEqual(text.tags["season"]["foreground"], PALETTES["dark"]["ACCENT_BLUE"])
+        theme.apply("light")
+        self.assertEqual(text.tags["season"]["foreground"], PALETTES["light"]["ACCENT_BLUE"])
+        text.destroy()
+        self.assertEqual(theme._widgets, {})
+
+    def test_object_without_bind(self):
+        theme = ThemeRegistry("dark")
+        stand_in = SimpleNamespace(configure=lambda **options: None)
+        theme.register(stand_in, bg="BG_PRIMARY")
+        self.assertEqual(len(theme._widgets), 1)
+
+
+class ThemeRegistryTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("no display")
+        self.root.withdraw()
+        self.theme = ThemeRegistry("dark")
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_closed_window_is_released(self):
+        window = self.theme.register(tk.Toplevel(self.root), bg="BG_PRIMARY")
+        self.theme.register(tk.Label(window), fg="TEXT_PRIMARY")
+        kept = self.theme.register(tk.Frame(self.root), bg="BG_SECONDARY")
+        window.destroy()
+        self.assertEqual(list(self.theme._widgets), [str(kept)])
+        self.theme.apply("light")
+        self.assertEqual(kept.cget("bg"), PALETTES["light"]["BG_SECONDARY"])
+
+    def test_series_view_opens_and_releases_tags(self):
+        view = SeriesView(self.root, self.theme, lambda episode: None)
+        self.assertIn(f"{view.text}#season", self.theme._widgets)
+        view.window.destroy()
+        self.assertEqual(self.theme._widgets, {})
+
+    def test_child_destroy_keeps_toplevel(self):
+        window = self.theme.register(tk.Toplevel(self.root), bg="BG_PRIMARY")
+        self.theme.register(tk.Label(window), fg="TEXT_PRIMARY").destroy()
+        self.assertEqual(list(self.theme._widgets), [str(window)])
+
+
+if __name__ == "__main__":
+    unittest.main()
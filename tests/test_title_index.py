@@ -0,0 +1,60 @@
+import unittest
+
+from title_index import TitleIndex
+
+
+def make_index(*entries):
+    index = TitleIndex()
+    for imdb_id, title in entries:
+        index.add(imdb_id, title)
+    return index
+
+
+class LookupTest(unittest.TestCase):
+    def test_exact_match(self):
+        index = make_index(("tt1375666", "Inception"))
+        self.assertEqual(index.lookup("inception"), "tt1375666")
+
+    def test_sequels_are_not_exact_matches(self):
+        index = make_index(("tt0078748", "Alien"), ("tt0114709", "Toy Story"))
+        for query in ("Aliens", "Alien 3", "Toy Story 3", "Toy Story 4"):
+            self.assertIsNone(index.lookup(query), query)
+
+    def test_shared_title_is_ambiguous(self):
+        index = make_index(("tt0087182", "Dune"), ("tt1160419", "Dune"))
+        self.assertIsNone(index.lookup("Dune"))
+        self.assertEqual(index.ids("Dune"), ["tt0087182", "tt1160419"])
+
+    def test_same_film_twice_stays_exact(self):
+        index = make_index(("tt1375666", "Inception"), ("tt1375666", "Inception"))
+        self.assertEqual(index.lookup("Inception"), "tt1375666")
+
+
+class ClosestTest(unittest.TestCase):
+    def test_typo_resolves(self):
+        index = make_index(("tt0111161", "The Shawshank Redemption"))
+        self.assertEqual(index.closest("The Shawshank Redemptoin"), "tt0111161")
+
+    def test_sequels_do_not_resolve_to_the_original(self):
+        index = make_index(("tt0078748", "Alien"), ("tt0114709", "Toy Story"))
+        for query in ("Aliens", "Alien 3", "Toy Story 3", "Toy Story 4"):
+            self.assertIsNone(index.closest(query), query)
+
+    def test_numbered_title_matches_same_number(self):
+        index = make_index(
+            ("tt0926084", "Harry Potter and the Deathly Hallows: Part 1"),
+            ("tt1201607", "Harry Potter and the Deathly Hallows: Part 2"),
+        )
+        self.assertEqual(index.closest("Harry Poter and the Deathly Hallows Part 2"), "tt1201607")
+
+
+class SearchThresholdTest(unittest.TestCase):
+    def test_score_exactly_at_threshold_is_kept(self):
+        index = make_index(("tt1375666", "Inception"))
+        matches = index.search("Inceptoin", threshold=0.6)
+        self.assertEqual([m[1] for m in matches], ["tt1375666"])
+        self.assertAlmostEqual(matches[0][0], 0.6)
+
+
+if __name__ == "__main__":
+    unittest.main()
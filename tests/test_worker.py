@@ -0,0 +1,56 @@
+import time
+import unittest
+
+from worker import Worker
+
+
+class FakeRoot:
+    """Místo Tk: after() si jen zapamatuje naplánované volání"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, interval, func):
+        self.scheduled.append(func)
+
+    def run_next(self):
+        self.scheduled.pop(0)()
+
+
+class PollTest(unittest.TestCase):
+    def setUp(self):
+        self.worker = Worker(max_workers=2)
+
+    def tearDown(self):
+        self.worker.shutdown()
+
+    def wait_for(self, tasks):
+        deadline = time.monotonic() + 5
+        while self.worker._results.qsize() < tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_failing_callback_does_not_drop_other_results(self):
+        done = []
+
+        def broken(task, result):
+            raise RuntimeError("bug in callback")
+
+        self.worker.submit(lambda task: 1, on_done=broken)
+        self.worker.submit(lambda task: 2, on_done=lambda task, result: done.append(result))
+        self.worker.submit(lambda task: 1 / 0, on_error=lambda task, error: done.append(type(error)))
+        self.wait_for(3)
+        with self.assertLogs("worker", "ERROR"):
+            self.worker.poll()
+        self.assertCountEqual(done, [2, ZeroDivisionError])
+
+    def test_tick_keeps_polling_after_error(self):
+        root = FakeRoot()
+        self.worker.attach(root)
+        self.worker.poll = lambda: 1 / 0
+        with self.assertRaises(ZeroDivisionError):
+            root.run_next()
+        self.assertEqual(len(root.scheduled), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
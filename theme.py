@@ -0,0 +1,71 @@
+import tkinter as tk
+
+PALETTES = {
+    "dark": {
+        "BG_PRIMARY": "#0a0e27",
+        "BG_SECONDARY": "#161b35",
+        "BG_TERTIARY": "#1f2847",
+        "TEXT_PRIMARY": "#e8f0ff",
+        "TEXT_SECONDARY": "#a0b9d8",
+        "ACCENT_BLUE": "#00d4ff",
+        "ACCENT_PURPLE": "#bb86fc",
+        "ACCENT_PINK": "#ff4081",
+        "ACCENT_GREEN": "#00e676",
+    },
+    "light": {
+        "BG_PRIMARY": "#f8f9fc",
+        "BG_SECONDARY": "#eff2f8",
+        "BG_TERTIARY": "#ffffff",
+        "TEXT_PRIMARY": "#0f1419",
+        "TEXT_SECONDARY": "#3a4a6a",
+        "ACCENT_BLUE": "#0066dd",
+        "ACCENT_PURPLE": "#8b5cf6",
+        "ACCENT_PINK": "#ec4899",
+        "ACCENT_GREEN": "#059669",
+    },
+}
+
+
+class ThemeRegistry:
+    """Pamatuje si widgety podle barevných rolí a přebarví je jedním průchodem"""
+
+    def __init__(self, name="dark"):
+        self.name = name
+        # Shared dict - updated in place, so holders always see the active palette
+        self.colors = dict(PALETTES[name])
+        self._widgets = {}
+
+    def register(self, widget, **roles):
+        """Nastaví barvy podle rolí (např. bg="BG_SECONDARY") a zapamatuje si je"""
+        widget.configure(**{option: self.colors[role] for option, role in roles.items()})
+        key = str(widget)
+        entry = self._widgets.get(key)
+        if entry is not None and entry[0] is widget:
+            entry[1].update(roles)
+        else:
+            # Closed windows are released right away, not at the next theme switch
+            bind = getattr(widget, "bind", None)
+            if bind is not None:
+                bind("<Destroy>", lambda event: self._forget(key, event), add="+")
+            self._widgets[key] = (widget, dict(roles))
+        return widget
+
+    def _forget(self, key, event):
+        # A toplevel's binding also fires for the destroy of each of its children;
+        # a text tag ("<text>#<tag>") goes away with its text widget
+        if str(event.widget) == key.partition("#")[0]:
+            self._widgets.pop(key, None)
+
+    def apply(self, name):
+        """Přepne paletu a přebarví všechny živé widgety včetně otevřených oken"""
+        self.name = name
+        self.colors.update(PALETTES[name])
+        colors = self.colors
+        dead = []
+        for key, (widget, roles) in self._widgets.items():
+            try:
+                widget.configure(**{option: colors[role] for option, role in roles.items()})
+            except tk.TclError:
+                dead.append(key)
+        for key in dead:
+            del self._widgets[key]
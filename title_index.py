@@ -0,0 +1,155 @@
+import json
+import threading
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from math import ceil
+
+from core import normalize_text
+
+# Float slack for the Dice bounds, so a score exactly at the threshold is never pruned
+EPS = 1e-9
+
+
+def title_key(text):
+    """Normalizovaný klíč názvu - bez diakritiky, malá písmena, bez interpunkce"""
+    text = normalize_text(text).casefold()
+    return " ".join("".join(ch if ch.isalnum() else " " for ch in text).split())
+
+
+def numbers(key):
+    """Číselné tokeny názvu ('toy story 3' -> ('3',)) - pokračování se liší jen v nich"""
+    return tuple(token for token in key.split() if token.isdigit())
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TitleIndex:
+    """Index všech dohledaných názvů: přesná shoda přes dict, překlepy přes trigramy"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._ids = []
+        self._titles = []
+        self._keys = []
+        self._gram_counts = array("H")
+        self._by_key = {}
+        self._by_id = {}
+        self._postings = defaultdict(lambda: array("I"))
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def load(self):
+        """Načte uložené záznamy (JSONL: [imdbID, název])"""
+        if self.path is None or not self.path.exists():
+            return self
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    imdb_id, title = json.loads(line)
+                except ValueError:
+                    continue
+                with self._lock:
+                    self._add(imdb_id, title)
+        return self
+
+    def add(self, imdb_id, title):
+        if not imdb_id or not title:
+            return
+        with self._lock:
+            if not self._add(imdb_id, title):
+                return
+            if self.path is not None:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps([imdb_id, title], ensure_ascii=False) + "\n")
+
+    def lookup(self, text):
+        """imdbID přesné shody klíče; None, když název nezná nebo ho má víc filmů ('Dune')"""
+        key = title_key(text)
+        with self._lock:
+            ids = {self._ids[doc] for doc in self._by_key.get(key, ())}
+        return ids.pop() if len(ids) == 1 else None
+
+    def ids(self, text):
+        """Všechna imdbID pod přesně stejným klíčem názvu"""
+        key = title_key(text)
+        with self._lock:
+            return list(dict.fromkeys(self._ids[doc] for doc in self._by_key.get(key, ())))
+
+    def closest(self, text, threshold=0.8):
+        """imdbID podobného názvu (překlep) nebo None - jen jako náhrada, když OMDb nic nenajde
+
+        Kandidát musí mít stejné číselné tokeny, takže 'Toy Story 3' nikdy nevrátí 'Toy Story'.
+        """
+        key = title_key(text)
+        wanted = numbers(key)
+        for score, imdb_id, title in self.search(text, limit=10, threshold=threshold):
+            if numbers(title_key(title)) == wanted:
+                return imdb_id
+        return None
+
+    def search(self, text, limit=10, threshold=0.5):
+        """Seřazené shody (skóre, imdbID, název) podle Dice koeficientu trigramů"""
+        key = title_key(text)
+        grams = trigrams(key)
+        if not key:
+            return []
+        n = len(grams)
+        # Dice >= threshold bounds both the shared trigrams and the candidate's size
+        needed = max(1, ceil(threshold * n / 2 - EPS))
+        min_size = threshold * n / (2 - threshold) - EPS
+        max_size = n * (2 - threshold) / threshold + EPS
+        with self._lock:
+            lists = sorted((self._postings[g] for g in grams if g in self._postings), key=len)
+            # Every match must appear in one of the (n - needed + 1) rarest posting lists;
+            # trigrams nobody has are empty lists at the front of that order
+            split = n - needed + 1 - (n - len(lists))
+            if split <= 0:
+                return []
+            counts = defaultdict(int)
+            for postings in lists[:split]:
+                for doc in postings:
+                    counts[doc] += 1
+
+            sizes = self._gram_counts
+            remaining = len(lists) - split
+            scored = []
+            for doc, shared in counts.items():
+                size = sizes[doc]
+                if size < min_size or size > max_size:
+                    continue
+                if shared + remaining < threshold * (n + size) / 2 - EPS:
+                    continue
+                for postings in lists[split:]:
+                    i = bisect_left(postings, doc)
+                    if i < len(postings) and postings[i] == doc:
+                        shared += 1
+                score = 2 * shared / (n + size)
+                if score >= threshold - EPS:
+                    scored.append((score, self._ids[doc], self._titles[doc]))
+        scored.sort(key=lambda m: m[0], reverse=True)
+        return scored[:limit]
+
+    def _add(self, imdb_id, title):
+        key = title_key(title)
+        doc = self._by_id.get(imdb_id)
+        if doc is not None and self._keys[doc] == key:
+            return False
+        doc = len(self._ids)
+        self._ids.append(imdb_id)
+        self._titles.append(title)
+        self._keys.append(key)
+        self._by_id[imdb_id] = doc
+        # Remakes and namesakes share a key, so every film is kept under it
+        self._by_key.setdefault(key, []).append(doc)
+        grams = trigrams(key)
+        self._gram_counts.append(min(len(grams), 0xFFFF))
+        postings = self._postings
+        for gram in grams:
+            postings[gram].append(doc)
+        return True
@@ -0,0 +1,535 @@
+import tkinter as tk
+from tkinter import filedialog, scrolledtext
+from collections import OrderedDict
+
+from core import rating_color_role
+
+CARD_HEIGHT = 200
+CARD_GAP = 24
+ROW_HEIGHT = CARD_HEIGHT + CARD_GAP
+HEADER_HEIGHT = 72
+OVERSCAN = 2
+
+
+class HistoryList:
+    """Panel historie - řádky se vytvoří jednou a pak se jen přepisují přes config()"""
+
+    def __init__(self, frame, theme, on_select):
+        self.frame = frame
+        self.theme = theme
+        self.on_select = on_select
+        self.rows = []
+        self.entries = []
+        self.header = theme.register(tk.Label(frame, text="📜 Historie:", font=("Segoe UI", 10, "bold")), fg="ACCENT_BLUE", bg="BG_SECONDARY")
+        self.header.pack(anchor="w", padx=10, pady=(5, 5))
+
+    def update(self, entries):
+        for i, item in enumerate(entries):
+            if i == len(self.rows):
+                self.rows.append(self._make_row())
+                self.entries.append(None)
+            if self.entries[i] == item:
+                continue
+            title = item.title
+            self.rows[i].config(
+                text=f"• {title[:25]}{'...' if len(title) > 25 else ''}",
+                command=lambda m=item: self.on_select(m),
+            )
+            if self.entries[i] is None:
+                self.rows[i].pack(fill='x', padx=8, pady=2)
+            self.entries[i] = item
+        for i in range(len(entries), len(self.rows)):
+            if self.entries[i] is not None:
+                self.rows[i].pack_forget()
+                self.entries[i] = None
+
+    def _make_row(self):
+        return self.theme.register(
+            tk.Button(
+                self.frame,
+                font=("Segoe UI", 9),
+                activeforeground="white",
+                relief="flat",
+                bd=0,
+                highlightthickness=0,
+                anchor="w",
+            ),
+            bg="BG_TERTIARY",
+            fg="TEXT_PRIMARY",
+            activebackground="ACCENT_BLUE",
+        )
+
+
+class ComparisonCard:
+    """Karta filmu v porovnání - widgety vzniknou jednou, bind() je jen přepíše"""
+
+    def __init__(self, parent, theme):
+        self.theme = theme
+        self.movie = None
+        self.idx = None
+        self.poster_url = None
+
+        self.card = theme.register(tk.Frame(parent, relief="flat", bd=1), bg="BG_TERTIARY")
+
+        # Main container for horizontal layout
+        main_container = theme.register(tk.Frame(self.card), bg="BG_TERTIARY")
+        main_container.pack(fill='both', expand=True, padx=14, pady=14)
+
+        # Left side - Poster
+        poster_side = theme.register(tk.Frame(main_container, relief="flat", bd=0), bg="BG_SECONDARY")
+        poster_side.pack(side='left', padx=(0, 16), pady=0)
+        self.poster_display = theme.register(tk.Label(poster_side, text="Bez\nplakátu", font=("Segoe UI", 9), width=12, height=10), bg="BG_SECONDARY", fg="TEXT_SECONDARY")
+        self.poster_display.pack()
+
+        # Right side - Info
+        info_side = theme.register(tk.Frame(main_container), bg="BG_TERTIARY")
+        info_side.pack(side='left', fill='both', expand=True)
+
+        top_section = theme.register(tk.Frame(info_side), bg="BG_TERTIARY")
+        top_section.pack(fill='x', pady=(0, 10))
+        self.title_label = theme.register(tk.Label(top_section, font=("Segoe UI", 13, "bold"), wraplength=600, justify="left"), fg="ACCENT_BLUE", bg="BG_TERTIARY")
+        self.title_label.pack(anchor="w")
+        self.meta_label = theme.register(tk.Label(top_section, font=("Segoe UI", 9)), fg="TEXT_SECONDARY", bg="BG_TERTIARY")
+        self.meta_label.pack(anchor="w", pady=(2, 0))
+
+        # Rating section with progress bar
+        rating_section = theme.register(tk.Frame(info_side), bg="BG_TERTIARY")
+        rating_section.pack(fill='x', pady=(0, 10))
+        rating_label_frame = theme.register(tk.Frame(rating_section), bg="BG_TERTIARY")
+        rating_label_frame.pack(anchor="w")
+        theme.register(tk.Label(rating_label_frame, text="IMDb:", font=("Segoe UI", 10, "bold")), fg="TEXT_SECONDARY", bg="BG_TERTIARY").pack(side='left')
+        self.rating_label = theme.register(tk.Label(rating_label_frame, font=("Segoe UI", 11, "bold")), bg="BG_TERTIARY")
+        self.rating_label.pack(side='left')
+        self.percentage_label = theme.register(tk.Label(rating_label_frame, font=("Segoe UI", 10)), bg="BG_TERTIARY")
+        self.percentage_label.pack(side='left', padx=(4, 0))
+        self.score_label = theme.register(tk.Label(rating_label_frame, font=("Segoe UI", 10, "bold")), fg="ACCENT_PURPLE", bg="BG_TERTIARY")
+        self.score_label.pack(side='left', padx=(16, 0))
+
+        self.progress_frame = theme.register(tk.Frame(rating_section, height=8), bg="BG_SECONDARY")
+        self.progress_frame.pack(fill='x', pady=(6, 0))
+        self.bar = tk.Frame(self.progress_frame, height=8)
+
+        # Info section
+        info_section = theme.register(tk.Frame(info_side), bg="BG_TERTIARY")
+        info_section.pack(fill='x', pady=(0, 0))
+        genre_frame = theme.register(tk.Frame(info_section), bg="BG_TERTIARY")
+        genre_frame.pack(anchor="w")
+        theme.register(tk.Label(genre_frame, text="🎭", font=("Segoe UI", 9)), fg="TEXT_SECONDARY", bg="BG_TERTIARY").pack(side='left')
+        self.genre_label = theme.register(tk.Label(genre_frame, font=("Segoe UI", 9), justify="left"), fg="TEXT_SECONDARY", bg="BG_TERTIARY")
+        self.genre_label.pack(side='left', anchor="w")
+        director_frame = theme.register(tk.Frame(info_section), bg="BG_TERTIARY")
+        director_frame.pack(anchor="w", pady=(2, 0))
+        theme.register(tk.Label(director_frame, text="📽️", font=("Segoe UI", 9)), fg="TEXT_SECONDARY", bg="BG_TERTIARY").pack(side='left')
+        self.director_label = theme.register(tk.Label(director_frame, font=("Segoe UI", 9), justify="left"), fg="TEXT_SECONDARY", bg="BG_TERTIARY")
+        self.director_label.pack(side='left', anchor="w")
+
+    def bind(self, idx, movie, rating):
+        """Přepíše kartu na jiný film (rating je už převedené číslo, NaN = chybí)"""
+        if movie is self.movie and idx == self.idx:
+            return False
+        self.idx = idx
+        self.movie = movie
+
+        percentage = int(rating * 10) if rating == rating else 0
+        rating_role = rating_color_role(rating)
+
+        self.title_label.config(text=f"{idx}. {movie.title}")
+        self.meta_label.config(text=f"{movie.get('Year')} • {movie.get('Type').upper()} • {movie.get('Runtime')}")
+        self.rating_label.config(text=f"  {movie.get('imdbRating')}/10")
+        self.percentage_label.config(text=f"  ({percentage}%)")
+        self.theme.register(self.rating_label, fg=rating_role)
+        self.theme.register(self.percentage_label, fg=rating_role)
+        if percentage > 0:
+            self.theme.register(self.bar, bg=rating_role)
+            self.bar.place(x=0, y=0, width=int(percentage * 3.5), height=8)  # Scale to fit
+        else:
+            self.bar.place_forget()
+        self.genre_label.config(text=movie.get('Genre'))
+        self.director_label.config(text=f"Režie: {movie.get('Director')}")
+
+        self.score_label.config(text="")
+        self.poster_url = movie.poster
+        self.poster_display.config(image='', text="Načítám..." if self.poster_url else "Bez\nplakátu", width=12, height=10)
+        self.poster_display.image = None
+        return True
+
+    def set_score(self, imdb_id, aggregate):
+        """Souhrnné skóre ze všech zdrojů hodnocení (aggregate z ratings.RatingsAggregator)"""
+        if self.movie is None or imdb_id != self.movie.imdb_id:
+            return
+        if aggregate is None or aggregate.score is None:
+            self.score_label.config(text="")
+        else:
+            sources = len(aggregate.ratings)
+            self.score_label.config(text=f"Skóre {aggregate.score}/100 ({sources} {'zdroj' if sources == 1 else 'zdroje' if sources < 5 else 'zdrojů'})")
+
+    def set_poster(self, poster_url, photo):
+        if poster_url != self.poster_url:
+            return
+        if photo is None:
+            self.poster_display.config(image='', text="Bez\nplakátu", width=12, height=10)
+        else:
+            self.poster_display.config(image=photo, text='', width=100, height=150)
+        self.poster_display.image = photo
+
+
+class ComparisonView:
+    """Okno porovnání s virtualizovaným seznamem - widgety jen pro viditelné řádky"""
+
+    def __init__(self, root, theme, request_poster, request_score=None, max_posters=200):
+        self.theme = theme
+        self.request_poster = request_poster
+        self.request_score = request_score
+        self.scores = {}
+        self.pending_scores = set()
+        self.table = None
+        self.order = []
+        self.free_cards = []
+        self.rows = {}
+        self.posters = OrderedDict()
+        self.pending_posters = set()
+        self.max_posters = max_posters
+
+        self.window = tk.Toplevel(root)
+        self.window.title("⚖️ Porovnání filmů/seriálů")
+        self.window.geometry("1100x700")
+        theme.register(self.window, bg="BG_PRIMARY")
+
+        self.canvas = theme.register(tk.Canvas(self.window, highlightthickness=0), bg="BG_PRIMARY")
+        self.scrollbar = tk.Scrollbar(self.window, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.bind("<Configure>", lambda e: self._render(resize=True))
+        # Bound on the Toplevel so the wheel also works over the cards
+        self.window.bind("<MouseWheel>", self._on_wheel)
+        self.window.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.window.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+        self.canvas.configure(yscrollincrement=ROW_HEIGHT // 4)
+
+        # Header
+        self.header = theme.register(tk.Frame(self.canvas), bg="BG_PRIMARY")
+        self.header_title = theme.register(tk.Label(self.header, text="⚖️ Porovnání", font=("Segoe UI", 18, "bold")), fg="ACCENT_BLUE", bg="BG_PRIMARY")
+        self.header_title.pack(side='left')
+        self.header_count = theme.register(tk.Label(self.header, font=("Segoe UI", 11)), fg="TEXT_SECONDARY", bg="BG_PRIMARY")
+        self.header_count.pack(side='left', padx=(10, 0))
+        self.header_stats = theme.register(tk.Label(self.header, font=("Segoe UI", 10)), fg="TEXT_SECONDARY", bg="BG_PRIMARY")
+        self.header_stats.pack(side='left', padx=(20, 0))
+        self.canvas.create_window((20, 20), window=self.header, anchor="nw")
+
+    def exists(self):
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def show(self, table):
+        """Zobrazí MovieTable seřazenou podle hodnocení (bez hodnocení na konci)"""
+        self.table = table
+        self.order = table.sort("rating")
+        self.header_count.config(text=f"({len(self.order)} film/seriál)")
+        self.header_stats.config(text=self._stats_text(table))
+        self.canvas.configure(scrollregion=(0, 0, 0, HEADER_HEIGHT + len(self.order) * ROW_HEIGHT))
+        for row in list(self.rows):
+            self._release(row)
+        for card, _ in self.free_cards:
+            card.movie = None
+        self._render()
+        self.window.deiconify()
+        self.window.lift()
+
+    @staticmethod
+    def _stats_text(table):
+        overall = table.summary("rating")
+        if not overall.count:
+            return ""
+        parts = [f"Průměr {overall.mean:.1f}/10"]
+        genres = table.group_stats("genre", min_count=2)
+        if genres:
+            parts.append(f"Nejlepší žánr: {genres[0].label} ({genres[0].mean:.1f})")
+        directors = table.group_stats("director", min_count=2)
+        if directors:
+            parts.append(f"Režie: {directors[0].label} ({directors[0].mean:.1f})")
+        return " · ".join(parts)
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._render()
+
+    def _on_wheel(self, event):
+        self.canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+
+    def _render(self, resize=False):
+        """Přiřadí recyklované karty jen řádkům, které jsou (skoro) vidět"""
+        height = max(self.canvas.winfo_height(), 1)
+        width = max(self.canvas.winfo_width(), 200)
+        top = self.canvas.canvasy(0)
+        first = max(int((top - HEADER_HEIGHT) // ROW_HEIGHT) - OVERSCAN, 0)
+        last = min(int((top + height - HEADER_HEIGHT) // ROW_HEIGHT) + OVERSCAN, len(self.order) - 1)
+        visible = range(first, last + 1)
+
+        # Release cards whose rows scrolled away
+        for row in list(self.rows):
+            if row not in visible:
+                self._release(row)
+
+        for row in visible:
+            if row in self.rows:
+                if resize:
+                    self.canvas.itemconfigure(self.rows[row][1], width=width - 30)
+                continue
+            if self.free_cards:
+                card, item = self.free_cards.pop()
+                self.canvas.coords(item, 15, HEADER_HEIGHT + row * ROW_HEIGHT)
+                self.canvas.itemconfigure(item, state="normal", width=width - 30)
+            else:
+                card = ComparisonCard(self.canvas, self.theme)
+                item = self.canvas.create_window(15, HEADER_HEIGHT + row * ROW_HEIGHT, window=card.card, anchor="nw", width=width - 30, height=CARD_HEIGHT)
+            self.rows[row] = (card, item)
+            record = self.order[row]
+            if card.bind(row + 1, self.table.records[record], self.table.numeric["rating"][record]):
+                self._attach_poster(card)
+                self._attach_score(card)
+
+    def _release(self, row):
+        card, item = self.rows.pop(row)
+        self.canvas.itemconfigure(item, state="hidden")
+        self.free_cards.append((card, item))
+
+    def _attach_poster(self, card):
+        url = card.poster_url
+        if url is None:
+            return
+        if url in self.posters:
+            self.posters.move_to_end(url)
+            card.set_poster(url, self.posters[url])
+        elif url not in self.pending_posters:
+            self.pending_posters.add(url)
+            self.request_poster(url)
+
+    def _attach_score(self, card):
+        imdb_id = card.movie.imdb_id
+        if imdb_id in self.scores:
+            card.set_score(imdb_id, self.scores[imdb_id])
+        elif self.request_score is not None and imdb_id not in self.pending_scores:
+            self.pending_scores.add(imdb_id)
+            self.request_score(card.movie)
+
+    def score_ready(self, imdb_id, aggregate, final=True):
+        """Zavolá main s (částečným) souhrnem hodnocení; final uvolní čekání na zdroje"""
+        if final:
+            self.pending_scores.discard(imdb_id)
+            self.scores[imdb_id] = aggregate
+        for card, _ in self.rows.values():
+            card.set_score(imdb_id, aggregate)
+
+    def poster_preview(self, url, photo):
+        """Hrubý náhled, než worker dodá hotový plakát - do cache se neukládá"""
+        for card, _ in self.rows.values():
+            card.set_poster(url, photo)
+
+    def poster_ready(self, url, photo):
+        """Zavolá main, když worker dodá plakát (photo je None při chybě)"""
+        self.pending_posters.discard(url)
+        if photo is not None:
+            self.posters[url] = photo
+            while len(self.posters) > self.max_posters:
+                self.posters.popitem(last=False)
+        for card, _ in self.rows.values():
+            card.set_poster(url, photo)
+
+
+class _TextTag:
+    """Tag v tk.Text, který jde zaregistrovat do ThemeRegistry jako widget"""
+
+    def __init__(self, text, name):
+        self.text = text
+        self.name = name
+
+    def configure(self, **options):
+        self.text.tag_configure(self.name, **options)
+
+    def bind(self, sequence, func, add=None):
+        """Události tagu jsou události jeho Text widgetu (hlavně <Destroy>)"""
+        return self.text.bind(sequence, func, add)
+
+    def __str__(self):
+        return f"{self.text}#{self.name}"
+
+
+class SeriesView:
+    """Okno seriálu - sezóny se vykreslují postupně, jak dorazí"""
+
+    RATING_ROLES = ("ACCENT_GREEN", "ACCENT_BLUE", "ACCENT_PURPLE", "ACCENT_PINK", "TEXT_SECONDARY")
+
+    def __init__(self, root, theme, on_episode):
+        self.theme = theme
+        self.on_episode = on_episode
+        self.total_seasons = 0
+        self.episodes = {}
+
+        self.window = tk.Toplevel(root)
+        self.window.title("📺 Sezóny a epizody")
+        self.window.geometry("900x700")
+        theme.register(self.window, bg="BG_PRIMARY")
+
+        self.title_label = theme.register(tk.Label(self.window, font=("Segoe UI", 18, "bold"), anchor="w"), fg="ACCENT_BLUE", bg="BG_PRIMARY")
+        self.title_label.pack(fill='x', padx=20, pady=(20, 4))
+        self.summary_label = theme.register(tk.Label(self.window, font=("Segoe UI", 10), anchor="w", justify="left"), fg="TEXT_SECONDARY", bg="BG_PRIMARY")
+        self.summary_label.pack(fill='x', padx=20, pady=(0, 12))
+
+        self.text = theme.register(scrolledtext.ScrolledText(self.window, font=("Consolas", 10), wrap='none', relief="flat", bd=0, cursor="arrow"), fg="TEXT_PRIMARY", bg="BG_TERTIARY")
+        self.text.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+        self.text.config(state='disabled')
+
+        theme.register(_TextTag(self.text, "season"), foreground="ACCENT_BLUE")
+        self.text.tag_configure("season", font=("Segoe UI", 12, "bold"), spacing1=10, spacing3=4)
+        theme.register(_TextTag(self.text, "muted"), foreground="TEXT_SECONDARY")
+        for role in self.RATING_ROLES:
+            theme.register(_TextTag(self.text, role), foreground=role)
+        self.text.tag_bind("episode", "<Double-Button-1>", self._on_double_click)
+
+    def exists(self):
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def start(self, title, total_seasons):
+        """Připraví prázdné místo pro každou sezónu - ty pak dorazí v libovolném pořadí"""
+        self.total_seasons = total_seasons
+        self.episodes = {}
+        self.title_label.config(text=f"📺 {title}")
+        self.summary_label.config(text=f"Načítám {total_seasons} sezón...")
+        self.text.config(state='normal')
+        self.text.delete('1.0', 'end')
+        for mark in [m for m in self.text.mark_names() if m.startswith("season")]:
+            self.text.mark_unset(mark)
+        for number in range(1, total_seasons + 1):
+            mark = f"season{number}"
+            self.text.mark_set(mark, 'end-1c')
+            self.text.mark_gravity(mark, 'left')
+            self.text.insert('end-1c', f"Sezóna {number} · načítám...\n", ("season",))
+        self.text.config(state='disabled')
+        self.window.deiconify()
+        self.window.lift()
+
+    def show_season(self, number, summary, episodes):
+        lines = [(f"Sezóna {number} · {summary['episodes']} epizod · průměr {self._average(summary)}\n", ("season",))]
+        for episode in episodes:
+            rating = episode.get('imdbRating', 'N/A')
+            imdb_id = episode.get('imdbID', '')
+            self.episodes[imdb_id] = episode
+            tags = ("episode", f"ep:{imdb_id}", rating_color_role(rating))
+            lines.append((
+                f"  E{episode.get('Episode', '?'):>3}  {episode.get('Title', 'N/A')[:60]:<60}  ⭐ {rating:>4}  {episode.get('Released', '')}\n",
+                tags,
+            ))
+        self._replace(number, lines)
+
+    def season_failed(self, number, message):
+        self._replace(number, [
+            (f"Sezóna {number}\n", ("season",)),
+            (f"  {message}\n", ("muted",)),
+        ])
+
+    def show_summary(self, totals):
+        parts = [f"{totals['seasons']}/{self.total_seasons} sezón", f"{totals['episodes']} epizod", f"průměr {self._average(totals)}"]
+        if totals["runtime"]:
+            parts.append(f"celkem ~{totals['runtime'] // 60} h {totals['runtime'] % 60} min")
+        text = " · ".join(parts)
+        for label, key in (("🏆 Nejlepší", "best"), ("👎 Nejhorší", "worst")):
+            if totals[key] is not None:
+                rating, season, episode = totals[key]
+                text += f"\n{label}: S{season}E{episode.get('Episode', '?')} {episode.get('Title', 'N/A')} ({rating:.1f})"
+        self.summary_label.config(text=text)
+
+    @staticmethod
+    def _average(summary):
+        return f"{summary['average']:.2f}" if summary["average"] is not None else "N/A"
+
+    def _replace(self, number, lines):
+        start = f"season{number}"
+        end = f"season{number + 1}" if number < self.total_seasons else 'end-1c'
+        self.text.config(state='normal')
+        self.text.delete(start, end)
+        # The next season's mark moves along with the inserted lines
+        if end != 'end-1c':
+            self.text.mark_gravity(end, 'right')
+        for line, tags in lines:
+            self.text.insert(end, line, tags)
+        if end != 'end-1c':
+            self.text.mark_gravity(end, 'left')
+        self.text.config(state='disabled')
+
+    def _on_double_click(self, event):
+        index = self.text.index(f"@{event.x},{event.y}")
+        for tag in self.text.tag_names(index):
+            if tag.startswith("ep:") and tag[3:] in self.episodes:
+                self.on_episode(self.episodes[tag[3:]])
+                return
+
+
+class DiagnosticsPanel:
+    """Panel diagnostiky - p50/p95 jednotlivých fází a počítadla cache, obnovuje se každou sekundu"""
+
+    def __init__(self, root, theme, recorder, counters, interval=1000):
+        self.recorder = recorder
+        self.counters = counters
+        self.interval = interval
+
+        self.window = tk.Toplevel(root)
+        self.window.title("📊 Diagnostika")
+        self.window.geometry("620x560")
+        theme.register(self.window, bg="BG_PRIMARY")
+
+        toolbar = theme.register(tk.Frame(self.window), bg="BG_PRIMARY")
+        toolbar.pack(fill='x', padx=16, pady=(16, 8))
+        theme.register(tk.Label(toolbar, text="📊 Výkon", font=("Segoe UI", 14, "bold")), fg="ACCENT_BLUE", bg="BG_PRIMARY").pack(side='left')
+        for text, command in (("Vynulovat", self._reset), ("Exportovat trace", self._export)):
+            theme.register(
+                tk.Button(toolbar, text=text, font=("Segoe UI", 9), relief="flat", bd=0, padx=10, pady=4, highlightthickness=0, command=command),
+                bg="BG_TERTIARY", fg="TEXT_PRIMARY", activebackground="ACCENT_BLUE",
+            ).pack(side='right', padx=(6, 0))
+
+        self.text = theme.register(tk.Text(self.window, font=("Consolas", 10), wrap='none', relief="flat", bd=0), fg="TEXT_PRIMARY", bg="BG_TERTIARY")
+        self.text.pack(fill='both', expand=True, padx=16, pady=(0, 16))
+        self.text.config(state='disabled')
+        self._tick()
+
+    def exists(self):
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _tick(self):
+        if not self.exists():
+            return
+        self._render()
+        self.window.after(self.interval, self._tick)
+
+    def _render(self):
+        lines = [f"{'Fáze':<24}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for name, s in sorted(self.recorder.stats().items()):
+            lines.append(f"{name:<24}{s['n']:>6}{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['max_ms']:>10.1f}")
+        for section, values in self.counters().items():
+            lines.append("")
+            lines.append(section)
+            lines.extend(f"  {key:<22}{value:>10}" for key, value in values.items())
+        self.text.config(state='normal')
+        self.text.delete('1.0', 'end')
+        self.text.insert('1.0', "\n".join(lines))
+        self.text.config(state='disabled')
+
+    def _reset(self):
+        self.recorder.reset()
+        self._render()
+
+    def _export(self):
+        path = filedialog.asksaveasfilename(
+            parent=self.window, title="Uložit trace", defaultextension=".json",
+            initialfile="movieviewer-trace.json", filetypes=[("Chrome trace", "*.json")],
+        )
+        if path:
+            self.recorder.export_chrome_trace(path)
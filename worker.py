@@ -0,0 +1,148 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from perf import recorder
+
+log = logging.getLogger(__name__)
+
+
+class Cancelled(Exception):
+    """Úloha byla zrušena novějším požadavkem"""
+
+
+_PROGRESS = object()
+
+
+class Task:
+    """Úloha běžící na pozadí - umí se zrušit a měří čas jednotlivých fází"""
+
+    def __init__(self, group, on_done=None, on_error=None, on_progress=None, report=None):
+        self.group = group
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self._report = report
+        self.timings = {}
+        self.created = time.perf_counter()
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        if self._cancelled.is_set():
+            raise Cancelled()
+
+    def progress(self, value):
+        """Mezivýsledek (např. náhled plakátu) - on_progress ho dostane v Tk vlákně před výsledkem"""
+        if self.on_progress is not None and self._report is not None and not self.cancelled:
+            self._report((self, value, _PROGRESS))
+
+    @contextmanager
+    def stage(self, name):
+        """Změří dobu fáze v ms a před i po ní zkontroluje zrušení"""
+        self.check()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.timings[name] = duration * 1000
+            recorder.record(name, start, duration, group=self.group)
+        self.check()
+
+
+class Worker:
+    """Pool vláken pro síť a dekódování obrázků; výsledky předává Tk přes frontu"""
+
+    def __init__(self, max_workers=4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="movieviewer")
+        self._results = queue.Queue()
+        self._groups = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, group=None, supersede=False, on_done=None, on_error=None, on_progress=None):
+        """Spustí fn(task, *args) na pozadí; supersede zruší starší úlohy ze stejné skupiny"""
+        task = Task(group, on_done, on_error, on_progress, self._results.put)
+        with self._lock:
+            if supersede:
+                for old in self._groups.get(group, ()):
+                    old.cancel()
+            self._groups.setdefault(group, set()).add(task)
+        self._executor.submit(self._run, task, fn, args)
+        return task
+
+    def cancel(self, group):
+        with self._lock:
+            for task in self._groups.get(group, ()):
+                task.cancel()
+
+    def busy(self, group):
+        with self._lock:
+            return any(not t.cancelled for t in self._groups.get(group, ()))
+
+    def _run(self, task, fn, args):
+        start = time.perf_counter()
+        try:
+            task.check()
+            result = fn(task, *args)
+        except Cancelled:
+            pass
+        except Exception as e:
+            self._results.put((task, None, e))
+        else:
+            self._results.put((task, result, None))
+        finally:
+            recorder.record(f"task {task.group}", start, time.perf_counter() - start, cancelled=task.cancelled)
+            with self._lock:
+                self._groups.get(task.group, set()).discard(task)
+
+    def poll(self):
+        """Zpracuje hotové výsledky - volat jen z hlavního (Tk) vlákna"""
+        while True:
+            try:
+                task, result, error = self._results.get_nowait()
+            except queue.Empty:
+                return
+            if task.cancelled:
+                continue
+            # One broken callback must not drop the results queued behind it
+            try:
+                if error is _PROGRESS:
+                    task.on_progress(task, result)
+                elif error is not None:
+                    if task.on_error:
+                        task.on_error(task, error)
+                elif task.on_done:
+                    task.on_done(task, result)
+            except Exception:
+                recorder.count("callback errors")
+                log.exception("Callback of a %s task failed", task.group)
+
+    def attach(self, root, interval=30):
+        """Pravidelně vybírá frontu výsledků přes root.after"""
+        def tick():
+            try:
+                self.poll()
+            finally:
+                root.after(interval, tick)
+        root.after(interval, tick)
+
+    def shutdown(self):
+        with self._lock:
+            for tasks in self._groups.values():
+                for task in tasks:
+                    task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def format_timings(timings):
+    return " · ".join(f"{name} {ms:.0f} ms" for name, ms in timings.items())